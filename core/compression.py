@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Compression для Dynamic Messe Stand V4
+Прозоре стиснення JSON/YAML: кодек за розширенням при записі, за magic-байтами при читанні
+"""
+
+import io
+import os
+import gzip
+import lzma
+from contextlib import contextmanager
+from core.config import config
+
+try:
+    import zstandard
+except ImportError:  # Необов'язкова залежність - тоді лише gzip/xz зі stdlib
+    zstandard = None
+
+# Розширення -> кодек
+EXTENSIONS = {'.gz': 'gzip', '.xz': 'xz', '.zst': 'zstd'}
+
+# Magic-байти -> кодек (розпізнавання не залежить від імені файлу)
+MAGIC = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+)
+MAGIC_LENGTH = max(len(magic) for magic, _ in MAGIC)
+
+def available_codecs():
+    """Кодеки, доступні в цьому середовищі"""
+    return [codec for codec in ('zstd', 'gzip', 'xz') if codec != 'zstd' or zstandard is not None]
+
+def default_codec():
+    """zstd, якщо встановлено, інакше gzip"""
+    return 'zstd' if zstandard is not None else 'gzip'
+
+def extension_for(codec):
+    """Розширення для кодека; 'auto' - найкращий доступний, None/'' - без стиснення"""
+    if not codec:
+        return ''
+    if codec == 'auto':
+        codec = default_codec()
+    for ext, name in EXTENSIONS.items():
+        if name == codec:
+            return ext
+    raise ValueError(f"Невідомий кодек: {codec}")
+
+def codec_for_path(path):
+    """Кодек за розширенням (x.json.gz -> 'gzip') або None"""
+    return EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+def split_extension(path):
+    """('x.json', 'gzip') для 'x.json.gz'; без стиснення - (path, None)"""
+    root, ext = os.path.splitext(path)
+    codec = EXTENSIONS.get(ext.lower())
+    return (root, codec) if codec else (path, None)
+
+def base_extension(path):
+    """Розширення формату даних без розширення стиснення: 'x.yaml.xz' -> '.yaml'"""
+    return os.path.splitext(split_extension(path)[0])[1].lower()
+
+def detect(head):
+    """Кодек за першими байтами файлу або None (нестиснений)"""
+    for magic, codec in MAGIC:
+        if head.startswith(magic):
+            return codec
+    return None
+
+def _level(codec, level):
+    if level is not None:
+        return level
+    return config.storage.get('compression_levels', {}).get(codec)
+
+def open_writer(fileobj, codec, level=None):
+    """Потік, що стискає в fileobj (fileobj після close() лишається відкритим)"""
+    level = _level(codec, level)
+    if codec == 'gzip':
+        # mtime=0: однаковий вміст - однакові байти (жорсткі посилання в знімках)
+        return gzip.GzipFile(fileobj=fileobj, mode='wb', compresslevel=6 if level is None else level, mtime=0)
+    if codec == 'xz':
+        return lzma.LZMAFile(fileobj, 'wb', preset=level)
+    if codec == 'zstd':
+        if zstandard is None:
+            raise ValueError("zstd недоступний: пакет 'zstandard' не встановлено")
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.stream_writer(fileobj, closefd=False)
+    raise ValueError(f"Невідомий кодек: {codec}")
+
+def open_reader(fileobj, codec):
+    """Потік, що розпаковує з fileobj"""
+    if codec == 'gzip':
+        return gzip.GzipFile(fileobj=fileobj, mode='rb')
+    if codec == 'xz':
+        return lzma.LZMAFile(fileobj, 'rb')
+    if codec == 'zstd':
+        if zstandard is None:
+            raise ValueError("zstd недоступний: пакет 'zstandard' не встановлено")
+        return zstandard.ZstdDecompressor().stream_reader(fileobj, read_across_frames=True, closefd=False)
+    raise ValueError(f"Невідомий кодек: {codec}")
+
+@contextmanager
+def open_text(path, mode='r', codec=None, level=None):
+    """Текстовий потік UTF-8 з прозорим стисненням.
+
+    'w': кодек з аргументу або за розширенням шляху; дані стискаються потоково,
+         без повної копії тексту в пам'яті.
+    'r': кодек розпізнається за magic-байтами, розширення не має значення.
+    """
+    if mode not in ('r', 'w'):
+        raise ValueError(f"Непідтримуваний режим: {mode}")
+
+    with open(path, mode + 'b') as raw:
+        if mode == 'w':
+            codec = codec or codec_for_path(path)
+        else:
+            codec = detect(raw.peek(MAGIC_LENGTH)[:MAGIC_LENGTH])
+
+        if codec is None:
+            stream = raw
+        else:
+            stream = open_writer(raw, codec, level) if mode == 'w' else open_reader(raw, codec)
+
+        text = io.TextIOWrapper(stream, encoding='utf-8')
+        try:
+            yield text
+            text.flush()
+        finally:
+            text.detach()  # raw закриває with, кодек - нижче
+            if stream is not raw:
+                stream.close()
+
+def compress_into(write, codec, level=None):
+    """Серіалізація одразу в стиснений буфер: write(text_stream) -> стиснені байти"""
+    buffer = io.BytesIO()
+    stream = open_writer(buffer, codec, level)
+    text = io.TextIOWrapper(stream, encoding='utf-8')
+    try:
+        write(text)
+        text.flush()
+    finally:
+        text.detach()
+        stream.close()
+    return buffer.getvalue()
+
+def decompress(payload):
+    """Розпаковує байти з автоматичним розпізнаванням; нестиснені повертає без змін"""
+    codec = detect(payload[:MAGIC_LENGTH])
+    if codec is None:
+        return payload
+    with open_reader(io.BytesIO(payload), codec) as stream:
+        return stream.read()
@@ -20,8 +20,20 @@ class Config:
             'esp32_2_port': '/dev/ttyUSB1',  # ESP32.2 (Addon)
             'esp32_3_port': '/dev/ttyUSB2',  # ESP32.3 (Addon)
             'giga_port': '/dev/ttyACM0',     # Arduino GIGA
+            'udp_target_ip': '192.168.1.100',  # Ziel für GIGA UDP-Signale
             'baud_rate': 115200,
-            'timeout': 1
+            'timeout': 1,
+            'reader_mode': 'blocking',  # 'blocking' (ereignisgesteuert) oder 'poll' (10 ms Polling)
+            'telemetry_capacity': 4096, # Ringpuffer-Zeilen pro Gerät (älteste werden überschrieben)
+            'protocol': 'text',         # 'text' oder 'binary' (CRC-Frames, pro Gerät ausgehandelt)
+            'protocol_timeout': 1.0,    # Sekunden für die Protokoll-Aushandlung
+            'backend': 'threads',       # 'threads' (ein Lese-Thread pro Port) oder 'asyncio' (ein Eventloop)
+            'connect_deadline': 3.0,    # Sekunden, die connect_all() höchstens wartet
+            'connect_workers': 8,       # Parallele Verbindungsversuche
+            'disconnect_timeout': 2.0,  # Sekunden, die disconnect_all() auf laufende Verbindungsversuche wartet
+            'supervisor_interval': 0.5, # Prüfintervall für Auto-Reconnect
+            'reconnect_min_delay': 1.0, # Backoff-Start (Sekunden)
+            'reconnect_max_delay': 30.0 # Backoff-Obergrenze (Sekunden)
         }
         
         # GUI-Konfiguration
@@ -45,7 +57,42 @@ class Config:
         self.content = {
             'slides_per_page': 10,
             'auto_save_interval': 30,  # Sekunden
-            'demo_slide_duration': 5   # Sekunden
+            'demo_slide_duration': 5,  # Sekunden
+            'observer_window_ms': 0,   # Sammelfenster des Observer-Bus (0 = nächster Tk-Idle-Zyklus)
+            'journal_compact_entries': 500,  # Journal-Einträge bis zur Kompaktierung in den Snapshot
+            'journal_fsync': True,     # Jeden Journal-Eintrag auf die Platte zwingen (absturzsicher)
+            'lazy_max_slides': 64,     # Unveränderte Slides eines Containers im Speicher (LRU)
+            'lazy_cache_mb': 64,       # Byte-Budget dieser Slides (Record-Größe inkl. Bilddaten)
+            'migrate_inline_images': True,  # Base64-Bilder beim Laden in den Blob-Store (content/blobs) verschieben
+            'asset_index_watch': True,  # Asset-Index per inotify aktuell halten (falls verfügbar)
+            'asset_rescan_interval': 5.0  # Ohne inotify: mtime-Abgleich höchstens alle N Sekunden
+        }
+        
+        # Speicher-Konfiguration (StorageManager)
+        self.storage = {
+            'write_behind': True,  # save_*/export_* im Hintergrund-Thread schreiben (pro Pfad zusammengefasst)
+            'fsync': True,         # Vor dem atomaren Umbenennen auf die Platte zwingen
+            'backup_keep': 10,     # Anzahl aufbewahrter Snapshots in exports/ (ältere werden gelöscht)
+            'data_dir': None,      # Laufzeitdaten (Index, Journal, Thumbnails, Blobs); None: data/ im Projekt
+            # Kompressionsstufen für *.gz / *.xz / *.zst (Kiosk-Speicher: Ladezeit vor maximaler Kompression)
+            'compression_levels': {'gzip': 6, 'xz': 6, 'zstd': 3},
+            'presentation_compression': None  # Standard für neue Präsentationsdateien: None, 'auto', 'zstd', 'gzip', 'xz'
+        }
+        
+        # Logging-Konfiguration (BertrandtLogger)
+        self.logging = {
+            'queue': True,        # Handler-I/O im Listener-Thread statt im aufrufenden Thread
+            'queue_size': 10000,  # Maximale Anzahl wartender Log-Einträge
+            'overflow': 'drop',   # Volle Queue: 'drop' verwirft DEBUG/INFO (WARNING+ wartet), 'block' wartet immer
+            'put_timeout': 1.0,   # Maximale Wartezeit (s) auf Platz in der Queue, danach verworfen
+            'log_dir': None       # Verzeichnis der Log-Dateien (None: logs/ im Projekt)
+        }
+        
+        # Cache-Konfiguration
+        self.cache = {
+            'image_cache_mb': 64,  # Byte-Budget für dekodierte/skalierte Bilder
+            'thumbnail_cache_mb': 128,  # Byte-Budget der Vorschaubilder auf Disk (data/thumbnails)
+            'thumbnail_workers': 2      # Hintergrund-Threads für die Thumbnail-Erzeugung
         }
 
 # Globale Konfigurationsinstanz
@@ -5,15 +5,100 @@ Logger System для Dynamic Messe Stand V4
 """
 
 import logging
+import logging.handlers
 import os
+import queue
+import atexit
+import threading
 from datetime import datetime
+from core.config import config
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler з обмеженою чергою.
+    
+    overflow='drop': при повній черзі DEBUG/INFO відкидаються (лічильник dropped),
+    WARNING і вище чекають на місце. overflow='block': чекають усі записи.
+    Очікування обмежене put_timeout - записи, що не влізли, теж рахуються в dropped.
+    Без listener (ще не запущений або вже зупинений) записи йдуть напряму у fallback_handlers.
+    """
+    
+    def __init__(self, log_queue, overflow='drop', fallback_handlers=(), put_timeout=1.0):
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.fallback_handlers = list(fallback_handlers)
+        self.put_timeout = put_timeout
+        self.listener = None
+        self.dropped = 0
+        self._reported = 0
+    
+    def prepare(self, record):
+        # Лише те, що потрібно для передачі між потоками; форматування робить listener
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def enqueue(self, record):
+        if self.listener is None and self.fallback_handlers:
+            # Після shutdown чергу ніхто не читає - не чекати на неї
+            self.handle_directly(record)
+            return
+        if self.dropped != self._reported:
+            self._report_dropped(record)
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow == 'drop' and record.levelno < logging.WARNING:
+                self.dropped += 1
+                return
+            try:
+                self.queue.put(record, timeout=self.put_timeout)
+            except queue.Full:
+                # Listener зупинився під час очікування - записати напряму, інакше відкинути
+                if self.listener is None and self.fallback_handlers:
+                    self.handle_directly(record)
+                else:
+                    self.dropped += 1
+    
+    def handle_directly(self, record):
+        """Синхронний запис через fallback_handlers (як QueueListener.handle)"""
+        for handler in self.fallback_handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+    
+    def _report_dropped(self, record):
+        """Повідомлення про відкинуті записи, щойно в черзі знову є місце"""
+        dropped = self.dropped
+        notice = logging.LogRecord(record.name, logging.WARNING, __file__, 0,
+                                   f"Log queue full - {dropped - self._reported} records dropped", None, None)
+        try:
+            self.queue.put_nowait(notice)
+            self._reported = dropped
+        except queue.Full:
+            pass
+
+class BlockingQueueListener(logging.handlers.QueueListener):
+    """QueueListener, чий stop() не падає на повній черзі"""
+    
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
 
 class BertrandtLogger:
     """Кастомний логер для Bertrandt Dynamic Messe Stand"""
     
-    def __init__(self, name="DynamicMesseStand", level=logging.INFO):
+    def __init__(self, name="DynamicMesseStand", level=logging.INFO, use_queue=None, log_dir=None):
         self.logger = logging.getLogger(name)
+        self.log_dir = (log_dir or config.logging.get('log_dir')
+                        or os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs"))
         self.logger.setLevel(level)
+        self.use_queue = config.logging['queue'] if use_queue is None else use_queue
+        self.handlers = []
+        self.queue_handler = None
+        self.listener = None
+        self._lock = threading.Lock()
         
         # Видалити існуючі handlers щоб уникнути дублікатів
         if self.logger.handlers:
@@ -29,10 +114,9 @@ class BertrandtLogger:
         console_handler.setLevel(logging.INFO)
         
         # File handler
-        log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
-        os.makedirs(log_dir, exist_ok=True)
+        os.makedirs(self.log_dir, exist_ok=True)
         
-        log_file = os.path.join(log_dir, f"dynamic_messe_stand_{datetime.now().strftime('%Y%m%d')}.log")
+        log_file = os.path.join(self.log_dir, f"dynamic_messe_stand_{datetime.now().strftime('%Y%m%d')}.log")
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
         
@@ -45,9 +129,72 @@ class BertrandtLogger:
         console_handler.setFormatter(formatter)
         file_handler.setFormatter(formatter)
         
-        # Додати handlers
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+        self.handlers = [console_handler, file_handler]
+        
+        if not self.use_queue:
+            # Додати handlers
+            for handler in self.handlers:
+                self.logger.addHandler(handler)
+            return
+        
+        # Виклики logger.* лише ставлять запис у чергу; I/O і locks handlers - у потоці listener
+        log_queue = queue.Queue(maxsize=config.logging['queue_size'])
+        self.queue_handler = BoundedQueueHandler(
+            log_queue, config.logging['overflow'], fallback_handlers=self.handlers,
+            put_timeout=config.logging.get('put_timeout', 1.0)
+        )
+        self.listener = BlockingQueueListener(log_queue, *self.handlers, respect_handler_level=True)
+        self.listener.start()
+        self.queue_handler.listener = self.listener
+        self.logger.addHandler(self.queue_handler)
+        atexit.register(self.shutdown)
+    
+    def flush(self, timeout=None):
+        """Чекає, доки listener запише всі записи з черги. False, якщо timeout сплив"""
+        if self.queue_handler is not None:
+            log_queue = self.queue_handler.queue
+            with log_queue.all_tasks_done:
+                if not log_queue.all_tasks_done.wait_for(lambda: not log_queue.unfinished_tasks, timeout):
+                    return False
+        for handler in self.handlers:
+            handler.flush()
+        return True
+    
+    def shutdown(self):
+        """Дописує чергу, зупиняє listener і повертає синхронні handlers (для пізніх записів)"""
+        with self._lock:
+            listener, self.listener = self.listener, None
+            if listener is None:
+                return
+            # Нові записи одразу напряму - enqueue більше не чекає на чергу, яку ніхто не читає
+            self.queue_handler.listener = None
+            listener.stop()  # Обробляє все, що вже в черзі
+            self.logger.removeHandler(self.queue_handler)
+            for handler in self.handlers:
+                self.logger.addHandler(handler)
+            
+            # Записи, що потрапили в чергу вже після sentinel
+            log_queue = self.queue_handler.queue
+            while True:
+                try:
+                    record = log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                log_queue.task_done()  # flush() чекає на unfinished_tasks
+                if record is not listener._sentinel:
+                    self.queue_handler.handle_directly(record)
+            for handler in self.handlers:
+                handler.flush()
+    
+    def get_stats(self):
+        if self.queue_handler is None:
+            return {'mode': 'sync'}
+        return {
+            'mode': 'queue',
+            'queued': self.queue_handler.queue.qsize(),
+            'dropped': self.queue_handler.dropped,
+            'running': self.listener is not None
+        }
     
     def debug(self, message):
         """Debug level logging"""
@@ -5,18 +5,44 @@ Storage Manager для Dynamic Messe Stand V4
 """
 
 import os
+import sys
 import json
-import yaml
+import stat
+import shutil
+import argparse
+import tempfile
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from core import compression, yaml_io
+from core.config import config
 from core.logger import logger
 
+BACKUP_PREFIX = "backup_"
+PARTIAL_SUFFIX = ".partial"
+BACKUP_EXCLUDE = {"thumbnails"}  # Кеші, які можна згенерувати заново
+
+# umask процесу один раз під час імпорту (os.umask лише читати неможливо, а змінювати у потоках небезпечно)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 class StorageManager:
     """Менеджер для роботи з файловою системою"""
     
-    def __init__(self):
+    def __init__(self, write_behind=None, fsync=None):
         self.base_dir = os.path.dirname(os.path.dirname(__file__))
-        self.data_dir = os.path.join(self.base_dir, "data")
+        self.data_dir = config.storage.get('data_dir') or os.path.join(self.base_dir, "data")
         self.exports_dir = os.path.join(self.base_dir, "exports")
+        self.write_behind = config.storage['write_behind'] if write_behind is None else write_behind
+        self.fsync = config.storage['fsync'] if fsync is None else fsync
+        
+        # Write-behind: шлях -> (формат, байти); для кожного шляху лише останній запис
+        self._pending = OrderedDict()
+        self._in_flight = None  # (шлях, формат, байти), що зараз пишеться
+        self._condition = threading.Condition()
+        self._writer = None
+        self.stats = {'queued': 0, 'coalesced': 0, 'written': 0, 'failed': 0}
+        self.last_backup_stats = None
         self.ensure_directories()
     
     def ensure_directories(self):
@@ -36,9 +62,7 @@ class StorageManager:
                 directory = self.data_dir
             
             filepath = os.path.join(directory, filename)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write(filepath, 'json', self._dump_json(data, compression.codec_for_path(filepath)))
             
             logger.debug(f"Data saved to JSON: {filepath}")
             return filepath
@@ -57,10 +81,15 @@ class StorageManager:
             
             filepath = os.path.join(directory, filename)
             
+            # Ще не записані дані читати з черги (read-your-writes)
+            pending = self._pending_payload(filepath)
+            if pending is not None:
+                return json.loads(compression.decompress(pending))
+            
             if not os.path.exists(filepath):
                 return None
             
-            with open(filepath, 'r', encoding='utf-8') as f:
+            with compression.open_text(filepath) as f:
                 data = json.load(f)
             
             logger.debug(f"Data loaded from JSON: {filepath}")
@@ -80,9 +109,7 @@ class StorageManager:
                 directory = self.data_dir
             
             filepath = os.path.join(directory, filename)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True, indent=2)
+            self._write(filepath, 'yaml', self._dump_yaml(data, compression.codec_for_path(filepath)))
             
             logger.debug(f"Data saved to YAML: {filepath}")
             return filepath
@@ -101,11 +128,15 @@ class StorageManager:
             
             filepath = os.path.join(directory, filename)
             
+            pending = self._pending_payload(filepath)
+            if pending is not None:
+                return yaml_io.load(compression.decompress(pending))
+            
             if not os.path.exists(filepath):
                 return None
             
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            with compression.open_text(filepath) as f:
+                data = yaml_io.load(f)
             
             logger.debug(f"Data loaded from YAML: {filepath}")
             return data
@@ -118,9 +149,7 @@ class StorageManager:
         """Експортує дані у JSON файл в exports директорії"""
         try:
             filepath = os.path.join(self.exports_dir, filename)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write(filepath, 'json', self._dump_json(data, compression.codec_for_path(filepath)))
             
             logger.info(f"Data exported to JSON: {filepath}")
             return filepath
@@ -133,9 +162,7 @@ class StorageManager:
         """Експортує дані у YAML файл в exports директорії"""
         try:
             filepath = os.path.join(self.exports_dir, filename)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True, indent=2)
+            self._write(filepath, 'yaml', self._dump_yaml(data, compression.codec_for_path(filepath)))
             
             logger.info(f"Data exported to YAML: {filepath}")
             return filepath
@@ -152,7 +179,7 @@ class StorageManager:
             directory = self.data_dir
         
         filepath = os.path.join(directory, filename)
-        return os.path.exists(filepath)
+        return self._pending_payload(filepath) is not None or os.path.exists(filepath)
     
     def delete_file(self, filename, subdirectory=None):
         """Видаляє файл"""
@@ -163,13 +190,14 @@ class StorageManager:
                 directory = self.data_dir
             
             filepath = os.path.join(directory, filename)
+            discarded = self._discard_pending(filepath)
             
             if os.path.exists(filepath):
                 os.remove(filepath)
                 logger.debug(f"File deleted: {filepath}")
                 return True
             
-            return False
+            return discarded
             
         except Exception as e:
             logger.error(f"Error deleting file: {e}")
@@ -225,23 +253,305 @@ class StorageManager:
             return None
     
     def backup_data(self):
-        """Створює резервну копію всіх даних"""
+        """Створює інкрементальний знімок data/ (незмінені файли - hard link на попередній знімок)"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_dir = os.path.join(self.exports_dir, f"backup_{timestamp}")
-            os.makedirs(backup_dir, exist_ok=True)
-            
-            # Копіювати всі файли з data директорії
-            import shutil
-            if os.path.exists(self.data_dir):
-                shutil.copytree(self.data_dir, os.path.join(backup_dir, "data"))
-            
-            logger.info(f"Backup created: {backup_dir}")
+            self.flush()  # Резервна копія лише з повністю записаними файлами
+            backup_dir = self._create_snapshot()
+            self.prune_backups()
             return backup_dir
             
         except Exception as e:
             logger.error(f"Error creating backup: {e}")
             return None
+    
+    def list_backups(self):
+        """Повертає назви завершених знімків, від найстарішого до найновішого"""
+        if not os.path.exists(self.exports_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.exports_dir)
+            if name.startswith(BACKUP_PREFIX) and not name.endswith(PARTIAL_SUFFIX)
+            and os.path.isdir(os.path.join(self.exports_dir, name, "data"))
+        )
+    
+    def prune_backups(self, keep=None):
+        """Політика зберігання: лишає keep найновіших знімків, видаляє старші та незавершені"""
+        keep = config.storage['backup_keep'] if keep is None else keep
+        removed = 0
+        try:
+            for name in os.listdir(self.exports_dir):
+                if name.startswith(BACKUP_PREFIX) and name.endswith(PARTIAL_SUFFIX):
+                    shutil.rmtree(os.path.join(self.exports_dir, name), ignore_errors=True)
+            
+            backups = self.list_backups()
+            for name in backups[:max(0, len(backups) - keep)]:
+                # Видаляються лише посилання - файли, спільні з новішими знімками, лишаються
+                shutil.rmtree(os.path.join(self.exports_dir, name))
+                removed += 1
+                logger.debug(f"Backup pruned: {name}")
+        except Exception as e:
+            logger.error(f"Error pruning backups: {e}")
+        return removed
+    
+    def restore_backup(self, name=None):
+        """Відновлює data/ зі знімка (None = найновіший).
+        
+        Перед відновленням поточний стан зберігається як окремий знімок.
+        Файли копіюються (не лінкуються), щоб подальші зміни не торкались знімків.
+        Призначено для зупиненої програми (python -m core.storage restore).
+        """
+        try:
+            backups = self.list_backups()
+            name = name or (backups[-1] if backups else None)
+            if name not in backups:
+                logger.error(f"Backup not found: {name}")
+                return False
+            
+            source = os.path.join(self.exports_dir, name, "data")
+            self.flush()
+            safety = self._create_snapshot()
+            logger.info(f"Current data saved before restore: {safety}")
+            
+            restored = set()
+            for root, dirs, files in os.walk(source):
+                relative = os.path.relpath(root, source)
+                target_dir = os.path.normpath(os.path.join(self.data_dir, relative))
+                os.makedirs(target_dir, exist_ok=True)
+                for filename in files:
+                    target = os.path.join(target_dir, filename)
+                    self._copy_atomic(os.path.join(root, filename), target)
+                    restored.add(target)
+            
+            # Файли, яких не було в знімку, прибрати
+            for root, dirs, files in os.walk(self.data_dir):
+                dirs[:] = [d for d in dirs if d not in BACKUP_EXCLUDE]
+                for filename in files:
+                    filepath = os.path.join(root, filename)
+                    if filepath not in restored:
+                        os.remove(filepath)
+            
+            logger.info(f"Backup restored: {name} ({len(restored)} files)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error restoring backup: {e}")
+            return False
+    
+    def _create_snapshot(self):
+        """Будує знімок у тимчасовій директорії і атомарно перейменовує його"""
+        backups = self.list_backups()
+        previous = os.path.join(self.exports_dir, backups[-1], "data") if backups else None
+        
+        # Назви мають зростати (сортування = хронологія), навіть у межах однієї секунди
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if backups and f"{BACKUP_PREFIX}{timestamp}" < backups[-1]:
+            timestamp = backups[-1][len(BACKUP_PREFIX):][:15]  # Годинник переведено назад
+        name = f"{BACKUP_PREFIX}{timestamp}"
+        suffix = 1
+        while os.path.exists(os.path.join(self.exports_dir, name)) or (backups and name <= backups[-1]):
+            suffix += 1
+            name = f"{BACKUP_PREFIX}{timestamp}_{suffix:03d}"
+        
+        backup_dir = os.path.join(self.exports_dir, name)
+        partial_dir = backup_dir + PARTIAL_SUFFIX
+        stats = {'linked': 0, 'copied': 0}
+        
+        for root, dirs, files in os.walk(self.data_dir):
+            dirs[:] = [d for d in dirs if d not in BACKUP_EXCLUDE]
+            relative = os.path.relpath(root, self.data_dir)
+            target_dir = os.path.normpath(os.path.join(partial_dir, "data", relative))
+            os.makedirs(target_dir, exist_ok=True)
+            
+            for filename in files:
+                if filename.startswith('.tmp_') or filename.endswith('.tmp'):
+                    continue  # Незавершені атомарні записи
+                source = os.path.join(root, filename)
+                target = os.path.join(target_dir, filename)
+                candidate = os.path.normpath(os.path.join(previous, relative, filename)) if previous else None
+                if candidate and self._unchanged(source, candidate):
+                    try:
+                        os.link(candidate, target)
+                        stats['linked'] += 1
+                        continue
+                    except OSError:
+                        pass  # Файлова система без hard links - звичайна копія
+                shutil.copy2(source, target)
+                stats['copied'] += 1
+        
+        os.makedirs(os.path.join(partial_dir, "data"), exist_ok=True)
+        os.replace(partial_dir, backup_dir)
+        logger.info(f"Backup created: {backup_dir} ({stats['copied']} copied, {stats['linked']} linked)")
+        self.last_backup_stats = stats
+        return backup_dir
+    
+    def _unchanged(self, source, candidate):
+        """Незмінений файл: однаковий розмір і mtime (copy2 переносить mtime у знімок)"""
+        try:
+            source_stat = os.stat(source)
+            candidate_stat = os.stat(candidate)
+        except OSError:
+            return False
+        return (source_stat.st_size == candidate_stat.st_size
+                and source_stat.st_mtime_ns == candidate_stat.st_mtime_ns)
+    
+    def _copy_atomic(self, source, target):
+        directory = os.path.dirname(target)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_')
+        os.close(fd)
+        try:
+            shutil.copy2(source, temp_path)
+            os.replace(temp_path, target)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    # ------------------------------------------
+    # Атомарний запис і write-behind
+    # ------------------------------------------
+    
+    def _dump_json(self, data, codec=None):
+        # Серіалізація на потоці виклику - знімок даних, які викликач може далі змінювати
+        if codec:
+            # Потоково в компресор: у черзі лише стиснені байти, без повної копії тексту
+            return compression.compress_into(
+                lambda f: json.dump(data, f, indent=2, ensure_ascii=False), codec
+            )
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    def _dump_yaml(self, data, codec=None):
+        if codec:
+            return compression.compress_into(
+                lambda f: yaml_io.dump(data, f), codec
+            )
+        return yaml_io.dump(data).encode('utf-8')
+    
+    def _write(self, filepath, fmt, payload):
+        """Записує одразу або ставить у чергу фонового writer'а (останній запис на шлях перемагає)"""
+        if not self.write_behind:
+            self._write_atomic(filepath, payload)
+            return
+        
+        with self._condition:
+            if filepath in self._pending:
+                self.stats['coalesced'] += 1
+                del self._pending[filepath]  # Новий запис стає в кінець черги
+            self._pending[filepath] = (fmt, payload)
+            self.stats['queued'] += 1
+            self._condition.notify_all()
+        self._ensure_writer()
+    
+    def _write_atomic(self, filepath, payload):
+        """Тимчасовий файл у тій самій директорії, fsync, потім os.replace - без обрізаних файлів"""
+        directory = os.path.dirname(filepath) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            # mkstemp створює файл з правами 0600 - права існуючого файлу або звичайні за umask
+            try:
+                mode = stat.S_IMODE(os.stat(filepath).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, filepath)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        
+        if self.fsync and hasattr(os, 'O_DIRECTORY'):
+            # Перейменування теж має пережити збій живлення (POSIX)
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+    
+    def _ensure_writer(self):
+        with self._condition:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._writer_loop, name="StorageWriter", daemon=True)
+                self._writer.start()
+    
+    def _writer_loop(self):
+        """Фоновий writer: бере найстаріший шлях з черги і записує його атомарно"""
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                filepath, (fmt, payload) = self._pending.popitem(last=False)
+                self._in_flight = (filepath, fmt, payload)
+            
+            written = False
+            try:
+                self._write_atomic(filepath, payload)
+                written = True
+            except Exception as e:
+                logger.error(f"Error writing {filepath}: {e}")
+            finally:
+                with self._condition:
+                    # Статистика під тим самим lock, що й get_stats()/flush()
+                    self.stats['written' if written else 'failed'] += 1
+                    self._in_flight = None
+                    self._condition.notify_all()
+    
+    def _pending_payload(self, filepath):
+        """Байти ще не записаного файлу (черга або запис, що триває) або None"""
+        with self._condition:
+            entry = self._pending.get(filepath)
+            if entry is not None:
+                return entry[1]
+            if self._in_flight and self._in_flight[0] == filepath:
+                return self._in_flight[2]
+        return None
+    
+    def _discard_pending(self, filepath):
+        """Скасовує запис у черзі та чекає завершення поточного запису цього шляху"""
+        with self._condition:
+            discarded = self._pending.pop(filepath, None) is not None
+            while self._in_flight and self._in_flight[0] == filepath:
+                self._condition.wait()
+        return discarded
+    
+    def flush(self, timeout=None):
+        """Бар'єр: чекає, доки всі поставлені в чергу записи будуть на диску.
+        
+        Повертає False, якщо timeout сплив раніше.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and self._in_flight is None, timeout=timeout
+            )
+    
+    def get_stats(self):
+        with self._condition:
+            return dict(self.stats, pending=len(self._pending))
 
 # Глобальна інстанція storage manager
 storage_manager = StorageManager()
+
+def main():
+    """Командний рядок для знімків: python -m core.storage backup|list|restore [назва]"""
+    parser = argparse.ArgumentParser(description='Інкрементальні знімки директорії data/')
+    parser.add_argument('command', choices=['backup', 'list', 'restore', 'prune'])
+    parser.add_argument('name', nargs='?', help='Назва знімка для restore (за замовчуванням найновіший)')
+    args = parser.parse_args()
+    
+    if args.command == 'backup':
+        print(storage_manager.backup_data())
+    elif args.command == 'list':
+        for name in storage_manager.list_backups():
+            print(name)
+    elif args.command == 'restore':
+        return 0 if storage_manager.restore_backup(args.name) else 1
+    else:
+        print(storage_manager.prune_backups())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
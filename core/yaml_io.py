@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+YAML I/O для Dynamic Messe Stand V4
+Швидкий шлях через libyaml (CSafeLoader/CSafeDumper) з прозорим fallback на чистий Python
+"""
+
+import yaml
+from core.logger import logger
+
+# C-реалізації є лише, якщо PyYAML зібрано з libyaml
+LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+BACKEND = 'libyaml' if LOADER is not yaml.SafeLoader else 'python'
+
+# Формат, який проєкт завжди використовував для YAML-файлів
+DUMP_OPTIONS = {'default_flow_style': False, 'allow_unicode': True, 'indent': 2}
+
+if BACKEND == 'python':
+    logger.debug("libyaml not available - using pure-Python YAML loader/dumper")
+
+def load(stream):
+    """Як yaml.safe_load: рядок, байти або потік"""
+    return yaml.load(stream, Loader=LOADER)
+
+def dump(data, stream=None, **options):
+    """Як yaml.dump з опціями проєкту, але лише безпечні типи (без python/*-тегів).
+
+    Без stream повертає рядок.
+    """
+    return yaml.dump(data, stream, Dumper=DUMPER, **dict(DUMP_OPTIONS, **options))
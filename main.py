@@ -13,7 +13,7 @@ from core.config import config
 from models.hardware import hardware_manager
 
 def setup_hardware():
-    """Initialisiert Hardware-Verbindungen"""
+    """Initialisiert Hardware-Verbindungen (nicht blockierend)"""
     logger.info("🔌 Hardware-Setup wird gestartet...")
     
     try:
@@ -25,15 +25,17 @@ def setup_hardware():
         # Arduino GIGA hinzufügen
         giga = hardware_manager.add_giga(config.hardware['giga_port'])
         
-        # Verbindungen herstellen
-        results = hardware_manager.connect_all()
+        # Statuswechsel loggen, sobald sie eintreten
+        def log_status(device, status):
+            status_text = "✅ Verbunden" if status == "connected" else f"❌ {status}"
+            logger.info(f"{device}: {status_text}")
         
-        # Ergebnisse loggen
-        for device, success in results.items():
-            status = "✅ Verbunden" if success else "❌ Fehler"
-            logger.info(f"{device}: {status}")
+        hardware_manager.add_status_listener(log_status)
         
-        return any(results.values())  # True wenn mindestens eine Verbindung erfolgreich
+        # Verbindungen im Hintergrund herstellen und bei Abbruch neu verbinden -
+        # die GUI startet sofort, fehlende Geräte werden mit Backoff erneut versucht
+        hardware_manager.start_supervisor()
+        return True
         
     except Exception as e:
         logger.error(f"Fehler beim Hardware-Setup: {e}")
@@ -98,6 +100,7 @@ def main():
     parser.add_argument('--no-hardware', action='store_true', help='Ohne Hardware-Verbindungen starten')
     parser.add_argument('--debug', action='store_true', help='Debug-Modus aktivieren')
     parser.add_argument('--text-mode', action='store_true', help='Textmodus ohne GUI starten')
+    parser.add_argument('--simulate', action='store_true', help='Simulierte Boards (PTY) statt echter Hardware')
     
     args = parser.parse_args()
     
@@ -110,12 +113,23 @@ def main():
     logger.info(f"Python Version: {sys.version}")
     logger.info(f"Arbeitsverzeichnis: {os.getcwd()}")
     
+    device_simulator = None  # Erst nach erfolgreichem Import gesetzt - finally darf nicht daran scheitern
+    
     try:
+        # Simulierte Boards: Ports in der Konfiguration auf die PTYs umbiegen
+        if args.simulate:
+            from models.hardware_sim import device_simulator
+            config.hardware.update(device_simulator.start_default(chatter_rate=1.0))
+        
+        # Gespeicherten Content aus Snapshot + Journal wiederherstellen
+        from models.content import content_manager
+        content_manager.enable_journal()
+        
         # Hardware-Setup (falls gewünscht)
         if not args.no_hardware:
             hardware_success = setup_hardware()
             if not hardware_success:
-                logger.warning("⚠️ Keine Hardware-Verbindungen erfolgreich - Anwendung startet trotzdem")
+                logger.warning("⚠️ Hardware-Setup fehlgeschlagen - Anwendung startet trotzdem")
         else:
             logger.info("🔧 Hardware-Setup übersprungen (--no-hardware)")
         
@@ -135,6 +149,8 @@ def main():
         # Cleanup
         logger.info("🧹 Cleanup wird durchgeführt...")
         hardware_manager.disconnect_all()
+        if device_simulator is not None:
+            device_simulator.stop_all()
         logger.info("👋 Dynamic Messe Stand V4 beendet")
 
 if __name__ == "__main__":
@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Asset Index für Dynamic Messe Stand V4
+Persistenter, inkrementell aktualisierter Index aller Assets (inotify oder mtime-Vergleich)
+"""
+
+import os
+import json
+import time
+import struct
+import select
+import threading
+from datetime import datetime
+from core.logger import logger
+
+INDEX_VERSION = 2
+
+# inotify-Konstanten (linux/inotify.h)
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+              IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+EVENT_HEADER = struct.Struct("iIII")
+
+class InotifyWatcher:
+    """Minimaler inotify-Watcher über ctypes (nur Linux) - meldet Änderungen an den AssetIndex"""
+
+    def __init__(self, index):
+        import ctypes
+        import ctypes.util
+
+        self.index = index
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 fehlgeschlagen")
+        self._watches = {}  # wd -> Verzeichnis
+        self._running = False
+        self._thread = None
+
+    def watch_tree(self, directory):
+        """Überwacht ein Verzeichnis samt Unterverzeichnissen"""
+        for root, dirs, _ in os.walk(directory):
+            dirs[:] = [d for d in dirs if not self.index.is_excluded(os.path.join(root, d))]
+            self._add_watch(root)
+
+    def _add_watch(self, directory):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd >= 0:
+            self._watches[wd] = directory
+        else:
+            logger.debug(f"inotify-Watch für {directory} nicht möglich")
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="AssetWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2)
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _run(self):
+        while self._running:
+            try:
+                readable, _, _ = select.select([self._fd], [], [], 0.5)
+                if not readable:
+                    continue
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                continue
+            except OSError:
+                break
+
+            try:
+                self._handle_events(data)
+            except Exception as e:
+                logger.error(f"Fehler bei Asset-Änderungsereignis: {e}")
+
+    def _handle_events(self, data):
+        offset = 0
+        changed = []
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b'\0')
+            offset += EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                # Ereignisse verloren - einmal komplett abgleichen
+                self.index.rescan()
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and not self.index.is_excluded(path):
+                    self.watch_tree(path)
+                    changed += self.index.scan_directory(path)
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    changed += self.index.remove_directory(path)
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                changed += self.index.remove_file(path)
+            else:
+                changed += self.index.update_file(path)
+
+        self.index.changes_applied(changed)
+
+class AssetIndex:
+    """Index der Asset-Dateien mit Abfragen nach Kategorie und Endung.
+
+    Beim Start wird der gespeicherte Index per mtime-Vergleich abgeglichen: nur geänderte
+    Verzeichnisse werden gelistet, Dateien unveränderter Verzeichnisse erst anschließend im
+    Hintergrund per stat geprüft (in-place überschriebene Dateien). Danach hält ein inotify-Watcher den Index aktuell;
+    ohne inotify gleicht refresh() höchstens alle rescan_interval Sekunden ab.
+    """
+
+    def __init__(self, roots, supported_formats, index_path=None, rescan_interval=5.0, watch=True):
+        self.roots = roots  # Verzeichnis -> Quelle ('corporate' / 'content')
+        self.extensions = {ext for formats in supported_formats.values() for ext in formats}
+        self.index_path = index_path
+        self.rescan_interval = rescan_interval
+        self.watch = watch
+        self.excluded = {os.path.normpath(os.path.join(root, 'blobs')) for root in roots}
+        self._files = {}   # Pfad -> Asset-Info
+        self._dirs = {}    # Verzeichnis -> mtime_ns
+        self._dir_files = {}  # Verzeichnis -> Pfade der indizierten Dateien
+        self._subdirs = {}    # Verzeichnis -> Unterverzeichnisse
+        self._by_category = {}
+        self._by_extension = {}
+        self._lock = threading.RLock()
+        self._listeners = []
+        self._watcher = None
+        self._verifier = None
+        self._opened = False
+        self._dirty = False
+        self._last_rescan = 0.0
+        self._last_save = 0.0
+        self._version = 0
+        self._categorized = (None, None)
+        self.stats = {'rescans': 0, 'listed_dirs': 0, 'stat_calls': 0, 'events': 0, 'verified': 0}
+
+    # ------------------------------------------
+    # Lebenszyklus
+    # ------------------------------------------
+
+    def open(self):
+        """Lädt den gespeicherten Index, gleicht ihn ab und startet den Watcher"""
+        with self._lock:
+            if self._opened:
+                return
+            self._opened = True
+            self._load()
+            restored = bool(self._files)
+            self.rescan(check_files=False)
+
+            if self.watch:
+                try:
+                    watcher = InotifyWatcher(self)
+                    for root in self.roots:
+                        if os.path.isdir(root):
+                            watcher.watch_tree(root)
+                    watcher.start()
+                    self._watcher = watcher
+                    logger.debug("Asset-Index: inotify-Watcher aktiv")
+                except Exception as e:
+                    logger.debug(f"Asset-Index: kein inotify ({e}) - mtime-Abgleich als Fallback")
+
+            if restored:
+                # Erst nach dem Watcher-Start: Änderungen ab jetzt meldet der Watcher
+                self._verifier = threading.Thread(target=self.verify_files, name="AssetIndexVerify", daemon=True)
+                self._verifier.start()
+
+    def close(self):
+        if self._watcher:
+            self._watcher.stop()
+            self._watcher = None
+        self.wait_verified()
+        self.save(force=True)
+        self._opened = False
+
+    def wait_verified(self, timeout=None):
+        """Wartet auf die Datei-Prüfung nach dem Start; False, wenn sie noch läuft"""
+        verifier = self._verifier
+        if verifier is not None:
+            verifier.join(timeout)
+            if verifier.is_alive():
+                return False
+        return True
+
+    def refresh(self):
+        """Sorgt für einen aktuellen Index (ohne Watcher: gedrosselter mtime-Abgleich)"""
+        if not self._opened:
+            self.open()
+        elif self._watcher is None and time.monotonic() - self._last_rescan >= self.rescan_interval:
+            self.rescan()
+
+    # ------------------------------------------
+    # Abfragen
+    # ------------------------------------------
+
+    def query(self, category=None, extension=None, source=None):
+        """Assets nach Kategorie und/oder Endung (z.B. '.png'), sortiert nach Pfad"""
+        self.refresh()
+        with self._lock:
+            if category is not None:
+                paths = self._by_category.get(category, set())
+                if extension is not None:
+                    paths = paths & self._by_extension.get(extension.lower(), set())
+            elif extension is not None:
+                paths = self._by_extension.get(extension.lower(), set())
+            else:
+                paths = self._files.keys()
+
+            assets = [self._files[path] for path in paths]
+        if source is not None:
+            assets = [asset for asset in assets if asset['source'] == source]
+        return sorted(assets, key=lambda asset: asset['path'])
+
+    def categorized(self):
+        """Alle Assets im bisherigen scan_assets()-Format"""
+        self.refresh()
+        with self._lock:
+            version, result = self._categorized
+            if version != self._version:
+                result = {}
+                for category in ('ui_elements', 'content_images', 'corporate_assets', 'user_uploads'):
+                    result[category] = [self._files[path] for path in sorted(self._by_category.get(category, ()))]
+                self._categorized = (self._version, result)
+            return {category: list(assets) for category, assets in result.items()}
+
+    def count(self):
+        with self._lock:
+            return len(self._files)
+
+    def get_asset(self, path):
+        with self._lock:
+            return self._files.get(path)
+
+    def notify_path(self, path):
+        """Explizit gemeldete Datei (z.B. Upload) sofort übernehmen, ohne auf Watcher/Abgleich zu warten"""
+        path = os.path.normpath(path)
+        if self._root_of(path) is None:
+            return []
+        if not self._opened:
+            self.open()
+        changed = self.update_file(path)
+        self.changes_applied(changed)
+        return changed
+
+    def add_listener(self, callback):
+        """callback(changed_paths) nach jeder Index-Änderung (Watcher- oder Rescan-Thread)"""
+        self._listeners.append(callback)
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats, files=len(self._files), directories=len(self._dirs),
+                        watching=self._watcher is not None)
+
+    # ------------------------------------------
+    # Abgleich
+    # ------------------------------------------
+
+    def rescan(self, check_files=True):
+        """mtime-Abgleich: nur geänderte Verzeichnisse listen.
+
+        check_files=False überspringt auch die Dateien unveränderter Verzeichnisse
+        (Start: ein stat pro Verzeichnis statt pro Datei).
+        """
+        changed = []
+        with self._lock:
+            self.stats['rescans'] += 1
+            self._last_rescan = time.monotonic()
+            for root in self.roots:
+                changed += self._reconcile_directory(os.path.normpath(root), check_files)
+
+        self.changes_applied(changed)
+        return changed
+
+    def verify_files(self):
+        """Prüft alle bekannten Dateien per stat (Hintergrund nach dem schnellen Start-Abgleich).
+
+        Hält den Lock nur pro Datei - Abfragen laufen währenddessen weiter.
+        """
+        with self._lock:
+            paths = list(self._files)
+
+        changed = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+            with self._lock:
+                self.stats['stat_calls'] += 1
+                if path not in self._files:
+                    continue  # Inzwischen vom Watcher entfernt - nicht wieder aufnehmen
+                changed += self.update_file(path, stat) if stat else self.remove_file(path)
+        with self._lock:
+            self.stats['verified'] += 1
+        if changed:
+            logger.debug(f"Asset-Index: {len(changed)} seit dem letzten Lauf geänderte Dateien nachgezogen")
+        self.changes_applied(changed)
+        return changed
+
+    def _reconcile_directory(self, directory, check_files=True):
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return self.remove_directory(directory)
+
+        changed = []
+        if self._dirs.get(directory) == mtime:
+            # Keine Einträge hinzugekommen/entfernt - bekannte Dateien höchstens auf Änderungen prüfen
+            if check_files:
+                for path in list(self._dir_files.get(directory, ())):
+                    changed += self.update_file(path)
+            for subdirectory in list(self._subdirs.get(directory, ())):
+                changed += self._reconcile_directory(subdirectory, check_files)
+            return changed
+
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return self.remove_directory(directory)
+
+        self._dirs[directory] = mtime
+        self._subdirs.setdefault(os.path.dirname(directory), set()).add(directory)
+        self._dirty = True
+        self.stats['listed_dirs'] += 1
+        present = set()
+        for entry in entries:
+            path = os.path.join(directory, entry.name)
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if not self.is_excluded(path):
+                    present.add(path)
+                    changed += self._reconcile_directory(path, check_files)
+            elif os.path.splitext(entry.name)[1].lower() in self.extensions:
+                present.add(path)
+                try:
+                    changed += self.update_file(path, entry.stat())
+                except OSError:
+                    continue
+
+        # Verschwundene Dateien und Verzeichnisse entfernen
+        for path in [p for p in self._dir_files.get(directory, ()) if p not in present]:
+            changed += self.remove_file(path)
+        for path in [d for d in self._subdirs.get(directory, ()) if d not in present]:
+            changed += self.remove_directory(path)
+        return changed
+
+    def scan_directory(self, directory):
+        """Nimmt ein (neues) Verzeichnis vollständig auf"""
+        directory = os.path.normpath(directory)
+        with self._lock:
+            self._dirs.pop(directory, None)
+            return self._reconcile_directory(directory)
+
+    def update_file(self, path, stat=None):
+        """Nimmt eine Datei auf bzw. aktualisiert sie; gibt [path] bei Änderung zurück"""
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in self.extensions:
+            return []
+
+        if stat is None:
+            self.stats['stat_calls'] += 1
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return self.remove_file(path)
+
+        with self._lock:
+            known = self._files.get(path)
+            if known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns:
+                return []
+
+            if known:
+                self._unindex(path, known)
+            self._add(self._create_asset_info(path, stat.st_size, stat.st_mtime_ns))
+            self._dirty = True
+            return [path]
+
+    def remove_file(self, path):
+        with self._lock:
+            known = self._files.get(path)
+            if known is None:
+                return []
+            self._unindex(path, known)
+            self._dirty = True
+            return [path]
+
+    def remove_directory(self, directory):
+        directory = os.path.normpath(directory)
+        changed = []
+        with self._lock:
+            for path in list(self._dir_files.get(directory, ())):
+                changed += self.remove_file(path)
+            for subdirectory in list(self._subdirs.get(directory, ())):
+                changed += self.remove_directory(subdirectory)
+            self._dir_files.pop(directory, None)
+            self._subdirs.pop(directory, None)
+            self._subdirs.get(os.path.dirname(directory), set()).discard(directory)
+            if self._dirs.pop(directory, None) is not None:
+                self._dirty = True
+        return changed
+
+    def changes_applied(self, changed):
+        """Benachrichtigt Listener und speichert den Index (gedrosselt)"""
+        if changed:
+            self.stats['events'] += len(changed)
+            for callback in list(self._listeners):
+                try:
+                    callback(changed)
+                except Exception as e:
+                    logger.error(f"Fehler im Asset-Index-Listener: {e}")
+        self.save()
+
+    def is_excluded(self, path):
+        return os.path.normpath(path) in self.excluded
+
+    def _add(self, asset_info):
+        path = asset_info['path']
+        self._files[path] = asset_info
+        self._dir_files.setdefault(os.path.dirname(path), set()).add(path)
+        self._by_category.setdefault(asset_info['category'], set()).add(path)
+        self._by_extension.setdefault(asset_info['extension'], set()).add(path)
+        self._version += 1
+
+    def _unindex(self, path, asset_info):
+        del self._files[path]
+        self._dir_files.get(os.path.dirname(path), set()).discard(path)
+        self._by_category.get(asset_info['category'], set()).discard(path)
+        self._by_extension.get(asset_info['extension'], set()).discard(path)
+        self._version += 1
+
+    def _root_of(self, path):
+        for root in self.roots:
+            normalized = os.path.normpath(root)
+            if path == normalized or path.startswith(normalized + os.sep):
+                return root
+        return None
+
+    def _create_asset_info(self, path, size, mtime_ns):
+        """Asset-Information im bisherigen scan_assets()-Format, plus Kategorie und mtime_ns"""
+        root = self._root_of(path)
+        source = self.roots.get(root, 'content')
+        filename = os.path.basename(path)
+
+        if source == 'content':
+            uploads = os.path.join(os.path.normpath(root), 'user_uploads') + os.sep
+            category = 'user_uploads' if path.startswith(uploads) else 'content_images'
+        elif 'icon' in filename.lower() or 'ui' in os.path.dirname(path).lower():
+            category = 'ui_elements'
+        else:
+            category = 'corporate_assets'
+
+        return {
+            'path': path,
+            'filename': filename,
+            'source': source,
+            'category': category,
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'modified': datetime.fromtimestamp(mtime_ns / 1e9).isoformat(),
+            'extension': os.path.splitext(path)[1].lower()
+        }
+
+    # ------------------------------------------
+    # Persistenz
+    # ------------------------------------------
+
+    def _load(self):
+        if not self.index_path or not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != INDEX_VERSION or data.get('roots') != self.roots:
+                return
+
+            self._dirs = data['dirs']
+            for directory in self._dirs:
+                self._subdirs.setdefault(os.path.dirname(directory), set()).add(directory)
+            for asset_info in data['files']:
+                self._add(asset_info)
+            logger.debug(f"Asset-Index geladen: {len(self._files)} Dateien")
+        except Exception as e:
+            logger.warning(f"Asset-Index nicht lesbar, wird neu aufgebaut: {e}")
+            self._files, self._dirs, self._dir_files, self._subdirs = {}, {}, {}, {}
+            self._by_category, self._by_extension = {}, {}
+
+    def save(self, force=False):
+        """Schreibt den Index atomar (höchstens alle 2 s, außer force)"""
+        if not self.index_path or not self._dirty:
+            return
+        if not force and time.monotonic() - self._last_save < 2.0:
+            return
+
+        with self._lock:
+            data = {
+                'version': INDEX_VERSION,
+                'roots': self.roots,
+                'dirs': dict(self._dirs),
+                'files': list(self._files.values())
+            }
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            temp_path = self.index_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, self.index_path)
+        except Exception as e:
+            logger.error(f"Asset-Index konnte nicht gespeichert werden: {e}")
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Asset Search für Dynamic Messe Stand V4
+Such-Index über Dateinamen (Präfix, Teilstring per Trigrammen, Endung) mit sortierbaren Ergebnissen
+"""
+
+import bisect
+import threading
+from PIL import Image
+from core.logger import logger
+
+SORT_KEYS = {
+    'name': lambda asset: asset['filename'].lower(),
+    'size': lambda asset: asset['size'],
+    'modified': lambda asset: asset.get('mtime_ns', 0),
+    'type': lambda asset: (asset['extension'], asset['filename'].lower()),
+}
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class AssetSearchIndex:
+    """Such-Index über dem AssetIndex, inkrementell über dessen Listener gepflegt.
+
+    Suchsyntax (Begriffe per Leerzeichen, alle müssen passen):
+        logo      Teilstring im Dateinamen (ab 3 Zeichen über den Trigramm-Index)
+        logo*     Dateiname beginnt mit "logo" (sortierte Namensliste, bisect)
+        .png      Endung (mehrere Endungen: eine davon)
+    """
+
+    def __init__(self, asset_index):
+        self.asset_index = asset_index
+        self._assets = {}    # Pfad -> Asset-Info
+        self._names = []     # sortiert: (Dateiname klein, Pfad)
+        self._trigrams = {}  # Trigramm -> Pfade
+        self._dimensions = {}  # (Pfad, mtime_ns) -> (Breite, Höhe) oder None
+        self._built = False
+        self._lock = threading.RLock()
+        self.stats = {'queries': 0, 'updates': 0, 'measured': 0}
+        asset_index.add_listener(self._on_assets_changed)
+
+    def search(self, text='', category=None, extension=None, sort='name', descending=False, limit=None):
+        """Sucht Assets; sort: 'name', 'size', 'modified', 'type' oder 'pixels'.
+
+        'pixels' nutzt nur bereits bekannte Bildgrößen (kein Datei-Zugriff im Aufrufer);
+        Assets ohne bekannte Größe stehen in beiden Richtungen am Ende - siehe measure().
+        """
+        self.asset_index.refresh()
+        terms, prefixes, extensions = self._parse(text)
+        if extension:
+            extensions.add(extension.lower())
+
+        with self._lock:
+            self._ensure_built()
+            self.stats['queries'] += 1
+            candidates = None
+
+            for prefix in prefixes:
+                candidates = self._intersect(candidates, self._prefix_matches(prefix))
+            for term in sorted(terms, key=len, reverse=True):  # Lange Begriffe grenzen am stärksten ein
+                candidates = self._intersect(candidates, self._substring_matches(term, candidates))
+
+            if candidates is None:
+                assets = list(self._assets.values())
+            else:
+                assets = [self._assets[path] for path in candidates]
+
+        if extensions:
+            assets = [asset for asset in assets if asset['extension'] in extensions]
+        if category:
+            assets = [asset for asset in assets if asset.get('category') == category]
+
+        if sort == 'pixels':
+            assets = self._sort_by_pixels(assets, descending)
+        else:
+            assets.sort(key=SORT_KEYS.get(sort, SORT_KEYS['name']), reverse=descending)
+        return assets[:limit] if limit else assets
+
+    def dimensions(self, asset):
+        """Bildgröße (Breite, Höhe) aus dem Datei-Header - gecacht bis zur nächsten Änderung.
+
+        Liest ggf. die Datei - im Tk-Thread stattdessen cached_dimensions() verwenden.
+        """
+        key = (asset['path'], asset.get('mtime_ns'))
+        with self._lock:
+            if key in self._dimensions:
+                return self._dimensions[key]
+
+        try:
+            with Image.open(asset['path']) as image:  # Liest nur den Header
+                size = image.size
+        except Exception:
+            size = None
+
+        with self._lock:
+            self._dimensions[key] = size
+            self.stats['measured'] += 1
+        return size
+
+    def cached_dimensions(self, asset, default=None):
+        """Bekannte Bildgröße ohne Datei-Zugriff; default, solange noch nicht gemessen"""
+        with self._lock:
+            return self._dimensions.get((asset['path'], asset.get('mtime_ns')), default)
+
+    def unmeasured(self, assets):
+        """Assets, deren Größe noch nicht bekannt ist"""
+        with self._lock:
+            return [asset for asset in assets
+                    if (asset['path'], asset.get('mtime_ns')) not in self._dimensions]
+
+    def measure(self, assets):
+        """Liest die Größen aller noch unbekannten Assets (für einen Worker-Thread)"""
+        for asset in self.unmeasured(assets):
+            self.dimensions(asset)
+        return len(assets)
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats, assets=len(self._assets), trigrams=len(self._trigrams))
+
+    # ------------------------------------------
+    # Abfrage-Hilfen
+    # ------------------------------------------
+
+    def _parse(self, text):
+        terms, prefixes, extensions = [], [], set()
+        for token in (text or '').lower().split():
+            if token.startswith('.') and len(token) > 1:
+                extensions.add(token)
+            elif token.endswith('*') and len(token) > 1:
+                prefixes.append(token[:-1])
+            elif token != '*':
+                terms.append(token)
+        return terms, prefixes, extensions
+
+    def _intersect(self, candidates, matches):
+        return matches if candidates is None else candidates & matches
+
+    def _prefix_matches(self, prefix):
+        start = bisect.bisect_left(self._names, (prefix,))
+        matches = set()
+        for name, path in self._names[start:]:
+            if not name.startswith(prefix):
+                break
+            matches.add(path)
+        return matches
+
+    def _substring_matches(self, term, candidates):
+        if len(term) >= 3:
+            sets = sorted((self._trigrams.get(trigram, set()) for trigram in _trigrams(term)), key=len)
+            pool = set.intersection(*sets) if sets else set()
+            if candidates is not None:
+                pool &= candidates
+        else:
+            pool = candidates if candidates is not None else self._assets.keys()
+        # Trigramme garantieren keine zusammenhängende Fundstelle - nachprüfen
+        return {path for path in pool if term in self._assets[path]['filename'].lower()}
+
+    def _sort_by_pixels(self, assets, descending):
+        known, unknown = [], []
+        with self._lock:
+            for asset in assets:
+                size = self._dimensions.get((asset['path'], asset.get('mtime_ns')))
+                if size:
+                    known.append((size[0] * size[1], asset))
+                else:
+                    unknown.append(asset)
+        known.sort(key=lambda item: item[0], reverse=descending)
+        unknown.sort(key=SORT_KEYS['name'])
+        return [asset for _, asset in known] + unknown
+
+    # ------------------------------------------
+    # Pflege
+    # ------------------------------------------
+
+    def _ensure_built(self):
+        if self._built:
+            return
+        for asset in self.asset_index.query():
+            path = asset['path']
+            self._assets[path] = asset
+            for trigram in _trigrams(asset['filename'].lower()):
+                self._trigrams.setdefault(trigram, set()).add(path)
+        self._names = sorted((asset['filename'].lower(), path) for path, asset in self._assets.items())
+        self._built = True
+        logger.debug(f"Asset-Suchindex aufgebaut: {len(self._assets)} Assets, {len(self._trigrams)} Trigramme")
+
+    def _on_assets_changed(self, paths):
+        """AssetIndex-Listener (Watcher-, Rescan- oder Upload-Pfad): geänderte Pfade nachziehen"""
+        with self._lock:
+            if not self._built:
+                return  # Wird beim ersten search() vollständig aufgebaut
+            for path in paths:
+                self._remove(path)
+                asset = self.asset_index.get_asset(path)
+                if asset is not None:
+                    self._add(asset)
+                self.stats['updates'] += 1
+
+    def _add(self, asset):
+        path = asset['path']
+        name = asset['filename'].lower()
+        self._assets[path] = asset
+        bisect.insort(self._names, (name, path))
+        for trigram in _trigrams(name):
+            self._trigrams.setdefault(trigram, set()).add(path)
+
+    def _remove(self, path):
+        asset = self._assets.pop(path, None)
+        if asset is None:
+            return
+        self._dimensions.pop((path, asset.get('mtime_ns')), None)
+        name = asset['filename'].lower()
+        position = bisect.bisect_left(self._names, (name, path))
+        if position < len(self._names) and self._names[position] == (name, path):
+            del self._names[position]
+        for trigram in _trigrams(name):
+            paths = self._trigrams.get(trigram)
+            if paths:
+                paths.discard(path)
+                if not paths:
+                    del self._trigrams[trigram]
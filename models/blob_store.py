@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Blob Store für Dynamic Messe Stand V4
+Inhaltsadressierte Ablage für Bilddaten (SHA-256), dedupliziert statt Base64 im Slide-JSON
+
+Migration bestehender Präsentationen (image_data -> image_hash):
+    python -m models.blob_store presentations/meine_praesentation.json
+"""
+
+import os
+import sys
+import json
+import base64
+import hashlib
+import argparse
+import tempfile
+from core import compression
+from core.config import config
+from core.logger import logger
+
+CHUNK_SIZE = 1024 * 1024
+
+class BlobStore:
+    """Legt Bytes unter ihrem SHA-256-Hash ab (blobs/ab/cdef...); gleiche Bilder nur einmal"""
+
+    def __init__(self, root=None):
+        self.root = root or os.path.join(config.content_dir, "blobs")
+        self.stats = {'stored': 0, 'deduplicated': 0, 'bytes_stored': 0}
+
+    def path(self, blob_hash):
+        """Dateipfad eines Blobs (zum direkten, streamenden Öffnen)"""
+        return os.path.join(self.root, blob_hash[:2], blob_hash[2:])
+
+    def exists(self, blob_hash):
+        return os.path.exists(self.path(blob_hash))
+
+    def put(self, data):
+        """Speichert Bytes und gibt deren Hash zurück"""
+        blob_hash = hashlib.sha256(data).hexdigest()
+        if self.exists(blob_hash):
+            self.stats['deduplicated'] += 1
+            return blob_hash
+
+        self._write(blob_hash, [data])
+        return blob_hash
+
+    def put_file(self, filepath):
+        """Speichert eine Datei blockweise (ohne sie komplett in den Speicher zu laden)"""
+        hasher = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        blob_hash = hasher.hexdigest()
+        if self.exists(blob_hash):
+            self.stats['deduplicated'] += 1
+            return blob_hash
+
+        with open(filepath, 'rb') as f:
+            self._write(blob_hash, iter(lambda: f.read(CHUNK_SIZE), b''))
+        return blob_hash
+
+    def put_base64(self, image_data):
+        """Dekodiert eingebettete Base64-Daten und legt sie ab"""
+        return self.put(base64.b64decode(image_data))
+
+    def open(self, blob_hash):
+        """Öffnet einen Blob zum Lesen (Datei-Objekt, z.B. direkt für PIL.Image.open)"""
+        return open(self.path(blob_hash), 'rb')
+
+    def read(self, blob_hash):
+        with self.open(blob_hash) as f:
+            return f.read()
+
+    def _write(self, blob_hash, chunks):
+        """Atomar schreiben: temporäre Datei im Zielordner, dann os.replace"""
+        target = self.path(blob_hash)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix='.tmp_')
+        size = 0
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(temp_path, target)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        self.stats['stored'] += 1
+        self.stats['bytes_stored'] += size
+
+    def get_stats(self):
+        return dict(self.stats)
+
+# Globale Blob-Store Instanz
+blob_store = BlobStore()
+
+def migrate_elements(elements, store=None):
+    """Ersetzt image_data in Canvas-Elementen (dicts oder Records) durch image_hash.
+
+    Gibt die Anzahl migrierter Elemente zurück.
+    """
+    store = store or blob_store
+    migrated = 0
+    for element in elements:
+        image_data = element.get('image_data')
+        if not image_data:
+            continue
+        try:
+            element['image_hash'] = store.put_base64(image_data)
+        except Exception as e:
+            logger.warning(f"Bilddaten konnten nicht migriert werden: {e}")
+            continue
+        del element['image_data']
+        migrated += 1
+    return migrated
+
+def migrate_presentation_file(filepath, store=None):
+    """Migriert eine JSON-Präsentation (EnhancedContentManager- oder Export-Format) in-place"""
+    with compression.open_text(filepath) as f:
+        data = json.load(f)
+
+    migrated = 0
+    for slide in data.get('slides', {}).values():
+        if not isinstance(slide, dict):
+            continue
+        migrated += migrate_elements(slide.get('canvas_elements') or [], store)
+        migrated += migrate_elements((slide.get('config_data') or {}).get('canvas_elements') or [], store)
+
+    if migrated:
+        temp_path = filepath + '.tmp'
+        with compression.open_text(temp_path, 'w', codec=compression.codec_for_path(filepath)) as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, filepath)
+    return migrated
+
+def main():
+    """Migrations-Werkzeug für bestehende Präsentationsdateien"""
+    parser = argparse.ArgumentParser(description='Eingebettete Base64-Bilder in den Blob-Store verschieben')
+    parser.add_argument('files', nargs='+', help='JSON-Präsentationsdateien')
+    args = parser.parse_args()
+
+    for filepath in args.files:
+        before = os.path.getsize(filepath)
+        migrated = migrate_presentation_file(filepath)
+        after = os.path.getsize(filepath)
+        print(f"{filepath}: {migrated} Bilder migriert, {before} -> {after} Bytes")
+
+    print(json.dumps(blob_store.get_stats()))
+
+if __name__ == "__main__":
+    sys.exit(main())
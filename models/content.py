@@ -8,37 +8,127 @@ import os
 import json
 import yaml
 import shutil
+import time
 import base64
+import threading
+from contextlib import contextmanager
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
+from core import compression
 from core.logger import logger
+from core.config import config
 from core.storage import storage_manager
+from models.content_journal import ContentJournal
+from models.asset_index import AssetIndex
+from models.asset_search import AssetSearchIndex
+from models.blob_store import migrate_elements
+from models.records import elements_from_dicts, elements_to_dicts, element_from_dict
+from models.slide_store import (
+    CONTAINER_EXTENSION, LazySlideStore, PresentationContainer, is_container, write_container
+)
 
 class SlideData:
-    """Erweiterte Klasse für Slide-Daten mit Asset-Support"""
+    """Erweiterte Klasse für Slide-Daten mit Asset-Support (__slots__, kompakte Records)"""
+    
+    __slots__ = ('slide_id', 'title', 'content', 'layout', '_canvas_elements', '_assets',
+                 '_config_data', '_extra_data', '_created', '_modified', 'revision')
     
     def __init__(self, slide_id, title="", content="", layout="text"):
         self.slide_id = slide_id
         self.title = title
         self.content = content
         self.layout = layout  # "text", "image", "mixed"
-        self.canvas_elements = []  # Canvas-Elemente (Text, Bilder, etc.)
-        self.assets = []       # Asset-Referenzen
-        self.config_data = {}  # Zusätzliche Konfiguration
-        self.created_at = datetime.now()
-        self.modified_at = datetime.now()
-        self.extra_data = {}   # Legacy-Support
+        self._canvas_elements = []  # Canvas-Elemente als Records (Text, Bilder, etc.)
+        self._assets = None       # Asset-Referenzen (Liste erst bei Bedarf)
+        self._config_data = None  # Zusätzliche Konfiguration (dict erst bei Bedarf)
+        self._extra_data = None   # Legacy-Support
+        # Zeitstempel als Unix-Zeit oder unveränderter ISO-String aus der Datei
+        self._created = self._modified = time.time()
+        self.revision = 0      # Revision der letzten Änderung (Change-Feed)
+    
+    @property
+    def canvas_elements(self):
+        return self._canvas_elements
+    
+    @canvas_elements.setter
+    def canvas_elements(self, elements):
+        # Legacy-Dicts werden in Records umgewandelt
+        self._canvas_elements = elements_from_dicts(elements)
+    
+    @property
+    def assets(self):
+        if self._assets is None:
+            self._assets = []
+        return self._assets
+    
+    @assets.setter
+    def assets(self, assets):
+        self._assets = assets
+    
+    @property
+    def config_data(self):
+        if self._config_data is None:
+            self._config_data = {}
+        return self._config_data
+    
+    @config_data.setter
+    def config_data(self, config_data):
+        self._config_data = config_data
+    
+    @property
+    def extra_data(self):
+        if self._extra_data is None:
+            self._extra_data = {}
+        return self._extra_data
+    
+    @extra_data.setter
+    def extra_data(self, extra_data):
+        self._extra_data = extra_data
+    
+    @property
+    def created_at(self):
+        return self._as_datetime(self._created)
+    
+    @created_at.setter
+    def created_at(self, value):
+        self._created = value.timestamp() if isinstance(value, datetime) else value
+    
+    @property
+    def modified_at(self):
+        return self._as_datetime(self._modified)
+    
+    @modified_at.setter
+    def modified_at(self, value):
+        self._modified = value.timestamp() if isinstance(value, datetime) else value
+    
+    def touch(self):
+        """Setzt den Änderungszeitpunkt auf jetzt"""
+        self._modified = time.time()
+    
+    @staticmethod
+    def _as_datetime(value):
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                return datetime.now()
+        return datetime.fromtimestamp(value)
+    
+    @staticmethod
+    def _as_isoformat(value):
+        return value if isinstance(value, str) else datetime.fromtimestamp(value).isoformat()
 
     def add_canvas_element(self, element_type, data):
         """Fügt ein Canvas-Element hinzu"""
-        element = {
+        element = element_from_dict({
             'type': element_type,  # 'text', 'image', 'shape'
             'data': data,
-            'id': len(self.canvas_elements) + 1,
+            'id': len(self._canvas_elements) + 1,
             'created_at': datetime.now().isoformat()
-        }
-        self.canvas_elements.append(element)
-        self.modified_at = datetime.now()
+        })
+        self._canvas_elements.append(element)
+        self.touch()
         return element['id']
 
     def add_asset(self, asset_path, asset_type='image', copy_to_content=True):
@@ -68,7 +158,7 @@ class SlideData:
             asset_info['content_path'] = asset_path
 
         self.assets.append(asset_info)
-        self.modified_at = datetime.now()
+        self.touch()
         return asset_info
 
     def to_dict(self):
@@ -78,37 +168,31 @@ class SlideData:
             'title': self.title,
             'content': self.content,
             'layout': self.layout,
-            'canvas_elements': self.canvas_elements,
-            'assets': self.assets,
-            'config_data': self.config_data,
-            'created_at': self.created_at.isoformat(),
-            'modified_at': self.modified_at.isoformat(),
-            'extra_data': self.extra_data  # Legacy
+            'canvas_elements': elements_to_dicts(self._canvas_elements),
+            'assets': self._assets if self._assets is not None else [],
+            'config_data': self._config_data if self._config_data is not None else {},
+            'created_at': self._as_isoformat(self._created),
+            'modified_at': self._as_isoformat(self._modified),
+            'extra_data': self._extra_data if self._extra_data is not None else {}  # Legacy
         }
     
     @classmethod
     def from_dict(cls, data):
-        """Erstellt Instanz aus Dictionary"""
-        slide = cls(
-            data.get('slide_id', 1),
-            data.get('title', ''),
-            data.get('content', ''),
-            data.get('layout', 'text')
-        )
+        """Erstellt Instanz aus Dictionary (Zeitstempel werden erst bei Zugriff geparst)"""
+        slide = cls.__new__(cls)
+        slide.slide_id = data.get('slide_id', 1)
+        slide.title = data.get('title', '')
+        slide.content = data.get('content', '')
+        slide.layout = data.get('layout', 'text')
+        slide._canvas_elements = elements_from_dicts(data.get('canvas_elements'))
+        slide._assets = data.get('assets') or None
+        slide._config_data = data.get('config_data') or None
+        slide._extra_data = data.get('extra_data') or None
         
-        slide.canvas_elements = data.get('canvas_elements', [])
-        slide.assets = data.get('assets', [])
-        slide.config_data = data.get('config_data', {})
-        slide.extra_data = data.get('extra_data', {})
-        
-        # Zeitstempel wiederherstellen
-        try:
-            slide.created_at = datetime.fromisoformat(data.get('created_at', datetime.now().isoformat()))
-            slide.modified_at = datetime.fromisoformat(data.get('modified_at', datetime.now().isoformat()))
-        except:
-            slide.created_at = datetime.now()
-            slide.modified_at = datetime.now()
-            
+        now = time.time()
+        slide._created = data.get('created_at') or now
+        slide._modified = data.get('modified_at') or now
+        slide.revision = 0
         return slide
 
 
@@ -123,59 +207,140 @@ class AssetManager:
             'icons': ['.png', '.svg', '.ico'],
             'documents': ['.pdf', '.txt', '.md']
         }
+        self.index = AssetIndex(
+            {self.assets_dir: 'corporate', self.content_dir: 'content'},
+            self.supported_formats,
+            index_path=os.path.join(storage_manager.data_dir, "asset_index.json"),
+            rescan_interval=config.content.get('asset_rescan_interval', 5.0),
+            watch=config.content.get('asset_index_watch', True)
+        )
+        self.search_index = AssetSearchIndex(self.index)
     
     def scan_assets(self):
-        """Scannt alle verfügbaren Assets"""
-        assets = {
-            'ui_elements': [],
-            'content_images': [],
-            'corporate_assets': [],
-            'user_uploads': []
-        }
+        """Alle verfügbaren Assets (aus dem inkrementell gepflegten Index)"""
+        return self.index.categorized()
+    
+    def query(self, category=None, extension=None):
+        """Assets nach Kategorie (z.B. 'ui_elements') und/oder Endung (z.B. '.png')"""
+        return self.index.query(category=category, extension=extension)
+    
+    def search(self, text='', category=None, sort='name', descending=False):
+        """Suche über Dateinamen (Teilstring, Präfix*, .endung), sortierbar"""
+        return self.search_index.search(text, category=category, sort=sort, descending=descending)
+    
+    def register(self, filepath):
+        """Neu abgelegte Datei (z.B. Upload) sofort in Index und Suche übernehmen"""
+        return self.index.notify_path(filepath)
+
+
+class ContentObserverBus:
+    """Sammelt Content-Änderungen und liefert pro Abonnent einen zusammengefassten Änderungssatz.
+    
+    Ohne Scheduler wird jede Änderung sofort zugestellt. Mit Scheduler (z.B. Tk after_idle)
+    wird einmal pro Zyklus bzw. Zeitfenster ausgeliefert.
+    """
+    
+    def __init__(self, window_ms=0):
+        self.window_ms = window_ms
+        self._subscribers = []  # (callback, slide_ids, actions)
+        self._pending = OrderedDict()  # slide_id -> (letzte Aktion, alle Aktionen, slide)
+        self._scheduler = None
+        self._flush_scheduled = False
+        self._batch_depth = 0
+        self._lock = threading.RLock()
+        self.stats = {'published': 0, 'deliveries': 0}
+    
+    def set_scheduler(self, schedule, window_ms=None):
+        """Setzt schedule(delay_ms, func) für die verzögerte Zustellung (None = sofort)"""
+        self._scheduler = schedule
+        if window_ms is not None:
+            self.window_ms = window_ms
+    
+    def subscribe(self, callback, slide_ids=None, actions=None):
+        """Registriert callback(changes) mit changes = [(slide_id, action, slide)].
         
-        # Assets-Verzeichnis scannen
-        if os.path.exists(self.assets_dir):
-            for root, dirs, files in os.walk(self.assets_dir):
-                for file in files:
-                    if self._is_supported_format(file):
-                        filepath = os.path.join(root, file)
-                        asset_info = self._create_asset_info(filepath, 'corporate')
-                        
-                        if 'icon' in file.lower() or 'ui' in root.lower():
-                            assets['ui_elements'].append(asset_info)
-                        else:
-                            assets['corporate_assets'].append(asset_info)
-        
-        # Content-Verzeichnis scannen
-        if os.path.exists(self.content_dir):
-            for root, dirs, files in os.walk(self.content_dir):
-                for file in files:
-                    if self._is_supported_format(file):
-                        filepath = os.path.join(root, file)
-                        asset_info = self._create_asset_info(filepath, 'content')
-                        assets['content_images'].append(asset_info)
-        
-        return assets
-    
-    def _is_supported_format(self, filename):
-        """Prüft ob Dateiformat unterstützt wird"""
-        ext = os.path.splitext(filename)[1].lower()
-        for formats in self.supported_formats.values():
-            if ext in formats:
-                return True
-        return False
-    
-    def _create_asset_info(self, filepath, source):
-        """Erstellt Asset-Information"""
-        stat = os.stat(filepath)
-        return {
-            'path': filepath,
-            'filename': os.path.basename(filepath),
-            'source': source,
-            'size': stat.st_size,
-            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            'extension': os.path.splitext(filepath)[1].lower()
-        }
+        slide_ids/actions filtern die Zustellung; gibt eine Abmelde-Funktion zurück.
+        """
+        subscription = (
+            callback,
+            frozenset(slide_ids) if slide_ids is not None else None,
+            frozenset(actions) if actions is not None else None
+        )
+        with self._lock:
+            self._subscribers.append(subscription)
+        
+        def unsubscribe():
+            with self._lock:
+                if subscription in self._subscribers:
+                    self._subscribers.remove(subscription)
+        
+        return unsubscribe
+    
+    def publish(self, slide_id, action, slide):
+        """Merkt eine Änderung vor; mehrere Änderungen einer Slide werden zusammengefasst"""
+        with self._lock:
+            self.stats['published'] += 1
+            previous = self._pending.pop(slide_id, None)
+            actions = previous[1] | {action} if previous else {action}
+            self._pending[slide_id] = (action, actions, slide)
+            
+            if self._batch_depth or self._flush_scheduled:
+                return
+            if self._scheduler is None:
+                deliver_now = True
+            else:
+                deliver_now = False
+                self._flush_scheduled = True
+        
+        if deliver_now:
+            self.flush()
+        else:
+            try:
+                self._scheduler(self.window_ms, self.flush)
+            except Exception as e:
+                # Scheduler nicht (mehr) verfügbar, z.B. Fenster geschlossen
+                logger.debug(f"Observer-Bus Scheduler fehlgeschlagen: {e}")
+                self.flush()
+    
+    @contextmanager
+    def batch(self):
+        """Hält die Zustellung zurück, bis der Block verlassen wird (z.B. beim Laden)"""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                done = self._batch_depth == 0 and not self._flush_scheduled
+            if done:
+                self.flush()
+    
+    def flush(self):
+        """Stellt alle vorgemerkten Änderungen zu - ein Aufruf pro Abonnent"""
+        with self._lock:
+            self._flush_scheduled = False
+            if not self._pending:
+                return
+            pending = list(self._pending.items())
+            self._pending.clear()
+            subscribers = list(self._subscribers)
+        
+        for callback, slide_ids, actions in subscribers:
+            changes = [
+                (slide_id, action, slide)
+                for slide_id, (action, all_actions, slide) in pending
+                if (slide_ids is None or slide_id in slide_ids)
+                and (actions is None or not actions.isdisjoint(all_actions))
+            ]
+            if not changes:
+                continue
+            
+            self.stats['deliveries'] += 1
+            try:
+                callback(changes)
+            except Exception as e:
+                logger.error(f"Error notifying observer: {e}")
 
 
 class EnhancedContentManager:
@@ -184,6 +349,10 @@ class EnhancedContentManager:
     def __init__(self):
         self.slides = {}
         self.content_observers = []
+        self.revision = 0  # Monoton steigende Revision über alle Änderungen
+        self.change_feed = OrderedDict()  # slide_id -> (revision, action), nach Revision sortiert
+        self.observer_bus = ContentObserverBus(config.content.get('observer_window_ms', 0))
+        self.journal = None  # ContentJournal nach enable_journal()
         self.asset_manager = AssetManager()
         self.load_default_content()
     
@@ -215,13 +384,18 @@ class EnhancedContentManager:
     
     def update_slide_content(self, slide_id, title, content, extra_data=None):
         """Aktualisiert Slide-Inhalt"""
-        if slide_id not in self.slides:
+        created = slide_id not in self.slides
+        if created:
             self.slides[slide_id] = SlideData(slide_id)
         
         slide = self.slides[slide_id]
+        if not created and not extra_data and slide.title == title and slide.content == content:
+            # Unveränderter Inhalt (z.B. Auto-Save) erzeugt keine neue Revision
+            return True
+        
         slide.title = title
         slide.content = content
-        slide.modified_at = datetime.now()
+        slide.touch()
         
         if extra_data:
             slide.extra_data.update(extra_data)
@@ -252,6 +426,31 @@ class EnhancedContentManager:
         
         return asset_info
     
+    def delete_slide(self, slide_id):
+        """Löscht einen Slide (bleibt als Tombstone im Change-Feed)"""
+        if slide_id not in self.slides:
+            return False
+        
+        del self.slides[slide_id]
+        self.notify_observers(slide_id, None, 'delete')
+        logger.info(f"Slide {slide_id} gelöscht")
+        return True
+    
+    def migrate_inline_images(self):
+        """Verschiebt eingebettete Base64-Bilder aller Slides in den Blob-Store"""
+        migrated = 0
+        for slide_id in list(self.slides):
+            slide = self.slides[slide_id]
+            count = migrate_elements(slide.canvas_elements)
+            count += migrate_elements(slide.config_data.get('canvas_elements') or [])
+            if count:
+                slide.touch()
+                self.notify_observers(slide_id, slide)
+                migrated += count
+        
+        logger.info(f"{migrated} eingebettete Bilder in den Blob-Store migriert")
+        return migrated
+    
     def get_slide(self, slide_id):
         """Gibt Slide zurück"""
         return self.slides.get(slide_id)
@@ -260,30 +459,197 @@ class EnhancedContentManager:
         """Gibt alle Slides zurück"""
         return self.slides.copy()
     
+    def get_slide_title(self, slide_id):
+        """Gibt den Titel zurück, ohne eine lazy Slide zu laden (None, wenn nicht vorhanden)"""
+        if isinstance(self.slides, LazySlideStore):
+            try:
+                return self.slides.title(slide_id)
+            except KeyError:
+                return None
+        slide = self.slides.get(slide_id)
+        return slide.title if slide else None
+    
+    def get_slide_titles(self):
+        """Gibt {slide_id: titel} für Listen zurück - über einem Container aus dem Index"""
+        if isinstance(self.slides, LazySlideStore):
+            return {slide_id: self.slides.title(slide_id) for slide_id in self.slides}
+        return {slide_id: slide.title for slide_id, slide in self.slides.items()}
+    
     def get_slide_count(self):
         """Gibt Anzahl der Slides zurück"""
         return len(self.slides)
     
     def add_observer(self, callback):
-        """Fügt Observer hinzu"""
+        """Fügt Observer hinzu (synchron, ein Aufruf pro Änderung)"""
         self.content_observers.append(callback)
     
+    def subscribe(self, callback, slide_ids=None, actions=None):
+        """Abonniert zusammengefasste Änderungssätze über den Observer-Bus"""
+        return self.observer_bus.subscribe(callback, slide_ids, actions)
+    
     def notify_observers(self, slide_id, slide_data, action='update'):
-        """Benachrichtigt Observer"""
+        """Vergibt eine neue Revision, schreibt das Journal und benachrichtigt Observer"""
+        self._record_change(slide_id, action)
+        if action != 'load' and isinstance(self.slides, LazySlideStore):
+            # In-place geänderte Slide darf nicht mehr freigegeben werden
+            self.slides.mark_dirty(slide_id)
+        if self.journal and action != 'load':
+            self._journal_change(slide_id, action)
         for callback in self.content_observers:
             try:
                 callback(slide_id, slide_data, action)
             except Exception as e:
                 logger.error(f"Error notifying observer: {e}")
+        
+        self.observer_bus.publish(slide_id, action, slide_data)
+    
+    def _record_change(self, slide_id, action):
+        """Trägt eine Änderung in den Change-Feed ein (ein Eintrag pro Slide, neueste am Ende)"""
+        self.revision += 1
+        slide = self._peek_slide(slide_id)
+        if slide is not None:
+            slide.revision = self.revision
+        
+        self.change_feed[slide_id] = (self.revision, action)
+        self.change_feed.move_to_end(slide_id)
+    
+    def get_changes_since(self, revision):
+        """Gibt (aktuelle Revision, Änderungen seit revision) zurück - O(geänderte Slides).
+        
+        Jede Änderung ist (slide_id, action, slide). slide ist None bei gelöschten Slides
+        (action 'delete') und bei nicht geladenen Slides eines Containers - die holt der
+        Empfänger bei Bedarf über get_slide() bzw. get_slide_title().
+        """
+        changes = []
+        for slide_id in reversed(self.change_feed):
+            change_revision, action = self.change_feed[slide_id]
+            if change_revision <= revision:
+                break
+            changes.append((slide_id, action, self._peek_slide(slide_id)))
+        
+        changes.reverse()
+        return self.revision, changes
+    
+    def _peek_slide(self, slide_id):
+        """Slide nur, wenn sie schon im Speicher ist - nicht geladene Slides nicht materialisieren"""
+        if isinstance(self.slides, LazySlideStore):
+            return self.slides.peek(slide_id)
+        return self.slides.get(slide_id)
+    
+    def enable_journal(self, directory=None):
+        """Aktiviert das Änderungsjournal und stellt den gespeicherten Stand wieder her"""
+        directory = directory or os.path.join(storage_manager.data_dir, "content")
+        journal = ContentJournal(
+            directory,
+            compact_entries=config.content.get('journal_compact_entries', 500),
+            fsync=config.content.get('journal_fsync', True)
+        )
+        
+        try:
+            restored = journal.open()
+        except Exception as e:
+            logger.error(f"Content-Journal konnte nicht geladen werden: {e}")
+            return False
+        
+        if restored is None:
+            # Erster Start: aktuellen Stand als Basis-Snapshot sichern
+            journal.compact(*self._journal_state())
+        else:
+            self._replace_slides(self._restore_slides(journal.base, restored))
+            logger.info(f"Content aus Journal wiederhergestellt: {len(self.slides)} Slides "
+                        f"({journal.stats['replayed']} Änderungen nachgespielt)")
+        
+        self.journal = journal
+        return True
+    
+    def _restore_slides(self, base, restored):
+        """Baut den Slide-Bestand aus Snapshot/Journal (ggf. über dem Basis-Container) auf"""
+        if base:
+            try:
+                slides = self._open_container(base)
+            except Exception as e:
+                logger.error(f"Basis-Container nicht lesbar ({base}): {e}")
+                slides = {}
+        else:
+            slides = {}
+        
+        for slide_id, data in restored.items():
+            if data is None:
+                slides.pop(slide_id, None)
+            else:
+                slides[slide_id] = SlideData.from_dict(data)
+        return slides
+    
+    def _open_container(self, filepath):
+        """Öffnet einen Container als LazySlideStore - gelesen wird nur der Index"""
+        return LazySlideStore(
+            PresentationContainer(filepath),
+            SlideData.from_dict,
+            max_slides=config.content.get('lazy_max_slides', 64),
+            max_bytes=config.content.get('lazy_cache_mb', 64) * 1024 * 1024
+        )
+    
+    def _replace_slides(self, slides):
+        """Ersetzt alle Slides und meldet das als ein zusammengefasster Änderungssatz"""
+        previous_ids = set(self.slides)
+        self.slides = slides
+        lazy = isinstance(slides, LazySlideStore)
+        
+        with self.observer_bus.batch():
+            for slide_id in previous_ids - set(self.slides):
+                self.notify_observers(slide_id, None, action='delete')
+            for slide_id in self.slides:
+                # Lazy: Slide-Objekt erst bei Zugriff über get_slide() materialisieren
+                self.notify_observers(slide_id, None if lazy else self.slides[slide_id], action='load')
+    
+    def _journal_change(self, slide_id, action):
+        """Schreibt die geänderte Slide ins Journal (Kosten unabhängig von der Slide-Anzahl)"""
+        slide = self.slides.get(slide_id)
+        try:
+            if self.journal.append(slide_id, action, slide.to_dict() if slide else None):
+                self.compact_journal()
+        except Exception as e:
+            logger.error(f"Fehler beim Schreiben des Content-Journals: {e}")
+    
+    def compact_journal(self):
+        """Fasst Journal und Snapshot zu einem neuen Snapshot zusammen"""
+        if not self.journal:
+            return False
+        try:
+            self.journal.compact(*self._journal_state())
+            return True
+        except Exception as e:
+            logger.error(f"Fehler beim Kompaktieren des Content-Journals: {e}")
+            return False
+    
+    def close_journal(self):
+        """Kompaktiert und schließt das Journal (beim Beenden)"""
+        if self.journal:
+            self.compact_journal()
+            self.journal.close()
+            self.journal = None
+    
+    def _journal_state(self):
+        """(Slides, Basis) für den Snapshot - über einem Container nur die Abweichungen"""
+        if isinstance(self.slides, LazySlideStore):
+            changed, deleted = self.slides.overrides()
+            state = {slide_id: slide.to_dict() for slide_id, slide in changed.items()}
+            state.update(dict.fromkeys(deleted))
+            return state, self.slides.container.path
+        return {slide_id: slide.to_dict() for slide_id, slide in self.slides.items()}, None
     
     def save_to_file(self, filepath=None):
-        """Speichert alle Slides in JSON-Datei"""
+        """Speichert alle Slides in JSON-Datei (Container bei .dmsp, komprimiert bei .gz/.xz/.zst)"""
         if not filepath:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filepath = f"presentations/presentation_{timestamp}.json"
+            suffix = compression.extension_for(config.storage.get('presentation_compression'))
+            filepath = f"presentations/presentation_{timestamp}.json{suffix}"
         
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
+        if filepath.endswith(CONTAINER_EXTENSION):
+            return self.save_to_container(filepath)
+        
         data = {
             'presentation': {
                 'title': 'BumbleB Präsentation',
@@ -294,7 +660,7 @@ class EnhancedContentManager:
         }
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with compression.open_text(filepath, 'w') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             
             logger.info(f"Präsentation gespeichert: {filepath}")
@@ -303,28 +669,52 @@ class EnhancedContentManager:
             logger.error(f"Fehler beim Speichern: {e}")
             return None
     
+    def save_to_container(self, filepath):
+        """Speichert alle Slides als Container mit Slide-Index (schnelles, lazy Laden)"""
+        try:
+            count = write_container(
+                filepath,
+                ((slide_id, self.slides[slide_id].to_dict()) for slide_id in sorted(self.slides)),
+                {'title': 'BumbleB Präsentation', 'version': '2.0'}
+            )
+            logger.info(f"Präsentation als Container gespeichert: {filepath} ({count} Slides)")
+            return filepath
+        except Exception as e:
+            logger.error(f"Fehler beim Speichern des Containers: {e}")
+            return None
+    
     def load_from_file(self, filepath):
-        """Lädt Slides aus JSON-Datei"""
+        """Lädt Slides aus JSON-Datei oder Container (Container: nur Index + erste Slide)"""
         if not os.path.exists(filepath):
             logger.error(f"Datei nicht gefunden: {filepath}")
             return False
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if 'slides' in data:
-                self.slides.clear()
-                for slide_id_str, slide_data in data['slides'].items():
-                    slide_id = int(slide_id_str)
-                    self.slides[slide_id] = SlideData.from_dict(slide_data)
+            if is_container(filepath):
+                slides = self._open_container(filepath)
+                for slide_id in slides.container.slide_ids[:1]:
+                    slides.get(slide_id)  # Erste Slide sofort bereitstellen
+            else:
+                with compression.open_text(filepath) as f:
+                    data = json.load(f)
                 
-                # Alle Observer benachrichtigen
-                for slide_id, slide_data in self.slides.items():
-                    self.notify_observers(slide_id, slide_data, action='load')
-                
-                logger.info(f"Präsentation geladen: {filepath} ({len(self.slides)} Slides)")
-                return True
+                if 'slides' not in data:
+                    return False
+                if config.content.get('migrate_inline_images', True):
+                    # Eingebettete Base64-Bilder in den Blob-Store verschieben
+                    for slide_data in data['slides'].values():
+                        migrate_elements(slide_data.get('canvas_elements') or [])
+                slides = {int(slide_id): SlideData.from_dict(slide_data)
+                          for slide_id, slide_data in data['slides'].items()}
+            
+            # Ein zusammengefasster Änderungssatz für die Bus-Abonnenten
+            self._replace_slides(slides)
+            
+            # Geladener Stand ersetzt alles - direkt als neuer Snapshot sichern
+            self.compact_journal()
+            
+            logger.info(f"Präsentation geladen: {filepath} ({len(self.slides)} Slides)")
+            return True
         except Exception as e:
             logger.error(f"Fehler beim Laden: {e}")
             return False
@@ -332,6 +722,18 @@ class EnhancedContentManager:
     def get_available_assets(self):
         """Gibt alle verfügbaren Assets zurück"""
         return self.asset_manager.scan_assets()
+    
+    def query_assets(self, category=None, extension=None):
+        """Gefilterte Assets aus dem Index (ohne Verzeichnis-Scan)"""
+        return self.asset_manager.query(category=category, extension=extension)
+    
+    def search_assets(self, text='', category=None, sort='name', descending=False):
+        """Sucht Assets über den inkrementellen Such-Index"""
+        return self.asset_manager.search(text, category=category, sort=sort, descending=descending)
+    
+    def register_asset(self, filepath):
+        """Meldet eine neu abgelegte Asset-Datei an den Index"""
+        return self.asset_manager.register(filepath)
 
 # Globale Instanz (ersetzt die alte)
 content_manager = EnhancedContentManager()
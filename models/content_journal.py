@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Content Journal für Dynamic Messe Stand V4
+Append-only Änderungsjournal pro Slide mit periodischer Kompaktierung in einen Snapshot
+"""
+
+import os
+import json
+from core.logger import logger
+
+SNAPSHOT_FILE = "snapshot.json"
+JOURNAL_FILE = "journal.jsonl"
+
+class ContentJournal:
+    """Speichert Slide-Änderungen als Einzeiler (O(eine Slide)) statt der ganzen Präsentation.
+
+    Layout im Verzeichnis:
+        snapshot.json  - kompletter Stand bis Sequenz N (atomar per os.replace geschrieben)
+        journal.jsonl  - eine Zeile pro Änderung mit Sequenz > N
+
+    Ist ein Präsentations-Container als Basis gesetzt, enthält der Snapshot nur die
+    Abweichungen davon (gelöschte Slides als None).
+    """
+
+    def __init__(self, directory, compact_entries=500, fsync=True):
+        self.directory = directory
+        self.compact_entries = compact_entries
+        self.fsync = fsync
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.base = None   # Pfad des Basis-Containers (oder None)
+        self.sequence = 0  # Sequenz der letzten geschriebenen Änderung
+        self.entries = 0   # Einträge im Journal seit der letzten Kompaktierung
+        self._file = None
+        self.stats = {'appended': 0, 'replayed': 0, 'compactions': 0, 'torn_entries': 0}
+
+    def open(self):
+        """Lädt Snapshot und spielt das Journal nach.
+
+        Gibt {slide_id: slide_dict} zurück oder None, wenn noch nichts gespeichert wurde.
+        Mit Basis-Container (self.base) sind es die Abweichungen, gelöschte Slides als None.
+        Ein abgeschnittener letzter Eintrag (Absturz während des Schreibens) wird verworfen.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        slides = None
+        snapshot_sequence = 0
+
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            snapshot_sequence = snapshot.get('sequence', 0)
+            self.base = snapshot.get('base')
+            slides = {int(slide_id): data for slide_id, data in snapshot.get('slides', {}).items()}
+
+        self.sequence = snapshot_sequence
+        if os.path.exists(self.journal_path):
+            replayed = self._replay(slides or {}, snapshot_sequence)
+            # Leeres Journal ohne Snapshot ist kein gespeicherter Stand (sonst leeres Deck)
+            if slides is not None or self.stats['replayed']:
+                slides = replayed
+
+        self._file = open(self.journal_path, 'a', encoding='utf-8')
+        return slides
+
+    def _replay(self, slides, snapshot_sequence):
+        valid_bytes = 0
+        with open(self.journal_path, 'rb') as f:
+            for raw_line in f:
+                try:
+                    if not raw_line.endswith(b'\n'):
+                        raise ValueError("unvollständige Zeile")
+                    entry = json.loads(raw_line)
+                except ValueError:
+                    # Alles ab hier stammt aus einem abgebrochenen Schreibvorgang
+                    self.stats['torn_entries'] += 1
+                    break
+
+                valid_bytes += len(raw_line)
+                self.entries += 1
+                if entry['seq'] <= snapshot_sequence:
+                    continue  # Bereits im Snapshot (Absturz zwischen Snapshot und Kürzen)
+
+                if entry['slide'] is None and not self.base:
+                    slides.pop(entry['id'], None)
+                else:
+                    slides[entry['id']] = entry['slide']
+                self.sequence = entry['seq']
+                self.stats['replayed'] += 1
+
+        if self.stats['torn_entries']:
+            logger.warning(f"Content-Journal: unvollständiger Eintrag verworfen ({self.journal_path})")
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(valid_bytes)
+
+        return slides
+
+    def append(self, slide_id, action, slide_dict):
+        """Hängt eine Änderung an (slide_dict None = gelöscht).
+
+        Gibt True zurück, wenn eine Kompaktierung fällig ist.
+        """
+        self.sequence += 1
+        entry = {'seq': self.sequence, 'id': slide_id, 'action': action, 'slide': slide_dict}
+        self._file.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+        self.entries += 1
+        self.stats['appended'] += 1
+        return self.entries >= self.compact_entries
+
+    def compact(self, slides, base=None):
+        """Schreibt den kompletten Stand (bzw. die Abweichungen von base) als Snapshot und leert das Journal"""
+        data = {
+            'sequence': self.sequence,
+            'base': base,
+            'slides': {str(slide_id): slide_dict for slide_id, slide_dict in slides.items()}
+        }
+
+        temp_path = self.snapshot_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        self.base = base
+
+        # Erst nach dem Snapshot kürzen - ein Absturz dazwischen wird über die Sequenz erkannt
+        if self._file:
+            self._file.close()
+        self._file = open(self.journal_path, 'w', encoding='utf-8')
+        self.entries = 0
+        self.stats['compactions'] += 1
+        logger.debug(f"Content-Journal kompaktiert: {len(slides)} Slides bis Sequenz {self.sequence}")
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def get_stats(self):
+        return dict(self.stats, sequence=self.sequence, entries=self.entries)
@@ -5,11 +5,206 @@ ESP32 und Arduino GIGA Verbindungsmanagement
 """
 
 import serial
+import socket
+import struct
+import binascii
 import threading
 import time
-import queue
+import heapq
+from concurrent.futures import ThreadPoolExecutor, wait
 from core.logger import logger
 from core.config import config
+from models.telemetry import TelemetryRing
+
+# ==========================================
+# Binäres Frame-Protokoll (optional, pro Verbindung ausgehandelt)
+# ==========================================
+#
+# Frame: MAGIC | Typ (1) | Länge (1) | Payload (0..255) | CRC-16 (2, LE)
+# Die CRC (CCITT, binascii.crc_hqx) läuft über Typ, Länge und Payload.
+# 0xA5 kann in UTF-8 nie am Zeilenanfang stehen - Text-Zeilen und
+# Binär-Frames lassen sich daher im selben Datenstrom unterscheiden.
+
+FRAME_MAGIC = 0xA5
+FRAME_OVERHEAD = 5
+FRAME_TEXT = 0x01      # Beliebige Textzeile (UTF-8)
+FRAME_SIGNAL = 0x02    # <h Wert + Signal-ID
+FRAME_PAGE = 0x03      # <H Seite + <h Wert (Signal-ID "page_N")
+FRAME_UDP_SEND = 0x04  # 4 Byte IPv4 + <h Wert + Signal-ID
+FRAME_UDP_PAGE = 0x05  # 4 Byte IPv4 + <H Seite + <h Wert
+FRAME_ACK = 0x80       # Flag: Bestätigung des Frames gleichen Typs
+
+# Mindestlänge der Payload je Typ (feste Felder) - kürzere Frames werden verworfen
+FRAME_MIN_PAYLOAD = {FRAME_PAGE: 4, FRAME_UDP_PAGE: 8, FRAME_SIGNAL: 2, FRAME_UDP_SEND: 6}
+
+PROTO_REQUEST = "PROTO:BIN1"
+PROTO_ACCEPTED = "ACK:PROTO:BIN1"
+
+def encode_frame(frame_type, payload):
+    """Baut ein Binär-Frame inklusive CRC"""
+    body = bytes((frame_type, len(payload))) + payload
+    return bytes((FRAME_MAGIC,)) + body + struct.pack('<H', binascii.crc_hqx(body, 0xFFFF))
+
+def _page_number(signal_id):
+    if signal_id.startswith('page_') and signal_id[5:].isdigit():
+        page = int(signal_id[5:])
+        if page <= 0xFFFF:
+            return page
+    return None
+
+def encode_signal_frame(signal_id, value=1, target_ip=None):
+    """Kodiert SIGNAL bzw. UDP_SEND binär - None, wenn nur Text möglich ist"""
+    if not isinstance(value, int) or not -0x8000 <= value <= 0x7FFF:
+        return None
+
+    prefix = b''
+    if target_ip is not None:
+        try:
+            prefix = socket.inet_aton(target_ip)
+        except OSError:
+            return None
+
+    page = _page_number(str(signal_id))
+    if page is not None:
+        frame_type = FRAME_PAGE if target_ip is None else FRAME_UDP_PAGE
+        return encode_frame(frame_type, prefix + struct.pack('<Hh', page, value))
+
+    payload = prefix + struct.pack('<h', value) + str(signal_id).encode('utf-8')
+    if len(payload) > 0xFF:
+        return None
+    frame_type = FRAME_SIGNAL if target_ip is None else FRAME_UDP_SEND
+    return encode_frame(frame_type, payload)
+
+def parse_frame(frame_type, payload):
+    """Zerlegt ein Frame in Felder (ohne Kopie der Payload, nur struct.unpack_from)"""
+    ack = bool(frame_type & FRAME_ACK)
+    frame_type &= ~FRAME_ACK
+    if len(payload) < FRAME_MIN_PAYLOAD.get(frame_type, 0):
+        raise ValueError(f"Frame-Typ {frame_type:#04x}: Payload zu kurz ({len(payload)} Bytes)")
+
+    if frame_type == FRAME_PAGE:
+        page, value = struct.unpack_from('<Hh', payload)
+        return ack, 'SIGNAL', None, f"page_{page}", value
+    if frame_type == FRAME_UDP_PAGE:
+        page, value = struct.unpack_from('<Hh', payload, 4)
+        return ack, 'UDP_SEND', socket.inet_ntoa(payload[:4]), f"page_{page}", value
+    if frame_type == FRAME_SIGNAL:
+        value, = struct.unpack_from('<h', payload)
+        return ack, 'SIGNAL', None, str(payload[2:], 'utf-8', 'replace'), value
+    if frame_type == FRAME_UDP_SEND:
+        value, = struct.unpack_from('<h', payload, 4)
+        return ack, 'UDP_SEND', socket.inet_ntoa(payload[:4]), str(payload[6:], 'utf-8', 'replace'), value
+    return ack, 'TEXT', None, str(payload, 'utf-8', 'replace').strip(), None
+
+def frame_to_text(frame_type, payload):
+    """Kanonische Textform eines Frames bzw. einer Textzeile (für Telemetrie/UI)"""
+    if frame_type == FRAME_TEXT:
+        return str(payload, 'utf-8', 'replace').strip()
+
+    ack, command, target_ip, signal_id, value = parse_frame(frame_type, payload)
+    if command == 'SIGNAL':
+        text = f"SIGNAL:{signal_id}:{value}"
+    elif command == 'UDP_SEND':
+        text = f"UDP_SEND:{target_ip}:{signal_id}:{value}"
+    else:
+        text = signal_id
+    return f"ACK:{text}" if ack else text
+
+class FrameDecoder:
+    """Zero-Copy-Decoder für gemischte Ströme aus Textzeilen und Binär-Frames"""
+    
+    def __init__(self, max_line_length=4096):
+        self.buffer = bytearray()
+        self.max_line_length = max_line_length
+        self.crc_errors = 0
+        self.short_frames = 0  # CRC korrekt, aber Payload kürzer als die festen Felder des Typs
+        self.resync = False  # Nach CRC-Fehler: bis zum nächsten Frame/Zeilenende überspringen
+    
+    def feed(self, data, handler):
+        """Fügt Bytes hinzu und ruft handler(frame_type, payload) je Nachricht auf.
+        
+        payload ist eine memoryview in den Puffer (Textzeilen: FRAME_TEXT) und
+        nur während des Handler-Aufrufs gültig. Wirft der Handler, ist die Nachricht
+        trotzdem verbraucht - sie blockiert den Puffer nicht für spätere Aufrufe.
+        """
+        buffer = self.buffer
+        buffer += data
+        size = len(buffer)
+        position = 0
+        
+        try:
+            with memoryview(buffer) as view:
+                while position < size:
+                    if buffer[position] == FRAME_MAGIC:
+                        if size - position < FRAME_OVERHEAD:
+                            break
+                        end = position + 3 + buffer[position + 2]
+                        if end + 2 > size:
+                            break  # Frame noch unvollständig
+                        
+                        crc = binascii.crc_hqx(buffer[position + 1:end], 0xFFFF)
+                        if crc != buffer[end] | buffer[end + 1] << 8:
+                            # Störung auf der Leitung - ab dem nächsten Byte neu synchronisieren
+                            self.crc_errors += 1
+                            self.resync = True
+                            position += 1
+                            continue
+                        
+                        self.resync = False
+                        frame_type = buffer[position + 1]
+                        start, position = position + 3, end + 2  # Vor dem Handler: Frame ist verbraucht
+                        if end - start < FRAME_MIN_PAYLOAD.get(frame_type & ~FRAME_ACK, 0):
+                            # Gültige CRC, aber unvollständige Felder (fehlerhafte Firmware) - überspringen
+                            self.short_frames += 1
+                            continue
+                        
+                        payload = view[start:end]
+                        try:
+                            handler(frame_type, payload)
+                        finally:
+                            payload.release()
+                    else:
+                        newline = buffer.find(b'\n', position)
+                        if self.resync:
+                            # Reste des gestörten Frames bis zum nächsten Frame oder Zeilenende verwerfen
+                            magic = buffer.find(FRAME_MAGIC, position, newline if newline >= 0 else size)
+                            if magic >= 0:
+                                position = magic
+                                continue
+                            if newline < 0:
+                                position = size
+                                break
+                            self.resync = False
+                            position = newline + 1
+                            continue
+                        if newline < 0:
+                            break
+                        
+                        line = view[position:newline]
+                        position = newline + 1
+                        try:
+                            handler(FRAME_TEXT, line)
+                        finally:
+                            line.release()
+        finally:
+            if position:
+                del buffer[:position]
+            
+            # Schutz gegen Geräte, die nie ein Zeilenende senden
+            if len(buffer) > self.max_line_length:
+                buffer.clear()
+    
+    def decode_lines(self, data):
+        """Wie feed(), liefert aber die kanonischen Textzeilen als Liste"""
+        lines = []
+        
+        def collect(frame_type, payload):
+            line = frame_to_text(frame_type, payload)
+            if line:
+                lines.append(line)
+        
+        self.feed(data, collect)
+        return lines
 
 class HardwareConnection:
     """Basis-Klasse für Hardware-Verbindungen"""
@@ -21,8 +216,26 @@ class HardwareConnection:
         self.connection = None
         self.thread = None
         self.running = False
-        self.data_queue = queue.Queue()
-        self.status = "disconnected"
+        self.telemetry = TelemetryRing(config.hardware.get('telemetry_capacity', 4096), name)
+        self.status_listener = None  # callback(connection, old_status, new_status)
+        self._status = "disconnected"
+        self.reader_mode = config.hardware.get('reader_mode', 'blocking')
+        self.decoder = FrameDecoder()
+        self.protocol = "text"  # "binary" nach erfolgreicher Aushandlung
+        self.protocol_event = threading.Event()
+        self.io_loop = None  # AsyncHardwareLoop, falls asyncio-Backend aktiv
+    
+    @property
+    def status(self):
+        return self._status
+    
+    @status.setter
+    def status(self, value):
+        """Setzt den Status und meldet Änderungen an den Listener"""
+        old_status = self._status
+        self._status = value
+        if value != old_status and self.status_listener:
+            self.status_listener(self, old_status, value)
     
     def connect(self):
         """Verbindung zur Hardware herstellen"""
@@ -32,6 +245,10 @@ class HardwareConnection:
                 self.baud_rate, 
                 timeout=config.hardware['timeout']
             )
+            # Nach (Re-)Connect beginnt jedes Gerät wieder im Textmodus
+            self.decoder = FrameDecoder()
+            self.protocol = "text"
+            self.protocol_event.clear()
             self.status = "connected"
             logger.info(f"{self.name} verbunden auf {self.port}")
             return True
@@ -43,6 +260,18 @@ class HardwareConnection:
     def disconnect(self):
         """Verbindung trennen"""
         self.running = False
+        
+        # Vor dem Schließen aus dem asyncio-Loop abmelden
+        if self.io_loop:
+            self.io_loop.detach(self)
+        
+        # Blockierendes read() sofort aufwecken (pyserial, POSIX)
+        if self.connection and hasattr(self.connection, 'cancel_read'):
+            try:
+                self.connection.cancel_read()
+            except Exception:
+                pass
+        
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=2)
         
@@ -63,29 +292,83 @@ class HardwareConnection:
     
     def _read_loop(self):
         """Lese-Schleife für eingehende Daten"""
+        if self.reader_mode == 'poll':
+            self._read_loop_polling()
+        else:
+            self._read_loop_blocking()
+    
+    def _read_loop_blocking(self):
+        """Ereignisgesteuertes Lesen: blockiert im Port bis Bytes ankommen"""
+        while self.running and self.connection and self.connection.is_open:
+            try:
+                # read(1) wartet (bis zum Port-Timeout) auf das erste Byte,
+                # danach wird der Rest des Empfangspuffers in einem Zug gelesen
+                data = self.connection.read(max(1, self.connection.in_waiting))
+                if not data:
+                    continue
+                
+                timestamp = time.time()
+                for line in self.decoder.decode_lines(data):
+                    self._handle_line(line, timestamp)
+            except Exception as e:
+                if self.running:
+                    logger.error(f"Fehler beim Lesen von {self.name}: {e}")
+                    self.status = "error"  # z.B. USB-Kabel gezogen
+                break
+    
+    def _read_loop_polling(self):
+        """Legacy-Lese-Schleife mit 10 ms Polling"""
         while self.running and self.connection and self.connection.is_open:
             try:
                 if self.connection.in_waiting > 0:
                     data = self.connection.readline().decode('utf-8').strip()
                     if data:
-                        self.data_queue.put({
-                            'timestamp': time.time(),
-                            'source': self.name,
-                            'data': data
-                        })
+                        self._handle_line(data, time.time())
                 time.sleep(0.01)  # Kurze Pause
             except Exception as e:
                 logger.error(f"Fehler beim Lesen von {self.name}: {e}")
+                self.status = "error"
                 break
     
+    def _handle_line(self, line, timestamp):
+        """Verarbeitet eine empfangene Zeile"""
+        if line == PROTO_ACCEPTED:
+            self.protocol = "binary"
+            self.protocol_event.set()
+        self.telemetry.append(timestamp, line)
+    
+    def negotiate_protocol(self, timeout=1.0):
+        """Fragt das Binär-Protokoll an; ohne Antwort bleibt die Verbindung im Textmodus"""
+        self.protocol_event.clear()
+        if not self.send_data(PROTO_REQUEST):
+            return self.protocol
+        
+        if self.protocol_event.wait(timeout):
+            logger.info(f"{self.name}: Binär-Protokoll aktiv")
+        else:
+            logger.debug(f"{self.name}: keine Antwort auf {PROTO_REQUEST} - Textprotokoll")
+        return self.protocol
+    
     def send_data(self, data):
         """Daten an Hardware senden"""
+        return self._write(f"{data}\n".encode('utf-8'), data)
+    
+    def send_frame(self, frame, description=""):
+        """Sendet ein fertig kodiertes Binär-Frame"""
+        return self._write(frame, f"{description} [bin {len(frame)} B]")
+    
+    def _write(self, raw, description):
         if not self.connection or not self.connection.is_open:
             return False
         
+        if self.io_loop:
+            # Nicht-blockierend über den gemeinsamen Eventloop senden
+            logger.debug(f"Gesendet an {self.name}: {description}")
+            return self.io_loop.write(self, raw)
+        
         try:
-            self.connection.write(f"{data}\n".encode('utf-8'))
-            logger.debug(f"Gesendet an {self.name}: {data}")
+            self.connection.write(raw)
+            logger.debug(f"Gesendet an {self.name}: {description}")
             return True
         except Exception as e:
             logger.error(f"Fehler beim Senden an {self.name}: {e}")
@@ -102,6 +385,10 @@ class ESP32Connection(HardwareConnection):
     def send_signal(self, signal_id, value=1):
         """Sendet ein Signal an den ESP32"""
         command = f"SIGNAL:{signal_id}:{value}"
+        if self.protocol == "binary":
+            frame = encode_signal_frame(signal_id, value)
+            if frame:
+                return self.send_frame(frame, command)
         return self.send_data(command)
     
     def flash_firmware(self, firmware_path):
@@ -130,6 +417,10 @@ class GIGAConnection(HardwareConnection):
     def send_udp_signal(self, target_ip, signal_id, value):
         """Sendet UDP-Signal über GIGA"""
         command = f"UDP_SEND:{target_ip}:{signal_id}:{value}"
+        if self.protocol == "binary":
+            frame = encode_signal_frame(signal_id, value, target_ip)
+            if frame:
+                return self.send_frame(frame, command)
         return self.send_data(command)
 
 class HardwareManager:
@@ -137,52 +428,231 @@ class HardwareManager:
     
     def __init__(self):
         self.connections = {}
-        self.data_queue = queue.Queue()
         self.running = False
         self.monitor_thread = None
+        self.backend = config.hardware.get('backend', 'threads')
+        self.io_loop = None
+        self.status_listeners = []
+        self._lock = threading.Lock()
+        self._connect_pool = None
+        self._connecting = {}   # name -> Future eines laufenden Verbindungsversuchs
+        self._generation = 0    # von disconnect_all() unter dem Lock erhöht - ältere Versuche brechen ab
+        self._retry_state = {}  # name -> (nächster Versuch, aktuelle Wartezeit)
+        self._stop_event = threading.Event()
     
     def add_esp32(self, port, instance_number=1):
         """Fügt eine ESP32-Verbindung hinzu"""
         esp32 = ESP32Connection(port, instance_number)
-        self.connections[f"esp32_{instance_number}"] = esp32
+        self._register(f"esp32_{instance_number}", esp32)
         return esp32
     
     def add_giga(self, port=None):
         """Fügt eine GIGA-Verbindung hinzu"""
         giga = GIGAConnection(port)
-        self.connections["giga"] = giga
+        self._register("giga", giga)
         return giga
     
-    def connect_all(self):
-        """Verbindet alle Hardware-Geräte"""
+    def _register(self, name, connection):
+        """Nimmt eine Verbindung auf und leitet ihre Statuswechsel an die Listener weiter"""
+        connection.status_listener = lambda conn, old, new: self._notify_status(name, new)
+        self.connections[name] = connection
+    
+    def add_status_listener(self, callback):
+        """Registriert callback(name, status) für Statuswechsel (Aufruf im Hintergrund-Thread)"""
+        if callback not in self.status_listeners:
+            self.status_listeners.append(callback)
+    
+    def remove_status_listener(self, callback):
+        """Entfernt einen Status-Listener"""
+        if callback in self.status_listeners:
+            self.status_listeners.remove(callback)
+    
+    def _notify_status(self, name, status):
+        for callback in list(self.status_listeners):
+            try:
+                callback(name, status)
+            except Exception as e:
+                logger.error(f"Fehler im Status-Listener: {e}")
+    
+    def connect_all(self, deadline=None):
+        """Verbindet alle Hardware-Geräte parallel, wartet höchstens deadline Sekunden"""
+        if deadline is None:
+            deadline = config.hardware.get('connect_deadline', 3.0)
+        
+        futures = {
+            name: self._submit_connect(name, connection)
+            for name, connection in self.connections.items()
+        }
+        done, pending = wait(futures.values(), timeout=deadline)
+        
         results = {}
-        for name, connection in self.connections.items():
-            results[name] = connection.connect()
-            if results[name]:
-                connection.start_reading()
+        for name, future in futures.items():
+            results[name] = future in done and future.result()
+            if future in pending:
+                logger.warning(f"{name}: Verbindungsaufbau läuft nach {deadline}s im Hintergrund weiter")
         return results
     
-    def disconnect_all(self):
-        """Trennt alle Hardware-Verbindungen"""
+    def _submit_connect(self, name, connection):
+        """Startet einen Verbindungsversuch im Pool (höchstens einer pro Gerät)"""
+        with self._lock:
+            future = self._connecting.get(name)
+            if future is None or future.done():
+                if self._connect_pool is None:
+                    self._connect_pool = ThreadPoolExecutor(
+                        max_workers=config.hardware.get('connect_workers', 8),
+                        thread_name_prefix="HardwareConnect"
+                    )
+                future = self._connect_pool.submit(self._connect_one, connection, self._generation)
+                self._connecting[name] = future
+            return future
+    
+    def _connect_one(self, connection, generation):
+        """Öffnet einen Port und startet das Lesen (nicht mehr, wenn disconnect_all() dazwischenkam)"""
+        try:
+            if connection.connection and connection.connection.is_open:
+                # Reste einer abgebrochenen Verbindung aufräumen
+                connection.disconnect()
+            if not connection.connect():
+                return False
+            if self._cancelled(connection, generation):
+                return False
+            if not self._start_connection(connection):
+                return False
+            if self._cancelled(connection, generation):
+                return False
+            if config.hardware.get('protocol', 'text') == 'binary':
+                connection.negotiate_protocol(config.hardware.get('protocol_timeout', 1.0))
+            return True
+        except Exception as e:
+            logger.error(f"Fehler beim Verbinden mit {connection.name}: {e}")
+            return False
+    
+    def _cancelled(self, connection, generation):
+        """Schließt die Verbindung wieder, wenn disconnect_all() seit dem Einplanen lief"""
+        with self._lock:
+            cancelled = generation != self._generation
+        if cancelled:
+            connection.disconnect()
+        return cancelled
+    
+    def start_supervisor(self):
+        """Startet die Hintergrund-Überwachung: verbindet und verbindet neu mit Backoff"""
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            return
+        
+        self.running = True
+        self._stop_event.clear()
+        self.monitor_thread = threading.Thread(target=self._supervise, name="HardwareSupervisor", daemon=True)
+        self.monitor_thread.start()
+    
+    def _supervise(self):
+        """Supervisor-Schleife: fehlgeschlagene oder abgebrochene Ports erneut versuchen"""
+        interval = config.hardware.get('supervisor_interval', 0.5)
+        min_delay = config.hardware.get('reconnect_min_delay', 1.0)
+        max_delay = config.hardware.get('reconnect_max_delay', 30.0)
+        
+        while self.running:
+            now = time.monotonic()
+            for name, connection in list(self.connections.items()):
+                with self._lock:
+                    future = self._connecting.get(name)
+                    if future is not None:
+                        if not future.done():
+                            continue
+                        del self._connecting[name]
+                
+                if future is not None and not future.cancelled() and future.result():
+                    self._retry_state.pop(name, None)
+                    continue
+                
+                if future is not None:
+                    # Versuch fehlgeschlagen - Wartezeit verdoppeln
+                    _, delay = self._retry_state.get(name, (now, 0))
+                    delay = min(max_delay, delay * 2 or min_delay)
+                    self._retry_state[name] = (now + delay, delay)
+                    logger.debug(f"{name}: nächster Verbindungsversuch in {delay:.0f}s")
+                    continue
+                
+                if connection.status == "connected":
+                    continue
+                
+                next_attempt, _ = self._retry_state.get(name, (now, 0))
+                if now >= next_attempt:
+                    self._submit_connect(name, connection)
+            
+            self._stop_event.wait(interval)
+    
+    def stop_supervisor(self):
+        """Beendet die Hintergrund-Überwachung"""
         self.running = False
+        self._stop_event.set()
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            self.monitor_thread.join(timeout=2)
+        self.monitor_thread = None
+    
+    def _start_connection(self, connection):
+        """Startet das Lesen je nach Backend (Thread pro Port oder gemeinsamer Eventloop)"""
+        if self.backend == 'asyncio':
+            with self._lock:
+                if self.io_loop is None:
+                    from models.hardware_aio import AsyncHardwareLoop
+                    self.io_loop = AsyncHardwareLoop()
+            if self.io_loop.attach(connection):
+                return True
+            logger.warning(f"asyncio-Backend für {connection.name} nicht verfügbar - nutze Lese-Thread")
+        return connection.start_reading()
+    
+    def disconnect_all(self):
+        """Trennt alle Hardware-Verbindungen (auch solche, die gerade noch aufgebaut werden)"""
+        self.stop_supervisor()
+        
+        # Laufende Versuche starten ab hier keinen Reader mehr, wartende werden verworfen
+        with self._lock:
+            self._generation += 1
+            pool, self._connect_pool = self._connect_pool, None
+            in_flight = list(self._connecting.values())
+            self._connecting.clear()
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        # Erst nach den laufenden Versuchen trennen - sonst bleibt ein gerade geöffneter Port offen
+        done, pending = wait(in_flight, timeout=config.hardware.get('disconnect_timeout', 2.0))
+        if pending:
+            logger.warning(f"{len(pending)} Verbindungsversuch(e) laufen noch - sie schließen ihren Port selbst")
+        
         for connection in self.connections.values():
             connection.disconnect()
+        
+        if self.io_loop:
+            self.io_loop.stop()
     
     def get_connection(self, name):
         """Gibt eine spezifische Verbindung zurück"""
         return self.connections.get(name)
     
     def get_all_data(self):
-        """Sammelt Daten von allen Verbindungen"""
-        all_data = []
-        for connection in self.connections.values():
-            while not connection.data_queue.empty():
-                try:
-                    data = connection.data_queue.get_nowait()
-                    all_data.append(data)
-                except queue.Empty:
-                    break
-        return all_data
+        """Sammelt neue Daten von allen Verbindungen (zeitlich sortiert)"""
+        return list(heapq.merge(
+            *(connection.telemetry.read_new() for connection in self.connections.values()),
+            key=lambda entry: entry['timestamp']
+        ))
+    
+    def get_telemetry_summary(self, window=10.0):
+        """Füllstand, Verluste und Nachrichtenrate (letzte window Sekunden) pro Gerät"""
+        now = time.time()
+        summary = {}
+        for name, connection in self.connections.items():
+            stats = connection.telemetry.get_stats()
+            stats['rate'] = connection.telemetry.count(now - window, now) / window
+            summary[name] = stats
+        return summary
+    
+    def subscribe(self, callback, source=None):
+        """Abonniert neue Zeilen (nur asyncio-Backend); gibt eine Abmelde-Funktion zurück"""
+        if self.io_loop is None:
+            logger.warning("Hardware-Abonnements erfordern hardware['backend'] = 'asyncio'")
+            return None
+        return self.io_loop.subscribe(callback, source)
     
     def get_status_summary(self):
         """Gibt eine Übersicht aller Verbindungsstatus zurück"""
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Asyncio Hardware-Backend für Dynamic Messe Stand V4
+Ein Eventloop-Thread für alle seriellen Verbindungen statt eines Threads pro Port
+"""
+
+import os
+import time
+import asyncio
+import threading
+from core.logger import logger
+
+class AsyncHardwareLoop:
+    """Nicht-blockierendes Lesen/Schreiben aller Ports in einem asyncio-Eventloop"""
+
+    def __init__(self, subscriber_queue_size=1000):
+        self.loop = None
+        self.thread = None
+        self.subscriber_queue_size = subscriber_queue_size
+        self._ready = threading.Event()
+        self._start_lock = threading.Lock()
+        self._lock = threading.Lock()  # _callbacks und _attached - auch von außerhalb des Loops genutzt
+        self._callbacks = []  # (callback, source) - laufen im Loop-Thread
+        self._queues = []     # (asyncio.Queue, source) - für await-Konsumenten (nur Loop-Thread)
+        self._attached = {}   # fd -> Verbindung (nur im Loop-Thread geändert)
+        self._write_buffers = {}  # fd -> bytearray (noch nicht geschriebene Bytes)
+        self.stats = {
+            'lines_received': 0,
+            'bytes_written': 0,
+            'subscriber_drops': 0
+        }
+
+    # ------------------------------------------
+    # Loop-Lebenszyklus
+    # ------------------------------------------
+
+    def start(self):
+        """Startet den Eventloop in seinem eigenen (einzigen) Thread"""
+        with self._start_lock:
+            if self.is_running():
+                return True
+
+            self._ready.clear()
+            self.thread = threading.Thread(target=self._run, name="HardwareIOLoop", daemon=True)
+            self.thread.start()
+            return self._ready.wait(timeout=5)
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def stop(self):
+        """Löst alle Ports vom Loop und beendet ihn"""
+        if not self.is_running():
+            return
+
+        with self._lock:
+            connections = list(self._attached.values())
+        for connection in connections:
+            self.detach(connection)
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=2)
+        self.thread = None
+
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive() and self.loop is not None
+
+    def _call(self, func, *args):
+        """Führt func im Loop-Thread aus und wartet auf das Ergebnis"""
+        if threading.current_thread() is self.thread:
+            return func(*args)
+
+        async def runner():
+            return func(*args)
+
+        return asyncio.run_coroutine_threadsafe(runner(), self.loop).result(timeout=5)
+
+    # ------------------------------------------
+    # Verbindungen an-/abmelden
+    # ------------------------------------------
+
+    def attach(self, connection):
+        """Registriert eine geöffnete Verbindung beim Loop (statt Lese-Thread)"""
+        if not connection.connection or not connection.connection.is_open:
+            return False
+        if not self.start():
+            return False
+
+        try:
+            self._call(self._attach, connection)
+            connection.io_loop = self
+            return True
+        except Exception as e:
+            logger.error(f"Fehler beim Registrieren von {connection.name} im IO-Loop: {e}")
+            return False
+
+    def _attach(self, connection):
+        fd = connection.connection.fileno()
+        os.set_blocking(fd, False)
+        with self._lock:
+            self._attached[fd] = connection
+        self.loop.add_reader(fd, self._on_readable, fd)
+
+    def detach(self, connection):
+        """Entfernt eine Verbindung aus dem Loop (vor dem Schließen des Ports)"""
+        if self.is_running():
+            try:
+                self._call(self._detach, connection)
+            except Exception as e:
+                logger.debug(f"Fehler beim Abmelden von {connection.name}: {e}")
+        connection.io_loop = None
+
+    def _detach(self, connection):
+        with self._lock:
+            fds = [fd for fd, attached in self._attached.items() if attached is connection]
+            for fd in fds:
+                del self._attached[fd]
+        for fd in fds:
+            self.loop.remove_reader(fd)
+            self.loop.remove_writer(fd)
+            self._write_buffers.pop(fd, None)
+
+        # Auch nach Lese-/Schreibfehler: send_data darf nicht mehr in den Loop schreiben
+        if connection.io_loop is self:
+            connection.io_loop = None
+
+    # ------------------------------------------
+    # Lesen
+    # ------------------------------------------
+
+    def _on_readable(self, fd):
+        """Reader-Callback: liest alles Verfügbare ohne zu blockieren"""
+        connection = self._attached.get(fd)
+        if connection is None:
+            return
+
+        try:
+            data = os.read(fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            logger.error(f"Fehler beim Lesen von {connection.name}: {e}")
+            connection.status = "error"
+            self._detach(connection)
+            return
+
+        if not data:
+            # Gerät abgezogen (EOF)
+            connection.status = "error"
+            self._detach(connection)
+            return
+
+        timestamp = time.time()
+        for line in connection.decoder.decode_lines(data):
+            connection._handle_line(line, timestamp)
+            self._publish({
+                'timestamp': timestamp,
+                'source': connection.name,
+                'data': line
+            })
+
+    def _publish(self, entry):
+        """Verteilt einen Eintrag an die Abonnenten"""
+        self.stats['lines_received'] += 1
+
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback, source in callbacks:
+            if source is None or source == entry['source']:
+                try:
+                    callback(entry)
+                except Exception as e:
+                    logger.error(f"Fehler im Hardware-Abonnenten: {e}")
+
+        for data_queue, source in self._queues:
+            if source is None or source == entry['source']:
+                try:
+                    data_queue.put_nowait(entry)
+                except asyncio.QueueFull:
+                    self.stats['subscriber_drops'] += 1
+
+    def subscribe(self, callback, source=None):
+        """Registriert callback(entry) für neue Zeilen; gibt eine Abmelde-Funktion zurück"""
+        subscription = (callback, source)
+        with self._lock:
+            self._callbacks.append(subscription)
+
+        def unsubscribe():
+            with self._lock:
+                if subscription in self._callbacks:
+                    self._callbacks.remove(subscription)
+
+        return unsubscribe
+
+    async def stream(self, source=None):
+        """Async-Generator über alle neuen Zeilen (optional nur einer Quelle)"""
+        data_queue = asyncio.Queue(maxsize=self.subscriber_queue_size)
+        subscription = (data_queue, source)
+        self._queues.append(subscription)
+        try:
+            while True:
+                yield await data_queue.get()
+        finally:
+            self._queues.remove(subscription)
+
+    async def next_data(self, source=None):
+        """Wartet auf die nächste Zeile (optional nur einer Quelle)"""
+        stream = self.stream(source)
+        try:
+            return await stream.__anext__()
+        finally:
+            await stream.aclose()
+
+    def wait_for_data(self, source=None, timeout=None):
+        """Synchroner Wrapper um next_data() für Aufrufer außerhalb des Loops"""
+        if not self.is_running():
+            return None
+        future = asyncio.run_coroutine_threadsafe(self.next_data(source), self.loop)
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            future.cancel()
+            return None
+
+    # ------------------------------------------
+    # Schreiben
+    # ------------------------------------------
+
+    def write(self, connection, data):
+        """Reiht Bytes zum nicht-blockierenden Senden ein (threadsicher).
+
+        False, wenn der Loop nicht läuft oder die Verbindung nicht (mehr) registriert ist.
+        """
+        if not self.is_running() or self._find_fd(connection) is None:
+            return False
+        self.loop.call_soon_threadsafe(self._write, connection, data)
+        return True
+
+    async def send(self, connection, data):
+        """Awaitable Variante von write() für Code im Loop"""
+        self._write(connection, data)
+
+    def _write(self, connection, data):
+        fd = self._find_fd(connection)
+        if fd is None:
+            return
+
+        buffer = self._write_buffers.get(fd)
+        if buffer:
+            # Es wartet schon etwas - Reihenfolge beibehalten
+            buffer += data
+            return
+
+        written = self._write_now(fd, connection, data)
+        if written is not None and written < len(data):
+            self._write_buffers[fd] = bytearray(data[written:])
+            self.loop.add_writer(fd, self._on_writable, fd)
+
+    def _on_writable(self, fd):
+        """Writer-Callback: schreibt gepufferte Bytes sobald der Port bereit ist"""
+        connection = self._attached.get(fd)
+        buffer = self._write_buffers.get(fd)
+        if connection is None or not buffer:
+            self.loop.remove_writer(fd)
+            self._write_buffers.pop(fd, None)
+            return
+
+        written = self._write_now(fd, connection, buffer)
+        if written:
+            del buffer[:written]
+        if not buffer:
+            self.loop.remove_writer(fd)
+            self._write_buffers.pop(fd, None)
+
+    def _write_now(self, fd, connection, data):
+        try:
+            written = os.write(fd, data)
+            self.stats['bytes_written'] += written
+            return written
+        except BlockingIOError:
+            return 0
+        except OSError as e:
+            logger.error(f"Fehler beim Senden an {connection.name}: {e}")
+            connection.status = "error"
+            self._detach(connection)
+            return None
+
+    def _find_fd(self, connection):
+        with self._lock:
+            for fd, attached in self._attached.items():
+                if attached is connection:
+                    return fd
+        return None
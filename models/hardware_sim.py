@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Hardware-Simulator für Dynamic Messe Stand V4
+Simulierte ESP32-/GIGA-Boards auf PTY-Paaren für Tests und Benchmarks ohne echte Hardware
+
+Aufruf als eigener Prozess (z.B. für Benchmarks):
+    python -m models.hardware_sim --esp32 3 --giga --rate 100 --jitter 0.2
+Die erste Ausgabezeile enthält die PTY-Ports als JSON.
+"""
+
+import os
+import sys
+import pty
+import tty
+import json
+import time
+import random
+import select
+import argparse
+import threading
+from core.logger import logger
+from models.hardware import (
+    FrameDecoder, FRAME_TEXT, FRAME_ACK, PROTO_REQUEST, PROTO_ACCEPTED,
+    encode_frame, frame_to_text
+)
+
+class SimulatedDevice:
+    """Ein simuliertes Board am Master-Ende eines PTY-Paares"""
+
+    def __init__(self, kind='esp32', name=None, chatter_rate=0.0, jitter=0.0):
+        self.kind = kind
+        self.name = name or kind
+        self.chatter_rate = chatter_rate  # Nachrichten pro Sekunde (0 = still)
+        self.jitter = jitter              # Relative Schwankung des Sendeintervalls (0..1)
+        self.master, self.slave = pty.openpty()
+        tty.setraw(self.slave)
+        os.set_blocking(self.master, False)
+        self.port = os.ttyname(self.slave)
+        self.running = False
+        self.thread = None
+        self.signals = {}
+        self.udp_enabled = False
+        self.binary = False  # Binär-Protokoll ausgehandelt
+        self.commands = []
+        self.stats = {'chatter_sent': 0, 'commands': 0, 'replies': 0, 'dropped': 0}
+
+    def start(self):
+        """Startet den Simulations-Thread"""
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name=f"Sim-{self.name}", daemon=True)
+        self.thread.start()
+        return self.port
+
+    def stop(self):
+        """Beendet die Simulation und schließt das PTY-Paar"""
+        self.running = False
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=1)
+        for fd in (self.master, self.slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _run(self):
+        decoder = FrameDecoder()
+        next_chatter = time.monotonic()
+
+        while self.running:
+            now = time.monotonic()
+            timeout = max(0.0, next_chatter - now) if self.chatter_rate else 0.1
+
+            try:
+                readable, _, _ = select.select([self.master], [], [], timeout)
+                if readable:
+                    decoder.feed(os.read(self.master, 4096), self._on_frame)
+            except BlockingIOError:
+                pass
+            except OSError:
+                break  # PTY geschlossen
+
+            if not self.chatter_rate:
+                continue
+
+            # Rückstand aufholen, aber nicht länger als 1 s nachsenden
+            now = time.monotonic()
+            if now - next_chatter > 1.0:
+                next_chatter = now
+            while now >= next_chatter:
+                self._write(self._chatter_line())
+                self.stats['chatter_sent'] += 1
+                interval = 1.0 / self.chatter_rate
+                next_chatter += interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _chatter_line(self):
+        """Unaufgeforderte Statuszeile mit Sendezeitpunkt (für Latenzmessung)"""
+        prefix = 'SENSOR' if self.kind == 'esp32' else 'UDP_RX'
+        return f"{prefix}:{self.stats['chatter_sent']}:{time.time():.6f}"
+
+    def _on_frame(self, frame_type, payload):
+        """Empfängt Textzeilen und Binär-Frames; Binär-Befehle werden binär bestätigt"""
+        line = frame_to_text(frame_type, payload)
+        if not line:
+            return
+        if frame_type == FRAME_TEXT:
+            self._handle_command(line)
+        else:
+            self._handle_command(line, (frame_type, bytes(payload)))
+
+    def _handle_command(self, line, binary_frame=None):
+        """Emuliert das ESP32 SIGNAL:- bzw. GIGA UDP_SEND:-Protokoll"""
+        self.stats['commands'] += 1
+        if line == PROTO_REQUEST:
+            self.binary = True
+            self._write(PROTO_ACCEPTED)
+            self.stats['replies'] += 1
+            return
+
+        self.commands.append(line)
+        parts = line.split(':')
+
+        if self.kind == 'esp32' and parts[0] == 'SIGNAL' and len(parts) == 3:
+            self.signals[parts[1]] = parts[2]
+            reply = f"ACK:{line}"
+        elif self.kind == 'giga' and parts[0] == 'UDP_SEND' and len(parts) == 4:
+            reply = f"ACK:{line}" if self.udp_enabled else f"ERR:UDP_DISABLED:{line}"
+        elif self.kind == 'giga' and line in ('UDP_ENABLE', 'UDP_DISABLE'):
+            self.udp_enabled = line == 'UDP_ENABLE'
+            reply = f"ACK:{line}"
+        else:
+            reply = f"ERR:UNKNOWN:{line}"
+
+        if binary_frame and reply.startswith('ACK:'):
+            frame_type, payload = binary_frame
+            self._write_raw(encode_frame(frame_type | FRAME_ACK, payload))
+        else:
+            self._write(reply)
+        self.stats['replies'] += 1
+
+    def _write(self, line):
+        self._write_raw(f"{line}\n".encode('utf-8'))
+
+    def _write_raw(self, data):
+        try:
+            os.write(self.master, data)
+        except BlockingIOError:
+            # Empfänger liest nicht - wie ein volles UART-FIFO verwerfen
+            self.stats['dropped'] += 1
+        except OSError:
+            self.running = False
+
+class DeviceSimulator:
+    """Verwaltet einen Satz simulierter Boards"""
+
+    def __init__(self):
+        self.devices = {}
+
+    def add_device(self, name, kind, chatter_rate=0.0, jitter=0.0):
+        """Erzeugt und startet ein simuliertes Board; gibt den Port zurück"""
+        device = SimulatedDevice(kind, name, chatter_rate, jitter)
+        self.devices[name] = device
+        return device.start()
+
+    def start_default(self, esp32_count=3, giga=True, chatter_rate=0.0, jitter=0.0):
+        """Startet die Standard-Standbestückung und gibt passende config.hardware-Ports zurück"""
+        ports = {}
+        for i in range(1, esp32_count + 1):
+            ports[f'esp32_{i}_port'] = self.add_device(f'esp32_{i}', 'esp32', chatter_rate, jitter)
+        if giga:
+            ports['giga_port'] = self.add_device('giga', 'giga', chatter_rate, jitter)
+
+        logger.info(f"🧪 {len(ports)} simulierte Geräte gestartet")
+        return ports
+
+    def stop_all(self):
+        """Beendet alle simulierten Boards"""
+        for device in self.devices.values():
+            device.stop()
+        self.devices.clear()
+
+    def get_stats(self):
+        return {name: dict(device.stats) for name, device in self.devices.items()}
+
+# Globale Simulator-Instanz
+device_simulator = DeviceSimulator()
+
+def main():
+    """Simulator als eigenständiger Prozess (Ports als JSON auf stdout)"""
+    parser = argparse.ArgumentParser(description='Hardware-Simulator (PTY)')
+    parser.add_argument('--esp32', type=int, default=3, help='Anzahl simulierter ESP32')
+    parser.add_argument('--giga', action='store_true', help='Arduino GIGA simulieren')
+    parser.add_argument('--rate', type=float, default=10.0, help='Statuszeilen pro Sekunde und Gerät')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Relative Schwankung des Intervalls (0..1)')
+    parser.add_argument('--duration', type=float, default=0, help='Laufzeit in Sekunden (0 = bis Strg+C)')
+    args = parser.parse_args()
+
+    ports = device_simulator.start_default(args.esp32, args.giga, args.rate, args.jitter)
+    print(json.dumps(ports), flush=True)
+
+    try:
+        if args.duration:
+            time.sleep(args.duration)
+        else:
+            while True:
+                time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(device_simulator.get_stats()), flush=True)
+        device_simulator.stop_all()
+
+if __name__ == "__main__":
+    sys.exit(main())
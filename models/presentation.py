@@ -5,12 +5,14 @@ Speichern und Laden von kompletten Präsentationen als JSON/YAML
 """
 
 import json
-import yaml
 import os
 from datetime import datetime
 from tkinter import filedialog, messagebox
+from core import compression, yaml_io
+from core.config import config
 from core.logger import logger
 from models.content import content_manager
+from models.slide_store import CONTAINER_EXTENSION, is_container
 
 class PresentationManager:
     """Verwaltet das Speichern und Laden von kompletten Präsentationen"""
@@ -72,14 +74,16 @@ class PresentationManager:
                     defaultextension=".json",
                     filetypes=[
                         ("JSON-Dateien", "*.json"),
+                        ("Komprimierte JSON-Dateien", self.compressed_patterns('.json')),
                         ("Alle Dateien", "*.*")
                     ],
                     initialdir=self.presentations_dir,
-                    initialname=f"bumbleb_presentation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                    initialname=self.default_filename('.json')
                 )
             
             if filename:
-                with open(filename, 'w', encoding='utf-8') as f:
+                # Endung .gz/.xz/.zst: beim Schreiben gestreamt komprimiert
+                with compression.open_text(filename, 'w') as f:
                     json.dump(presentation_data, f, indent=2, ensure_ascii=False)
                 
                 logger.info(f"Präsentation als JSON gespeichert: {filename}")
@@ -150,15 +154,16 @@ class PresentationManager:
                     filetypes=[
                         ("YAML-Dateien", "*.yaml"),
                         ("YML-Dateien", "*.yml"),
+                        ("Komprimierte YAML-Dateien", self.compressed_patterns('.yaml')),
                         ("Alle Dateien", "*.*")
                     ],
                     initialdir=self.presentations_dir,
-                    initialname=f"bumbleb_presentation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.yaml"
+                    initialname=self.default_filename('.yaml')
                 )
             
             if filename:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    yaml.dump(presentation_data, f, default_flow_style=False, allow_unicode=True, indent=2)
+                with compression.open_text(filename, 'w') as f:
+                    yaml_io.dump(presentation_data, f)
                 
                 logger.info(f"Präsentation als YAML gespeichert: {filename}")
                 messagebox.showinfo(
@@ -182,9 +187,12 @@ class PresentationManager:
                 filename = filedialog.askopenfilename(
                     title="Präsentation laden",
                     filetypes=[
-                        ("Präsentations-Dateien", "*.json *.yaml *.yml"),
-                        ("JSON-Dateien", "*.json"),
-                        ("YAML-Dateien", "*.yaml *.yml"),
+                        ("Präsentations-Dateien",
+                         f"*.json *.yaml *.yml *{CONTAINER_EXTENSION} "
+                         + " ".join(self.compressed_patterns(ext) for ext in ('.json', '.yaml', '.yml'))),
+                        ("Präsentations-Container", f"*{CONTAINER_EXTENSION}"),
+                        ("JSON-Dateien", "*.json " + self.compressed_patterns('.json')),
+                        ("YAML-Dateien", "*.yaml *.yml " + self.compressed_patterns('.yaml')),
                         ("Alle Dateien", "*.*")
                     ],
                     initialdir=self.presentations_dir
@@ -193,14 +201,18 @@ class PresentationManager:
             if not filename or not os.path.exists(filename):
                 return False
             
-            # Dateiformat bestimmen
-            file_ext = os.path.splitext(filename)[1].lower()
+            # Container: nur Index + erste Slide lesen, Rest bei Zugriff
+            if is_container(filename):
+                return self.load_presentation_container(filename)
+            
+            # Dateiformat bestimmen (x.json.gz -> .json; Kompression erkennt open_text am Dateikopf)
+            file_ext = compression.base_extension(filename)
             
-            with open(filename, 'r', encoding='utf-8') as f:
+            with compression.open_text(filename) as f:
                 if file_ext == '.json':
                     data = json.load(f)
                 elif file_ext in ['.yaml', '.yml']:
-                    data = yaml.safe_load(f)
+                    data = yaml_io.load(f)
                 else:
                     raise ValueError(f"Unbekanntes Dateiformat: {file_ext}")
             
@@ -229,6 +241,26 @@ class PresentationManager:
         
         return False
     
+    def load_presentation_container(self, filename):
+        """Lädt einen Präsentations-Container (ersetzt alle bestehenden Folien)"""
+        if not content_manager.load_from_file(filename):
+            messagebox.showerror("Import-Fehler", f"Container konnte nicht geladen werden:\n{filename}")
+            return False
+        
+        self.current_presentation = filename
+        
+        from services.demo import demo_service
+        demo_service.reset_to_first_slide()
+        
+        messagebox.showinfo(
+            "Import erfolgreich",
+            f"Präsentation wurde erfolgreich geladen:\n{os.path.basename(filename)}\n\n"
+            f"Folien: {content_manager.get_slide_count()}\n"
+            f"Format: Container"
+        )
+        logger.info(f"Präsentations-Container geladen: {filename}")
+        return True
+    
     def validate_presentation_data(self, data):
         """Validiert die Struktur der Präsentationsdaten"""
         try:
@@ -317,6 +349,16 @@ class PresentationManager:
             logger.error(f"Fehler beim Importieren der Slides: {e}")
             raise
     
+    def compressed_patterns(self, extension):
+        """Dateimuster für komprimierte Varianten, z.B. '*.json.gz *.json.xz'"""
+        return " ".join(f"*{extension}{compression.extension_for(codec)}"
+                        for codec in compression.available_codecs())
+    
+    def default_filename(self, extension):
+        """Vorschlag für den Dateinamen, komprimiert laut config.storage['presentation_compression']"""
+        suffix = compression.extension_for(config.storage.get('presentation_compression'))
+        return f"bumbleb_presentation_{datetime.now().strftime('%Y%m%d_%H%M%S')}{extension}{suffix}"
+    
     def get_available_presentations(self):
         """Gibt eine Liste verfügbarer Präsentationen zurück"""
         presentations = []
@@ -324,7 +366,7 @@ class PresentationManager:
         try:
             if os.path.exists(self.presentations_dir):
                 for filename in os.listdir(self.presentations_dir):
-                    if filename.endswith(('.json', '.yaml', '.yml')):
+                    if compression.split_extension(filename)[0].endswith(('.json', '.yaml', '.yml', CONTAINER_EXTENSION)):
                         filepath = os.path.join(self.presentations_dir, filename)
                         stat = os.stat(filepath)
                         presentations.append({
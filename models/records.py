@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Slide-Records für Dynamic Messe Stand V4
+Kompakte __slots__-Klassen für Canvas-Elemente mit dict-kompatiblem Lesezugriff
+"""
+
+_MISSING = object()
+
+class CanvasElement:
+    """Basis aller Canvas-Elemente.
+
+    Nur gesetzte Felder belegen Speicher; unbekannte Schlüssel aus Legacy-Dicts landen in
+    extra. get()/[]/in funktionieren wie beim bisherigen dict, damit Renderer und
+    Bild-Cache unverändert bleiben.
+    """
+
+    __slots__ = ('extra',)
+    TYPE = None
+    WIDGET_TYPE = None
+    FIELDS = ()
+    _FIELD_SET = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    def __init__(self, data=None, **fields):
+        self.extra = None
+        if data:
+            fields = dict(data, **fields) if fields else data
+
+        # Direkter Pfad ohne __setitem__ (Laden großer Decks)
+        field_set = self._FIELD_SET
+        for key, value in fields.items():
+            if key in field_set:
+                setattr(self, key, value)
+            elif key != 'type' and key != 'widget_type':
+                if self.extra is None:
+                    self.extra = {}
+                self.extra[key] = value
+
+    def get(self, key, default=None):
+        if key == 'type':
+            return self.TYPE
+        if key == 'widget_type' and self.WIDGET_TYPE:
+            return self.WIDGET_TYPE
+        if key in self._FIELD_SET:
+            return getattr(self, key, default)
+        if self.extra:
+            return self.extra.get(key, default)
+        return default
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+        elif key == 'type' or (key == 'widget_type' and self.WIDGET_TYPE):
+            pass  # Durch die Klasse festgelegt
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._FIELD_SET and hasattr(self, key):
+            delattr(self, key)
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def items(self):
+        return self.to_dict().items()
+
+    def to_dict(self):
+        """Serialisiert nur gesetzte Felder (Schlüssel wie im bisherigen dict-Format)"""
+        data = {'type': self.TYPE}
+        if self.WIDGET_TYPE:
+            data['widget_type'] = self.WIDGET_TYPE
+        for key in self.FIELDS:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                data[key] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __eq__(self, other):
+        if isinstance(other, (CanvasElement, dict)):
+            return self.to_dict() == (other.to_dict() if isinstance(other, CanvasElement) else other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+class TextElement(CanvasElement):
+    """Freier Text aus dem Creator (type 'text')"""
+    __slots__ = FIELDS = ('id', 'content', 'x', 'y', 'font', 'is_title')
+    TYPE = 'text'
+
+class TextWidgetElement(CanvasElement):
+    """Eingebettetes Text-Widget (type 'window', widget_type 'Text')"""
+    __slots__ = FIELDS = ('id', 'text', 'coords', 'font', 'fg', 'bg', 'width', 'height')
+    TYPE = 'window'
+    WIDGET_TYPE = 'Text'
+
+class LabelElement(CanvasElement):
+    """Eingebettetes Label (type 'window', widget_type 'Label')"""
+    __slots__ = FIELDS = ('id', 'text', 'coords', 'font', 'fg', 'bg', 'anchor', 'justify')
+    TYPE = 'window'
+    WIDGET_TYPE = 'Label'
+
+class ImageElement(CanvasElement):
+    """Bild aus Blob-Store (image_hash), Datei oder Legacy-Base64 (type 'image')"""
+    __slots__ = FIELDS = ('id', 'x', 'y', 'width', 'height', 'file_path', 'image_hash', 'image_data')
+    TYPE = 'image'
+
+class RectangleElement(CanvasElement):
+    """Rechteck (type 'rectangle')"""
+    __slots__ = FIELDS = ('id', 'coords', 'fill', 'outline', 'width')
+    TYPE = 'rectangle'
+
+class GenericElement(CanvasElement):
+    """Unbekannte Element-Typen - Typ und Felder bleiben unverändert erhalten"""
+    __slots__ = ('element_type', 'widget_type_value')
+    FIELDS = ()
+
+    def __init__(self, data=None, **fields):
+        self.extra = None
+        self.element_type = None
+        self.widget_type_value = None
+        if data:
+            fields = dict(data, **fields) if fields else data
+        for key, value in fields.items():
+            self[key] = value
+
+    def get(self, key, default=None):
+        if key == 'type':
+            return self.element_type
+        if key == 'widget_type' and self.widget_type_value is not None:
+            return self.widget_type_value
+        return super().get(key, default)
+
+    def __setitem__(self, key, value):
+        if key == 'type':
+            self.element_type = value
+        elif key == 'widget_type':
+            self.widget_type_value = value
+        else:
+            super().__setitem__(key, value)
+
+    def to_dict(self):
+        data = {'type': self.element_type}
+        if self.widget_type_value is not None:
+            data['widget_type'] = self.widget_type_value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+_ELEMENT_CLASSES = {
+    ('text', None): TextElement,
+    ('window', 'Text'): TextWidgetElement,
+    ('window', 'Label'): LabelElement,
+    ('image', None): ImageElement,
+    ('rectangle', None): RectangleElement,
+}
+
+def element_from_dict(data):
+    """Wandelt ein (Legacy-)dict in das passende Record-Objekt um"""
+    if isinstance(data, CanvasElement):
+        return data
+    element_type = data.get('type')
+    widget_type = data.get('widget_type', 'Text') if element_type == 'window' else None
+    cls = _ELEMENT_CLASSES.get((element_type, widget_type), GenericElement)
+    if cls is not GenericElement and element_type == 'window' and 'widget_type' not in data:
+        return GenericElement(data)  # Ohne widget_type exakt so wieder ausgeben
+    return cls(data)
+
+def elements_from_dicts(elements):
+    return [element_from_dict(element) for element in elements or ()]
+
+def elements_to_dicts(elements):
+    return [element.to_dict() if isinstance(element, CanvasElement) else element for element in elements]
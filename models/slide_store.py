@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Slide Store für Dynamic Messe Stand V4
+Präsentations-Container mit Slide-Index und bedarfsgesteuert geladenen Slides
+"""
+
+import os
+import json
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
+from datetime import datetime
+from core.logger import logger
+
+CONTAINER_EXTENSION = ".dmsp"
+CONTAINER_MAGIC = b"DMSPRES1"
+# Header: Magic, Offset und Länge des Index am Dateiende
+CONTAINER_HEADER = struct.Struct("<8sQI")
+
+def is_container(filepath):
+    """Prüft anhand der Magic-Bytes, ob die Datei ein Präsentations-Container ist"""
+    try:
+        with open(filepath, 'rb') as f:
+            return f.read(len(CONTAINER_MAGIC)) == CONTAINER_MAGIC
+    except OSError:
+        return False
+
+def write_container(filepath, slide_dicts, metadata=None):
+    """Schreibt Slides als Container: Header, ein JSON-Record pro Slide, Index am Ende.
+
+    slide_dicts: iterierbar über (slide_id, slide_dict) in Präsentationsreihenfolge.
+    """
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    entries = []
+    temp_path = filepath + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(b'\0' * CONTAINER_HEADER.size)
+        for slide_id, slide_dict in slide_dicts:
+            record = json.dumps(slide_dict, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            entries.append([slide_id, f.tell(), len(record), slide_dict.get('title', '')])
+            f.write(record)
+
+        index = json.dumps({
+            'version': 1,
+            'metadata': dict(metadata or {}, created_at=datetime.now().isoformat()),
+            'slides': entries
+        }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        index_offset = f.tell()
+        f.write(index)
+        f.seek(0)
+        f.write(CONTAINER_HEADER.pack(CONTAINER_MAGIC, index_offset, len(index)))
+    os.replace(temp_path, filepath)
+    return len(entries)
+
+class PresentationContainer:
+    """Lesezugriff auf einen Container - beim Öffnen wird nur der Index gelesen"""
+
+    def __init__(self, filepath):
+        self.path = os.path.abspath(filepath)
+        self._fd = os.open(self.path, os.O_RDONLY)
+        try:
+            magic, index_offset, index_length = CONTAINER_HEADER.unpack(
+                os.pread(self._fd, CONTAINER_HEADER.size, 0))
+            if magic != CONTAINER_MAGIC:
+                raise ValueError(f"Kein Präsentations-Container: {filepath}")
+            index = json.loads(os.pread(self._fd, index_length, index_offset))
+        except Exception:
+            os.close(self._fd)
+            raise
+
+        self.metadata = index.get('metadata', {})
+        # slide_id -> (offset, length, title), in Präsentationsreihenfolge
+        self.index = OrderedDict(
+            (slide_id, (offset, length, title)) for slide_id, offset, length, title in index['slides']
+        )
+
+    @property
+    def slide_ids(self):
+        return list(self.index)
+
+    def record_size(self, slide_id):
+        return self.index[slide_id][1]
+
+    def read_slide(self, slide_id):
+        """Liest und parst genau einen Slide-Record (positionelles Lesen, threadsicher)"""
+        offset, length, _ = self.index[slide_id]
+        return json.loads(os.pread(self._fd, length, offset))
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+class LazySlideStore(MutableMapping):
+    """Dict-Ersatz für EnhancedContentManager.slides über einem Container.
+
+    Slides werden beim ersten Zugriff materialisiert. Unveränderte Slides liegen in einem
+    LRU und werden bei Überschreiten von max_slides/max_bytes wieder freigegeben (beim
+    nächsten Zugriff neu gelesen). Geänderte Slides (mark_dirty/Zuweisung) bleiben im Speicher.
+    """
+
+    def __init__(self, container, factory, max_slides=64, max_bytes=64 * 1024 * 1024):
+        self.container = container
+        self.factory = factory  # slide_dict -> SlideData
+        self.max_slides = max_slides
+        self.max_bytes = max_bytes
+        self._ids = dict.fromkeys(container.slide_ids)  # Reihenfolge aller vorhandenen Slides
+        self._loaded = OrderedDict()  # slide_id -> SlideData (unverändert, freigebbar)
+        self._loaded_bytes = 0
+        self._pinned = {}  # slide_id -> SlideData (geändert oder neu)
+        self._lock = threading.RLock()
+        self.stats = {'materialized': 0, 'released': 0}
+
+    def __getitem__(self, slide_id):
+        with self._lock:
+            slide = self._pinned.get(slide_id)
+            if slide is not None:
+                return slide
+
+            slide = self._loaded.get(slide_id)
+            if slide is not None:
+                self._loaded.move_to_end(slide_id)
+                return slide
+
+            if slide_id not in self._ids:
+                raise KeyError(slide_id)
+
+            slide = self.factory(self.container.read_slide(slide_id))
+            self.stats['materialized'] += 1
+            self._loaded[slide_id] = slide
+            self._loaded_bytes += self.container.record_size(slide_id)
+            self._release()
+            return slide
+
+    def __setitem__(self, slide_id, slide):
+        with self._lock:
+            self._drop_loaded(slide_id)
+            self._ids[slide_id] = None
+            self._pinned[slide_id] = slide
+
+    def __delitem__(self, slide_id):
+        with self._lock:
+            if slide_id not in self._ids:
+                raise KeyError(slide_id)
+            del self._ids[slide_id]
+            self._pinned.pop(slide_id, None)
+            self._drop_loaded(slide_id)
+
+    def __contains__(self, slide_id):
+        return slide_id in self._ids
+
+    def __iter__(self):
+        return iter(list(self._ids))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def mark_dirty(self, slide_id):
+        """Hält eine (in-place) geänderte Slide dauerhaft im Speicher"""
+        with self._lock:
+            slide = self._loaded.get(slide_id)
+            if slide is not None:
+                self._drop_loaded(slide_id)
+                self._pinned[slide_id] = slide
+
+    def peek(self, slide_id):
+        """Gibt die Slide nur zurück, wenn sie bereits im Speicher ist (kein Lesen)"""
+        with self._lock:
+            slide = self._pinned.get(slide_id)
+            return slide if slide is not None else self._loaded.get(slide_id)
+
+    def title(self, slide_id):
+        """Titel ohne Materialisieren: aus dem Speicher, sonst aus dem Container-Index"""
+        slide = self.peek(slide_id)
+        if slide is not None:
+            return slide.title
+        if slide_id not in self._ids:
+            raise KeyError(slide_id)
+        return self.container.index[slide_id][2]
+
+    def overrides(self):
+        """Abweichungen vom Container: geänderte Slides und gelöschte Slide-IDs"""
+        with self._lock:
+            deleted = [slide_id for slide_id in self.container.index if slide_id not in self._ids]
+            return dict(self._pinned), deleted
+
+    def copy(self):
+        """Schreibgeschützte Sicht (wie dict.copy() ohne alle Slides zu laden)"""
+        return LazySlideView(self)
+
+    def release_all(self):
+        """Gibt alle unveränderten Slides frei (z.B. bei Speicherdruck)"""
+        with self._lock:
+            self.stats['released'] += len(self._loaded)
+            self._loaded.clear()
+            self._loaded_bytes = 0
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats, slides=len(self._ids), loaded=len(self._loaded),
+                        pinned=len(self._pinned), loaded_bytes=self._loaded_bytes)
+
+    def _drop_loaded(self, slide_id):
+        if self._loaded.pop(slide_id, None) is not None:
+            self._loaded_bytes -= self.container.record_size(slide_id)
+
+    def _release(self):
+        """LRU-Freigabe unveränderter Slides"""
+        while self._loaded and (len(self._loaded) > self.max_slides or self._loaded_bytes > self.max_bytes):
+            slide_id, _ = self._loaded.popitem(last=False)
+            self._loaded_bytes -= self.container.record_size(slide_id)
+            self.stats['released'] += 1
+            logger.debug(f"Slide {slide_id} freigegeben (LazySlideStore)")
+
+class LazySlideView(Mapping):
+    """Momentaufnahme der Slide-IDs; Werte werden erst beim Zugriff aus dem Store geholt"""
+
+    def __init__(self, store):
+        self._store = store
+        self._ids = list(store)
+        self._id_set = set(self._ids)
+
+    def __getitem__(self, slide_id):
+        if slide_id not in self._id_set:
+            raise KeyError(slide_id)
+        return self._store[slide_id]
+
+    def __contains__(self, slide_id):
+        return slide_id in self._id_set
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Telemetry Models für Dynamic Messe Stand V4
+Ringpuffer fester Größe für eingehende Gerätedaten
+"""
+
+import threading
+from array import array
+
+class TelemetryRing:
+    """Array-basierter Ringpuffer pro Gerät - bei vollem Puffer wird der älteste Eintrag überschrieben"""
+
+    def __init__(self, capacity=4096, source=''):
+        self.capacity = capacity
+        self.source = source
+        self._timestamps = array('d', bytes(8 * capacity))
+        self._lines = [None] * capacity
+        self._written = 0  # Logischer Index des nächsten Eintrags (= Anzahl geschriebener Einträge)
+        self._read = 0     # Logischer Index des ersten noch nicht abgeholten Eintrags
+        self._lock = threading.Lock()
+        self.overwritten = 0  # Überschriebene Einträge insgesamt
+        self.dropped = 0      # Davon nie über read_new() abgeholt
+
+    def append(self, timestamp, line):
+        """Fügt eine Zeile hinzu (O(1), kein Speicherwachstum)"""
+        with self._lock:
+            if self._written >= self.capacity:
+                self.overwritten += 1
+                if self._read <= self._written - self.capacity:
+                    # Ältester ungelesener Eintrag geht verloren
+                    self.dropped += 1
+                    self._read = self._written - self.capacity + 1
+
+            slot = self._written % self.capacity
+            self._timestamps[slot] = timestamp
+            self._lines[slot] = line
+            self._written += 1
+
+    def read_new(self):
+        """Gibt alle seit dem letzten Aufruf neuen Einträge zurück"""
+        with self._lock:
+            entries = self._entries(self._read, self._written)
+            self._read = self._written
+            return entries
+
+    def query(self, start=None, end=None):
+        """Einträge mit start <= timestamp <= end (Binärsuche, Zeitstempel in Ankunftsreihenfolge)"""
+        with self._lock:
+            return self._entries(*self._range(start, end))
+
+    def count(self, start=None, end=None):
+        """Anzahl der Einträge im Zeitfenster ohne sie zu kopieren"""
+        with self._lock:
+            first, last = self._range(start, end)
+            return last - first
+
+    def latest(self, n=1):
+        """Die n neuesten Einträge"""
+        with self._lock:
+            return self._entries(max(self._oldest(), self._written - n), self._written)
+
+    def get_stats(self):
+        """Füllstand und Verlustzähler"""
+        with self._lock:
+            return {
+                'size': self._written - self._oldest(),
+                'capacity': self.capacity,
+                'written': self._written,
+                'unread': self._written - self._read,
+                'overwritten': self.overwritten,
+                'dropped': self.dropped,
+                'last_timestamp': self._timestamps[(self._written - 1) % self.capacity] if self._written else None
+            }
+
+    def __len__(self):
+        return self._written - self._oldest()
+
+    def _oldest(self):
+        return max(0, self._written - self.capacity)
+
+    def _range(self, start, end):
+        first = self._bisect(start, right=False) if start is not None else self._oldest()
+        last = self._bisect(end, right=True) if end is not None else self._written
+        return first, max(first, last)
+
+    def _bisect(self, timestamp, right):
+        """Binärsuche über die logischen Indizes des Rings"""
+        low, high = self._oldest(), self._written
+        while low < high:
+            middle = (low + high) // 2
+            value = self._timestamps[middle % self.capacity]
+            if value < timestamp or (right and value == timestamp):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _entries(self, first, last):
+        return [
+            {
+                'timestamp': self._timestamps[index % self.capacity],
+                'source': self.source,
+                'data': self._lines[index % self.capacity]
+            }
+            for index in range(first, last)
+        ]
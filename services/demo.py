@@ -9,7 +9,7 @@ import time
 from core.logger import logger
 from core.config import config
 from models.content import content_manager
-from models.hardware import hardware_manager
+from services.signal_dispatcher import signal_dispatcher
 
 class DemoService:
     """Service für automatische Demo-Präsentationen"""
@@ -145,19 +145,11 @@ class DemoService:
         self.running = False
     
     def _send_slide_signal(self, slide_id):
-        """Sendet Signal an Hardware für Slide-Wechsel"""
+        """Sendet Signal an Hardware für Slide-Wechsel (nicht blockierend)"""
         try:
-            # Signal an alle ESP32s senden
-            for name, connection in hardware_manager.connections.items():
-                if name.startswith('esp32_'):
-                    connection.send_signal(f"page_{slide_id}")
-            
-            # UDP-Signal über GIGA senden (falls verfügbar)
-            giga = hardware_manager.get_connection('giga')
-            if giga and giga.status == "connected":
-                giga.send_udp_signal("192.168.1.100", f"page_{slide_id}", 1)
-            
-            logger.debug(f"Slide-Signal gesendet: page_{slide_id}")
+            # ESP32s und GIGA über den Dispatcher - veraltete Seiten werden zusammengefasst
+            queued = signal_dispatcher.send_slide_signal(slide_id)
+            logger.debug(f"Slide-Signal eingereiht: page_{slide_id} ({queued} Geräte)")
             
         except Exception as e:
             logger.error(f"Fehler beim Senden des Slide-Signals: {e}")
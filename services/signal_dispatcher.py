@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Signal Dispatcher für Dynamic Messe Stand V4
+Nicht-blockierender Versand von Hardware-Signalen mit Warteschlange pro Gerät
+"""
+
+import threading
+import time
+import itertools
+from collections import OrderedDict
+from core.logger import logger
+from core.config import config
+from models.hardware import hardware_manager
+
+# Obergrenzen der Latenz-Buckets in Millisekunden (letzter Bucket: alles darüber)
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+class DeviceQueue:
+    """Sende-Warteschlange eines Geräts mit eigenem Worker-Thread"""
+
+    def __init__(self, name, connection):
+        self.name = name
+        self.connection = connection
+        self.pending = OrderedDict()  # coalesce_key -> (func, args, enqueue_time)
+        self.condition = threading.Condition()
+        self.busy = False
+        self.stopping = False  # Stopp-Signal für den Worker (nach dem Leeren bzw. sofort)
+        self.thread = threading.Thread(target=self._worker_loop, name=f"Signal-{name}", daemon=True)
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.stats = {'sent': 0, 'failed': 0, 'coalesced': 0}
+        self.thread.start()
+
+    def put(self, coalesce_key, func, args):
+        """Reiht einen Sendeauftrag ein; ältere Aufträge mit gleichem Key werden ersetzt"""
+        with self.condition:
+            if coalesce_key in self.pending:
+                # Veralteter Auftrag (z.B. page_3 bei schnellem Klicken) wird verworfen
+                del self.pending[coalesce_key]
+                self.stats['coalesced'] += 1
+            self.pending[coalesce_key] = (func, args, time.perf_counter())
+            self.condition.notify()
+
+    def stop(self, drain=True, timeout=None):
+        """Beendet den Worker - mit drain=True erst nach den wartenden Aufträgen"""
+        with self.condition:
+            self.stopping = True
+            if not drain:
+                self.stats['failed'] += len(self.pending)
+                self.pending.clear()
+            self.condition.notify_all()
+        if self.thread is not threading.current_thread():
+            self.thread.join(timeout)
+        return not self.thread.is_alive()
+
+    def _worker_loop(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.busy = False
+                    self.condition.notify_all()
+                    if self.stopping:
+                        return
+                    self.condition.wait()
+                self.busy = True
+                _, (func, args, enqueued) = self.pending.popitem(last=False)
+
+            try:
+                success = func(*args)
+            except Exception as e:
+                logger.error(f"Fehler beim Senden an {self.name}: {e}")
+                success = False
+
+            self._record(success, (time.perf_counter() - enqueued) * 1000)
+
+    def _record(self, success, latency_ms):
+        with self.condition:
+            self.stats['sent' if success else 'failed'] += 1
+            for index, bound in enumerate(LATENCY_BUCKETS_MS):
+                if latency_ms <= bound:
+                    break
+            else:
+                index = len(LATENCY_BUCKETS_MS)
+            self.histogram[index] += 1
+
+    def wait_idle(self, timeout=None):
+        """Wartet, bis alle Aufträge gesendet sind"""
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.pending and not self.busy, timeout)
+
+class SignalDispatcher:
+    """Verteilt Sendeaufträge auf Geräte-Warteschlangen, ohne den Aufrufer zu blockieren"""
+
+    def __init__(self):
+        self.queues = {}  # Gerätename -> DeviceQueue
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+
+    def submit(self, name, func, *args, coalesce_key=None):
+        """Reiht func(*args) für ein Gerät ein; gleicher coalesce_key ersetzt ältere Aufträge"""
+        connection = hardware_manager.get_connection(name)
+        if connection is None:
+            return False
+
+        replaced = None
+        with self._lock:
+            device_queue = self.queues.get(name)
+            if device_queue is None or device_queue.connection is not connection:
+                # Neue Verbindung (z.B. Reconnect): alte Warteschlange samt Thread beenden
+                replaced = device_queue
+                device_queue = DeviceQueue(name, connection)
+                self.queues[name] = device_queue
+        if replaced is not None:
+            replaced.stop(drain=False, timeout=0)
+
+        if coalesce_key is None:
+            coalesce_key = ('unique', next(self._sequence))
+        device_queue.put(coalesce_key, func, args)
+        return True
+
+    def send_slide_signal(self, slide_id):
+        """Reiht das Seiten-Signal für alle verbundenen Geräte ein - nur die neueste Seite geht raus"""
+        signal_id = f"page_{slide_id}"
+        queued = 0
+
+        for name, connection in list(hardware_manager.connections.items()):
+            if connection.status != "connected":
+                continue
+
+            if name.startswith('esp32_'):
+                queued += self.submit(name, connection.send_signal, signal_id,
+                                      coalesce_key='page')
+            elif name == 'giga':
+                queued += self.submit(name, connection.send_udp_signal,
+                                      config.hardware['udp_target_ip'],
+                                      signal_id, 1, coalesce_key='page')
+
+        return queued
+
+    def flush(self, timeout=None):
+        """Wartet, bis alle Warteschlangen leer sind (z.B. vor dem Beenden)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for device_queue in list(self.queues.values()):
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            if not device_queue.wait_idle(remaining):
+                return False
+        return True
+
+    def shutdown(self, timeout=None):
+        """Sendet Wartendes (bis timeout) und beendet alle Worker-Threads"""
+        drained = self.flush(timeout)
+        with self._lock:
+            queues = list(self.queues.values())
+            self.queues.clear()
+        for device_queue in queues:
+            device_queue.stop(drain=drained, timeout=1)
+        return drained
+
+    def get_stats(self):
+        """Gibt Sende-Zähler und Latenz-Histogramm pro Gerät zurück"""
+        stats = {}
+        for name, device_queue in list(self.queues.items()):
+            with device_queue.condition:
+                labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+                stats[name] = dict(
+                    device_queue.stats,
+                    pending=len(device_queue.pending),
+                    latency_histogram=dict(zip(labels, device_queue.histogram))
+                )
+        return stats
+
+# Globale Signal-Dispatcher Instanz
+signal_dispatcher = SignalDispatcher()
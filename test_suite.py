@@ -7,12 +7,14 @@ VERWENDUNG:
 python test_suite.py --all      # Alle Tests
 python test_suite.py --quick    # Schnelle Tests
 python test_suite.py --fix      # Tests + automatische Reparaturen
+python test_suite.py --bench    # Performance-Benchmarks
 """
 
 import os
 import sys
 import json
 import time
+import threading
 import argparse
 from datetime import datetime
 from pathlib import Path
@@ -20,6 +22,22 @@ from pathlib import Path
 # Projekt-Verzeichnis hinzufügen
 sys.path.insert(0, os.path.dirname(__file__))
 
+def isolate_runtime_dirs():
+    """Logs und Laufzeitdaten (data/) der Test- und Benchmark-Läufe in ein temporäres Verzeichnis.
+
+    Muss vor dem ersten Import von core.logger/core.storage laufen (globale Instanzen).
+    """
+    import atexit
+    import shutil
+    import tempfile
+    from core.config import config
+    
+    directory = tempfile.mkdtemp(prefix="messe_stand_tests_")
+    config.logging['log_dir'] = os.path.join(directory, "logs")
+    config.storage['data_dir'] = os.path.join(directory, "data")
+    atexit.register(shutil.rmtree, directory, True)
+    return directory
+
 class TestSuite:
     """Umfassende Test Suite für alle reparierten Funktionen"""
     
@@ -271,6 +289,34 @@ class TestSuite:
             else:
                 self.log_result("Demo Tab Sync", "WARN", f"Nur {len(methods_found)}/4 Sync-Methoden gefunden")
             
+            # Slide-Wechsel aus dem Demo-Thread: nur einreihen, Tk-Aufrufe erst im Poll
+            import queue
+            import threading
+            from types import SimpleNamespace
+            
+            tk_calls = []
+            root = SimpleNamespace(after=lambda ms, func: tk_calls.append(threading.current_thread()) or 'poll')
+            tab = DemoTab.__new__(DemoTab)
+            tab.main_window = SimpleNamespace(root=root)
+            tab.demo_slide_changes = queue.Queue()
+            visited = []
+            tab.goto_slide = visited.append
+            
+            worker = threading.Thread(target=lambda: [tab.on_demo_slide_changed(i) for i in (2, 3)])
+            worker.start()
+            worker.join()
+            queued_only = not tk_calls and tab.demo_slide_changes.qsize() == 2
+            
+            tab.poll_demo_changes()
+            handoff_ok = (queued_only and visited == [3] and tab.demo_poll_id == 'poll'
+                          and tk_calls == [threading.current_thread()])
+            
+            if handoff_ok:
+                self.log_result("Demo Tab Handoff", "PASS", "Demo-Thread reiht nur ein, Poll übernimmt letzten Slide")
+            else:
+                self.log_result("Demo Tab Handoff", "FAIL", f"Tk-Aufrufe: {len(tk_calls)}, Slides: {visited}")
+                return False
+            
             return True
             
         except Exception as e:
@@ -448,79 +494,2586 @@ class TestSuite:
             self.log_result("Performance Tests", "FAIL", f"Performance Test fehlgeschlagen: {e}")
             return False
     
-    def create_test_assets(self):
-        """Test-Assets erstellen falls keine vorhanden"""
-        print("🔧 Erstelle Test-Assets...")
+    def test_image_cache(self):
+        """Test 10: Bild-Cache (Dekodierung nur bei Cache-Miss)"""
+        print("🔍 Test 10: Teste Bild-Cache...")
         
         try:
+            from ui.components.image_cache import ImageCache
+            
+            logo_path = os.path.join(self.base_dir, 'assets', 'Bertrandt_logo_gelb.png')
+            cache = ImageCache(max_bytes=64 * 1024 * 1024)
+            element = {'type': 'image', 'file_path': logo_path}
+            
+            for _ in range(10):
+                key, image = cache.get_source(element)
+            
+            stats = cache.get_stats()
+            
+            # Defekte Datei mit Base64-Fallback: skalierte Variante muss unter dem Fallback-Key treffen
+            import base64
+            import tempfile
+            from io import BytesIO
             from PIL import Image
             
-            # Test-Verzeichnisse erstellen
-            test_dirs = [
-                os.path.join(self.base_dir, 'assets', 'test'),
-                os.path.join(self.base_dir, 'content', 'test_images')
-            ]
+            buffer = BytesIO()
+            Image.new('RGB', (32, 16), '#FFCC00').save(buffer, format='PNG')
+            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as broken:
+                broken.write(b'kein PNG')
+            try:
+                fallback = {'type': 'image', 'file_path': broken.name,
+                            'image_data': base64.b64encode(buffer.getvalue()).decode('ascii')}
+                fallback_cache = ImageCache(max_bytes=64 * 1024 * 1024)
+                for _ in range(5):
+                    scaled = fallback_cache.get_scaled(fallback, (16, 8))
+                fallback_stats = fallback_cache.get_stats()
+            finally:
+                os.remove(broken.name)
             
-            for test_dir in test_dirs:
-                os.makedirs(test_dir, exist_ok=True)
+            if scaled is None or fallback_stats['scaled_hits'] != 4 or fallback_stats['decodes'] != 1:
+                self.log_result("Bild-Cache", "FAIL", f"Base64-Fallback trifft nicht: {fallback_stats}")
+                return False
             
-            # Einfache Test-Bilder erstellen
-            for i, test_dir in enumerate(test_dirs):
-                for j in range(3):
-                    # Farbiges Test-Bild erstellen
-                    img = Image.new('RGB', (200, 150), color=(100 + i*50, 150 + j*30, 200))
-                    img_path = os.path.join(test_dir, f'test_image_{i}_{j}.png')
-                    img.save(img_path)
+            if image is not None and stats['decodes'] == 1 and stats['source_hits'] == 9:
+                self.log_result("Bild-Cache", "PASS", f"1 Dekodierung bei 10 Zugriffen ({stats['bytes']} Bytes)")
+                return True
             
-            self.log_result("Test Assets", "PASS", "Test-Assets erfolgreich erstellt")
+            self.log_result("Bild-Cache", "FAIL", f"Unerwartete Cache-Statistik: {stats}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Bild-Cache", "FAIL", f"Bild-Cache Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_retained_rendering(self):
+        """Test 11: Retained-Mode Rendering (nur Änderungen an den Canvas)"""
+        print("🔍 Test 11: Teste Retained-Mode Rendering...")
+        
+        try:
+            from ui.components.slide_renderer import EnhancedSlideRenderer, SceneRecorder, RetainedScene
+            
+            # Mock-Canvas zählt die Tk-Aufrufe
+            class MockCanvas:
+                def __init__(self):
+                    self.items = {}
+                    self.calls = []
+                def _create(self, kind):
+                    self.calls.append('create')
+                    item_id = len(self.items) + len(self.calls)
+                    self.items[item_id] = kind
+                    return item_id
+                def create_rectangle(self, *a, **k): return self._create('rectangle')
+                def create_line(self, *a, **k): return self._create('line')
+                def create_text(self, *a, **k): return self._create('text')
+                def create_image(self, *a, **k): return self._create('image')
+                def coords(self, item, *a): self.calls.append('coords')
+                def itemconfigure(self, item, **k): self.calls.append('itemconfigure')
+                def tag_raise(self, item): self.calls.append('tag_raise')
+                def type(self, item): return self.items.get(item)
+                def find_all(self): return tuple(self.items)
+                def delete(self, item):
+                    self.calls.append('delete')
+                    if item == 'all':
+                        self.items.clear()
+                    else:
+                        self.items.pop(item, None)
+            
+            canvas = MockCanvas()
+            slide_data = {'title': 'Retained', 'content': 'Zeile 1\nZeile 2\nZeile 3', 'slide_number': 1}
+            EnhancedSlideRenderer.render_slide_to_canvas(canvas, slide_data, 1280, 720)
+            
+            # Identischer Redraw: keine Canvas-Aufrufe
+            canvas.calls.clear()
+            EnhancedSlideRenderer.render_slide_to_canvas(canvas, slide_data, 1280, 720)
+            unchanged_calls = len(canvas.calls)
+            
+            # Eine Zeile geändert: genau ein itemconfigure
+            canvas.calls.clear()
+            slide_data['content'] = 'Zeile 1\nZeile 2 geändert\nZeile 3'
+            EnhancedSlideRenderer.render_slide_to_canvas(canvas, slide_data, 1280, 720)
+            line_calls = list(canvas.calls)
+            
+            # Option entfernt (outline/dash): Element wird neu erstellt statt nur umkonfiguriert
+            def scene(**options):
+                recorder = SceneRecorder()
+                recorder.create_rectangle(0, 0, 10, 10, fill='#FFFFFF', tags='box')
+                recorder.create_rectangle(0, 0, 20, 20, tags='frame', **options)
+                recorder.create_text(5, 5, text='x', tags='label')
+                return recorder
+            
+            shape_canvas = MockCanvas()
+            RetainedScene.apply(shape_canvas, scene(outline='#FF0000', dash=(2, 2)))
+            shape_canvas.calls.clear()
+            RetainedScene.apply(shape_canvas, scene(outline='#FF0000'))
+            removed_ok = shape_canvas.calls.count('create') == 1 and shape_canvas.calls.count('delete') == 1
+            
+            # Mittleres Element extern gelöscht: komplette Neuerstellung
+            middle = shape_canvas._retained_order[1]
+            shape_canvas.items.pop(middle)
+            shape_canvas.calls.clear()
+            RetainedScene.apply(shape_canvas, scene(outline='#FF0000'))
+            rebuilt_ok = shape_canvas.calls.count('create') == 3 and len(shape_canvas.items) == 3
+            
+            if not (removed_ok and rebuilt_ok):
+                self.log_result("Retained Rendering", "FAIL",
+                              f"Entfernte Option/fehlendes Element nicht erkannt: {removed_ok}/{rebuilt_ok}")
+                return False
+            
+            if unchanged_calls == 0 and line_calls == ['itemconfigure']:
+                self.log_result("Retained Rendering", "PASS", "Redraw ohne Änderung: 0 Aufrufe, 1 Zeile: 1 Aufruf")
+                return True
+            
+            self.log_result("Retained Rendering", "FAIL", f"Unerwartete Canvas-Aufrufe: {unchanged_calls} / {line_calls}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Retained Rendering", "FAIL", f"Retained Rendering Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_async_hardware_loop(self):
+        """Test 12: asyncio Hardware-Backend gegen PTY-Geräte"""
+        print("🔍 Test 12: Teste asyncio Hardware-Backend...")
+        
+        try:
+            import pty
+            import tty
+            from models.hardware import HardwareManager
+        except ImportError as e:
+            self.log_result("Async Hardware-Loop", "WARN", f"Nicht verfügbar: {e}")
             return True
+        
+        manager = HardwareManager()
+        manager.backend = 'asyncio'
+        ptys = []
+        
+        try:
+            for i in range(1, 4):
+                master, slave = pty.openpty()
+                tty.setraw(slave)
+                ptys.append((master, slave))
+                manager.add_esp32(os.ttyname(slave), i)
+            
+            results = manager.connect_all()
+            if not all(results.values()):
+                self.log_result("Async Hardware-Loop", "WARN", f"PTY konnte nicht geöffnet werden: {results}")
+                return True
+            
+            threads_before = threading.active_count()
+            received = []
+            manager.subscribe(received.append)
+            
+            # Abwechselnd von allen Geräten senden
+            for n in range(5):
+                for master, _ in ptys:
+                    os.write(master, f"PING:{n}\n".encode('utf-8'))
+                time.sleep(0.01)
+            time.sleep(0.2)
+            
+            data = manager.get_all_data()
+            timestamps = [entry['timestamp'] for entry in data]
+            
+            # Senden läuft ebenfalls über den Loop
+            manager.get_connection('esp32_2').send_signal(7, 1)
+            time.sleep(0.1)
+            echoed = os.read(ptys[1][0], 1024).decode('utf-8')
+            
+            # Gerät weg (Lesefehler/EOF): Verbindung wird abgemeldet, Writes gehen nicht mehr ins Leere
+            lost = manager.get_connection('esp32_3')
+            os.close(ptys[2][0])
+            ptys[2] = (None, ptys[2][1])
+            deadline = time.time() + 2
+            while lost.io_loop is not None and time.time() < deadline:
+                time.sleep(0.01)
+            detached = lost.io_loop is None and manager.io_loop.write(lost, b"PING\n") is False
+            
+            if (len(data) == 15 and len(received) == 15 and timestamps == sorted(timestamps)
+                    and 'SIGNAL:7:1' in echoed and threading.active_count() == threads_before
+                    and detached):
+                self.log_result("Async Hardware-Loop", "PASS",
+                              f"3 Geräte, 15 Zeilen zeitlich sortiert, 1 Loop-Thread")
+                return True
+            
+            self.log_result("Async Hardware-Loop", "FAIL",
+                          f"{len(data)} Zeilen, {len(received)} Abonnent, Echo {echoed!r}, abgemeldet {detached}")
+            return False
             
         except Exception as e:
-            self.log_result("Test Assets", "FAIL", f"Test-Assets Erstellung fehlgeschlagen: {e}")
+            self.log_result("Async Hardware-Loop", "FAIL", f"Async Hardware Test fehlgeschlagen: {e}")
             return False
+        finally:
+            manager.disconnect_all()
+            for master, slave in ptys:
+                if master is not None:
+                    os.close(master)
+                os.close(slave)
     
-    def run_quick_tests(self):
-        """Führt schnelle Tests aus"""
-        print("🚀 Starte SCHNELLE Tests...\n")
+    def test_hardware_reconnect(self):
+        """Test 13: Paralleles connect_all mit Deadline und Auto-Reconnect"""
+        print("🔍 Test 13: Teste Hardware-Reconnect...")
         
-        tests = [
-            self.test_file_structure,
-            self.test_imports,
-            self.test_content_manager,
-            self.test_assets_availability
-        ]
+        try:
+            import pty
+            import tty
+            import tempfile
+            import threading
+            from core.config import config
+            from models.hardware import HardwareManager
+        except ImportError as e:
+            self.log_result("Hardware-Reconnect", "WARN", f"Nicht verfügbar: {e}")
+            return True
         
-        passed = 0
-        for test in tests:
-            if test():
-                passed += 1
-            print()
+        saved_config = dict(config.hardware)
+        config.hardware.update(supervisor_interval=0.05, reconnect_min_delay=0.05)
+        manager = HardwareManager()
+        temp_dir = tempfile.mkdtemp()
+        link = os.path.join(temp_dir, 'ttyESP32')
+        fds = []
         
-        return passed, len(tests)
+        def plug_in():
+            # Neues PTY unter gleichem Pfad = USB-Kabel wieder eingesteckt
+            master, slave = pty.openpty()
+            tty.setraw(slave)
+            fds.extend([master, slave])
+            if os.path.lexists(link):
+                os.remove(link)
+            os.symlink(os.ttyname(slave), link)
+            return master
+        
+        def wait_for(predicate, timeout=3.0):
+            end = time.time() + timeout
+            while time.time() < end:
+                if predicate():
+                    return True
+                time.sleep(0.02)
+            return False
+        
+        try:
+            master = plug_in()
+            manager.add_esp32(link, 1)
+            manager.add_esp32(os.path.join(temp_dir, 'fehlt'), 2)
+            
+            events = []
+            manager.add_status_listener(lambda name, status: events.append((name, status)))
+            
+            # Status-Panel: Listener laufen in Pool-/Reader-/Supervisor-Threads und dürfen Tk nicht anfassen
+            import queue
+            from ui.components.status_panel import StatusPanelComponent
+            
+            panel = StatusPanelComponent.__new__(StatusPanelComponent)
+            panel_threads = []
+            panel.after = lambda ms, func: panel_threads.append(threading.current_thread()) or 'poll'
+            panel.hw_status_changes = queue.Queue()
+            panel_status = {}
+            panel.set_hardware_status = panel_status.__setitem__
+            manager.add_status_listener(panel.on_hardware_status_changed)
+            
+            start = time.time()
+            results = manager.connect_all(deadline=1.0)
+            connect_time = time.time() - start
+            
+            manager.start_supervisor()
+            
+            # Kabel ziehen: Master schließen -> Lesefehler -> "error"
+            os.close(master)
+            fds.remove(master)
+            dropped = wait_for(lambda: ('esp32_1', 'error') in events)
+            
+            plug_in()
+            reconnected = wait_for(lambda: events.count(('esp32_1', 'connected')) >= 2)
+            
+            panel_queued = wait_for(lambda: panel.hw_status_changes.qsize() == len(events)) and not panel_threads
+            panel.poll_hardware_status()
+            panel_ok = (panel_queued and panel_threads == [threading.current_thread()]
+                        and panel_status.get('esp32_1') == 'connected')
+            
+            if not panel_ok:
+                self.log_result("Hardware-Reconnect", "FAIL",
+                              f"Status-Panel: Tk-Aufrufe aus {panel_threads}, Status {panel_status}")
+                return False
+            
+            # disconnect_all während eines laufenden connect: kein Reader danach, Port wieder zu
+            class SlowConnection:
+                name = "Langsam"
+                connection = None
+                def __init__(self):
+                    self.release = threading.Event()
+                    self.calls = []
+                def connect(self):
+                    self.release.wait(2)
+                    self.calls.append('connect')
+                    return True
+                def start_reading(self):
+                    self.calls.append('start_reading')
+                    return True
+                def disconnect(self):
+                    self.calls.append('disconnect')
+            
+            slow_manager = HardwareManager()
+            slow = SlowConnection()
+            slow_manager.connections['slow'] = slow
+            slow_manager.connect_all(deadline=0.01)
+            threading.Timer(0.1, slow.release.set).start()
+            slow_manager.disconnect_all()
+            shutdown_ok = 'start_reading' not in slow.calls and slow.calls[-1] == 'disconnect' and 'connect' in slow.calls
+            
+            if not shutdown_ok:
+                self.log_result("Hardware-Reconnect", "FAIL", f"disconnect_all während connect: {slow.calls}")
+                return False
+            
+            if results == {'esp32_1': True, 'esp32_2': False} and connect_time < 1.0 and dropped and reconnected:
+                self.log_result("Hardware-Reconnect", "PASS",
+                              f"connect_all in {connect_time*1000:.0f} ms, Reconnect nach Replug per Event")
+                return True
+            
+            self.log_result("Hardware-Reconnect", "FAIL",
+                          f"Ergebnis {results}, {connect_time:.2f}s, Events {events}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Hardware-Reconnect", "FAIL", f"Reconnect Test fehlgeschlagen: {e}")
+            return False
+        finally:
+            manager.disconnect_all()
+            config.hardware.clear()
+            config.hardware.update(saved_config)
+            for fd in fds:
+                os.close(fd)
+            if os.path.lexists(link):
+                os.remove(link)
+            os.rmdir(temp_dir)
     
-    def run_all_tests(self):
-        """Führt alle Tests aus"""
-        print("🚀 Starte VOLLSTÄNDIGE Tests...\n")
+    def test_signal_dispatcher(self):
+        """Test 14: Signal-Dispatcher (nicht blockierend, veraltete Seiten zusammengefasst)"""
+        print("🔍 Test 14: Teste Signal-Dispatcher...")
         
-        tests = [
-            self.test_file_structure,
-            self.test_imports, 
-            self.test_content_manager,
-            self.test_creator_tab_functions,
-            self.test_demo_tab_sync,
-            self.test_slide_renderer,
-            self.test_assets_availability,
-            self.test_integration_flow,
-            self.test_performance
-        ]
+        try:
+            from models.hardware import hardware_manager
+            from services.signal_dispatcher import signal_dispatcher
+            
+            # Langsames Fake-Gerät: jedes Senden dauert 20 ms
+            class SlowDevice:
+                status = "connected"
+                def __init__(self):
+                    self.sent = []
+                def send_signal(self, signal_id, value=1):
+                    time.sleep(0.02)
+                    self.sent.append(signal_id)
+                    return True
+            
+            device = SlowDevice()
+            hardware_manager.connections['esp32_test'] = device
+            
+            try:
+                start = time.perf_counter()
+                for page in range(1, 21):
+                    signal_dispatcher.send_slide_signal(page)
+                caller_ms = (time.perf_counter() - start) * 1000
+                
+                signal_dispatcher.flush(timeout=2)
+                stats = signal_dispatcher.get_stats()['esp32_test']
+                
+                # Reconnect: neue Verbindung ersetzt die Warteschlange, der alte Worker endet
+                old_queue = signal_dispatcher.queues['esp32_test']
+                reconnected = SlowDevice()
+                hardware_manager.connections['esp32_test'] = reconnected
+                signal_dispatcher.send_slide_signal(21)
+                old_queue.thread.join(timeout=1)
+                
+                # Shutdown: Wartendes geht raus, danach laufen keine Worker mehr
+                new_queue = signal_dispatcher.queues['esp32_test']
+                shutdown_ok = signal_dispatcher.shutdown(timeout=2)
+                new_queue_stopped = (not old_queue.thread.is_alive() and not new_queue.thread.is_alive()
+                                     and not signal_dispatcher.queues)
+                replaced_ok = reconnected.sent == ['page_21'] and new_queue_stopped and shutdown_ok
+            finally:
+                del hardware_manager.connections['esp32_test']
+                device_queue = signal_dispatcher.queues.pop('esp32_test', None)
+                if device_queue:
+                    device_queue.stop(drain=False, timeout=1)
+            
+            if (device.sent and device.sent[-1] == 'page_20' and len(device.sent) <= 3 and caller_ms < 20
+                    and replaced_ok):
+                self.log_result("Signal-Dispatcher", "PASS",
+                              f"20 Klicks -> {len(device.sent)} Sendungen, Aufrufer {caller_ms:.2f} ms, "
+                              f"{stats['coalesced']} zusammengefasst, Worker bei Reconnect/Shutdown beendet")
+                return True
+            
+            self.log_result("Signal-Dispatcher", "FAIL",
+                          f"Gesendet {device.sent}, Aufrufer {caller_ms:.2f} ms, Reconnect/Shutdown {replaced_ok}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Signal-Dispatcher", "FAIL", f"Dispatcher Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_hardware_simulator(self):
+        """Test 15: Simulierte Boards (ESP32 SIGNAL:, GIGA UDP_SEND:)"""
+        print("🔍 Test 15: Teste Hardware-Simulator...")
         
-        passed = 0
-        for test in tests:
-            if test():
-                passed += 1
-            print()
+        try:
+            from models.hardware import HardwareManager
+            from models.hardware_sim import DeviceSimulator
+        except ImportError as e:
+            self.log_result("Hardware-Simulator", "WARN", f"Nicht verfügbar: {e}")
+            return True
         
-        return passed, len(tests)
+        simulator = DeviceSimulator()
+        manager = HardwareManager()
+        
+        try:
+            ports = simulator.start_default(esp32_count=1, giga=True)
+            esp32 = manager.add_esp32(ports['esp32_1_port'], 1)
+            giga = manager.add_giga(ports['giga_port'])
+            manager.connect_all()
+            
+            esp32.send_signal('page_3')
+            giga.send_udp_signal('192.168.1.100', 'page_3', 1)
+            giga.enable_udp_sender()
+            giga.send_udp_signal('192.168.1.100', 'page_3', 1)
+            time.sleep(0.3)
+            
+            replies = [entry['data'] for entry in manager.get_all_data()]
+            expected = [
+                'ACK:SIGNAL:page_3:1',
+                'ERR:UDP_DISABLED:UDP_SEND:192.168.1.100:page_3:1',
+                'ACK:UDP_ENABLE',
+                'ACK:UDP_SEND:192.168.1.100:page_3:1'
+            ]
+            
+            if sorted(replies) == sorted(expected) and simulator.devices['esp32_1'].signals == {'page_3': '1'}:
+                self.log_result("Hardware-Simulator", "PASS", f"{len(replies)} Protokoll-Antworten korrekt")
+                return True
+            
+            self.log_result("Hardware-Simulator", "FAIL", f"Antworten: {replies}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Hardware-Simulator", "FAIL", f"Simulator Test fehlgeschlagen: {e}")
+            return False
+        finally:
+            manager.disconnect_all()
+            simulator.stop_all()
+    
+    def test_telemetry_ring(self):
+        """Test 16: Telemetrie-Ringpuffer (feste Größe, Bereichsabfragen, Verlustzähler)"""
+        print("🔍 Test 16: Teste Telemetrie-Ringpuffer...")
+        
+        try:
+            from models.telemetry import TelemetryRing
+            
+            ring = TelemetryRing(capacity=100, source='ESP32-1')
+            for i in range(250):
+                ring.append(1000.0 + i, f"LINE:{i}")
+            
+            window = ring.query(1200.0, 1209.0)
+            newest = ring.read_new()
+            stats = ring.get_stats()
+            
+            if (len(ring) == 100 and [e['data'] for e in window] == [f"LINE:{i}" for i in range(200, 210)]
+                    and newest[0]['data'] == 'LINE:150' and len(newest) == 100
+                    and stats['dropped'] == 150 and ring.count(1000.0, 1149.0) == 0
+                    and ring.read_new() == []):
+                self.log_result("Telemetrie-Ringpuffer", "PASS",
+                              f"250 Zeilen in 100 Slots, {stats['dropped']} verworfen, Bereichsabfrage korrekt")
+                return True
+            
+            self.log_result("Telemetrie-Ringpuffer", "FAIL", f"Unerwarteter Zustand: {stats}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Telemetrie-Ringpuffer", "FAIL", f"Ringpuffer Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_binary_protocol(self):
+        """Test 17: Binäres Frame-Protokoll (CRC, gemischter Strom, Aushandlung)"""
+        print("🔍 Test 17: Teste binäres Frame-Protokoll...")
+        
+        try:
+            from core.config import config
+            from models.hardware import (
+                HardwareManager, FrameDecoder, encode_signal_frame, encode_frame, FRAME_TEXT
+            )
+            from models.hardware_sim import DeviceSimulator
+            
+            # Gemischter Strom: Text, Frames, ein gestörtes Frame, in 3-Byte-Häppchen zerlegt
+            corrupted = bytearray(encode_signal_frame('page_7', 1))
+            corrupted[4] ^= 0xFF
+            stream = (b"BOOT OK\n" + encode_signal_frame('page_3', 1) + bytes(corrupted)
+                      + encode_signal_frame('page_12', 0, '192.168.1.100')
+                      + encode_frame(FRAME_TEXT, b'STATUS:ready') + b"SENSOR:1:2\n")
+            
+            decoder = FrameDecoder()
+            lines = []
+            for i in range(0, len(stream), 3):
+                lines += decoder.decode_lines(stream[i:i + 3])
+            
+            expected = ['BOOT OK', 'SIGNAL:page_3:1', 'UDP_SEND:192.168.1.100:page_12:0',
+                        'STATUS:ready', 'SENSOR:1:2']
+            if lines != expected or decoder.crc_errors == 0:
+                self.log_result("Binär-Protokoll", "FAIL", f"Dekodiert: {lines}, CRC-Fehler {decoder.crc_errors}")
+                return False
+            
+            # Aushandlung gegen den Simulator, danach binär senden
+            saved_protocol = config.hardware.get('protocol')
+            config.hardware['protocol'] = 'binary'
+            simulator = DeviceSimulator()
+            manager = HardwareManager()
+            try:
+                esp32 = manager.add_esp32(simulator.add_device('esp32_1', 'esp32'), 1)
+                manager.connect_all()
+                manager.get_all_data()
+                esp32.send_signal('page_3')
+                time.sleep(0.2)
+                replies = [entry['data'] for entry in manager.get_all_data()]
+            finally:
+                manager.disconnect_all()
+                simulator.stop_all()
+                config.hardware['protocol'] = saved_protocol
+            
+            if esp32.protocol == 'binary' and replies == ['ACK:SIGNAL:page_3:1']:
+                self.log_result("Binär-Protokoll", "PASS",
+                              f"Gemischter Strom mit Resync, Aushandlung ok, page-Signal {len(encode_signal_frame('page_3', 1))} Bytes")
+                return True
+            
+            self.log_result("Binär-Protokoll", "FAIL", f"Protokoll {esp32.protocol}, Antworten {replies}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Binär-Protokoll", "FAIL", f"Protokoll Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_change_feed(self):
+        """Test 18: Versionierter Change-Feed (Revisionen, Tombstones, keine Leer-Revisionen)"""
+        print("🔍 Test 18: Teste Change-Feed...")
+        
+        try:
+            from models.content import EnhancedContentManager
+            
+            manager = EnhancedContentManager()
+            start_revision, _ = manager.get_changes_since(0)
+            
+            manager.update_slide_content(2, "Neu 2", "Inhalt")
+            manager.update_slide_content(5, "Neu 5", "Inhalt")
+            manager.update_slide_content(2, "Neu 2b", "Inhalt")
+            revision, changes = manager.get_changes_since(start_revision)
+            if [slide_id for slide_id, _, _ in changes] != [5, 2] or revision != start_revision + 3:
+                self.log_result("Change-Feed", "FAIL", f"Änderungen {changes} bei Revision {revision}")
+                return False
+            
+            # Unveränderter Inhalt (Auto-Save) darf keine Revision erzeugen
+            manager.update_slide_content(2, "Neu 2b", "Inhalt")
+            if manager.get_changes_since(revision) != (revision, []):
+                self.log_result("Change-Feed", "FAIL", "Unveränderter Inhalt erzeugt neue Revision")
+                return False
+            
+            manager.delete_slide(5)
+            revision, changes = manager.get_changes_since(revision)
+            if changes != [(5, 'delete', None)] or manager.get_slide(2).revision != revision - 1:
+                self.log_result("Change-Feed", "FAIL", f"Tombstone fehlt: {changes}")
+                return False
+            
+            self.log_result("Change-Feed", "PASS", f"Revision {revision}, Tombstone und Auto-Save-Filter ok")
+            return True
+            
+        except Exception as e:
+            self.log_result("Change-Feed", "FAIL", f"Change-Feed Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_observer_bus(self):
+        """Test 19: Observer-Bus fasst Änderungen pro Zyklus zusammen"""
+        print("🔍 Test 19: Teste Observer-Bus...")
+        
+        try:
+            import tempfile
+            from models.content import EnhancedContentManager
+            
+            manager = EnhancedContentManager()
+            scheduled = []
+            manager.observer_bus.set_scheduler(lambda delay_ms, func: scheduled.append(func))
+            
+            deliveries, filtered = [], []
+            manager.subscribe(deliveries.append)
+            manager.subscribe(filtered.append, slide_ids=[2], actions=['update'])
+            
+            # Mehrere Änderungen im selben Zyklus -> ein Aufruf, eine Zeile pro Slide
+            manager.update_slide_content(2, "A", "x")
+            manager.update_slide_content(3, "B", "y")
+            manager.update_slide_content(2, "C", "z")
+            if len(scheduled) != 1 or deliveries:
+                self.log_result("Observer-Bus", "FAIL", f"{len(scheduled)} Zustellungen geplant")
+                return False
+            scheduled.pop()()
+            
+            if [[slide_id for slide_id, _, _ in changes] for changes in deliveries] != [[3, 2]] \
+                    or [[slide_id for slide_id, _, _ in changes] for changes in filtered] != [[2]]:
+                self.log_result("Observer-Bus", "FAIL", f"Zustellung {deliveries}, Filter {filtered}")
+                return False
+            
+            # 200-Slide-Präsentation laden -> ein einziger Änderungssatz
+            slides = {str(i): {'slide_id': i, 'title': f"Slide {i}", 'content': ''} for i in range(1, 201)}
+            with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+                json.dump({'slides': slides}, f)
+            try:
+                deliveries.clear()
+                manager.load_from_file(f.name)
+            finally:
+                os.unlink(f.name)
+            
+            if len(deliveries) == 1 and len(deliveries[0]) == 200 and not scheduled:
+                self.log_result("Observer-Bus", "PASS",
+                              f"3 Änderungen -> 1 Aufruf, 200 Slides laden -> 1 Aufruf, Filter ok")
+                return True
+            
+            self.log_result("Observer-Bus", "FAIL", f"Laden: {len(deliveries)} Zustellungen")
+            return False
+            
+        except Exception as e:
+            self.log_result("Observer-Bus", "FAIL", f"Observer-Bus Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_content_journal(self):
+        """Test 20: Content-Journal (Delta-Einträge, Kompaktierung, Wiederherstellung nach Absturz)"""
+        print("🔍 Test 20: Teste Content-Journal...")
+        
+        try:
+            import tempfile
+            import shutil
+            from core.config import config
+            from models.content import EnhancedContentManager
+            
+            directory = tempfile.mkdtemp(prefix="journal_test_")
+            saved_fsync = config.content.get('journal_fsync')
+            config.content['journal_fsync'] = False
+            try:
+                manager = EnhancedContentManager()
+                manager.enable_journal(directory)
+                manager.update_slide_content(2, "Journal 2", "A")
+                manager.update_slide_content(9, "Journal 9", "B")
+                manager.delete_slide(4)
+                manager.journal.close()
+                
+                # Absturz mitten im Schreiben simulieren
+                with open(manager.journal.journal_path, 'a', encoding='utf-8') as f:
+                    f.write('{"seq": 99, "id": 3, "act')
+                
+                restored = EnhancedContentManager()
+                restored.enable_journal(directory)
+                stats = restored.journal.get_stats()
+                if (restored.get_slide(2).title != "Journal 2" or restored.get_slide(9) is None
+                        or restored.get_slide(4) is not None or stats['torn_entries'] != 1
+                        or stats['replayed'] != 3):
+                    self.log_result("Content-Journal", "FAIL", f"Wiederherstellung falsch: {stats}")
+                    return False
+                
+                # Kompaktierung beim 4. Eintrag - danach liegt nur noch die letzte Änderung im Journal
+                restored.journal.compact_entries = 4
+                restored.update_slide_content(1, "Kompakt", "C")
+                restored.update_slide_content(2, "Kompakt 2", "D")
+                compactions = restored.journal.stats['compactions']
+                restored.journal.close()
+                
+                reopened = EnhancedContentManager()
+                reopened.enable_journal(directory)
+                replayed = reopened.journal.stats['replayed']
+                if (compactions != 1 or replayed != 1 or reopened.get_slide(1).title != "Kompakt"
+                        or reopened.get_slide(2).title != "Kompakt 2" or reopened.get_slide(4) is not None):
+                    self.log_result("Content-Journal", "FAIL",
+                                  f"Kompaktierung: {compactions} Kompaktierungen, {replayed} nachgespielt")
+                    return False
+                reopened.journal.close()
+                
+                # Nur ein leeres Journal (Snapshot fehlt) - Standard-Deck bleibt erhalten
+                os.remove(reopened.journal.snapshot_path)
+                open(reopened.journal.journal_path, 'w').close()
+                fresh = EnhancedContentManager()
+                default_count = len(fresh.slides)
+                fresh.enable_journal(directory)
+                fresh.journal.close()
+                if default_count == 0 or len(fresh.slides) != default_count:
+                    self.log_result("Content-Journal", "FAIL",
+                                  f"Leeres Journal ersetzt Standard-Deck: {len(fresh.slides)} statt {default_count} Slides")
+                    return False
+            finally:
+                config.content['journal_fsync'] = saved_fsync
+                shutil.rmtree(directory, ignore_errors=True)
+            
+            self.log_result("Content-Journal", "PASS", "Deltas, abgeschnittener Eintrag verworfen, Kompaktierung ok")
+            return True
+            
+        except Exception as e:
+            self.log_result("Content-Journal", "FAIL", f"Journal Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_lazy_slide_store(self):
+        """Test 21: Präsentations-Container mit Index und lazy geladenen Slides"""
+        print("🔍 Test 21: Teste Lazy-Slide-Store...")
+        
+        try:
+            import tempfile
+            import shutil
+            from core.config import config
+            from models.content import EnhancedContentManager, SlideData
+            
+            directory = tempfile.mkdtemp(prefix="container_test_")
+            saved = dict(config.content)
+            config.content.update({'journal_fsync': False, 'lazy_max_slides': 4})
+            try:
+                source = EnhancedContentManager()
+                for slide_id in range(1, 101):
+                    slide = SlideData(slide_id, f"Container {slide_id}", "Text")
+                    slide.canvas_elements = [{'type': 'image', 'image_data': 'QUJD' * 2000}]
+                    source.slides[slide_id] = slide
+                path = source.save_to_file(os.path.join(directory, "deck.dmsp"))
+                
+                manager = EnhancedContentManager()
+                manager.enable_journal(os.path.join(directory, "journal"))
+                manager.load_from_file(path)
+                opened = manager.slides.get_stats()
+                if manager.get_slide_count() != 100 or opened['materialized'] != 1:
+                    self.log_result("Lazy-Slide-Store", "FAIL", f"Öffnen: {opened}")
+                    return False
+                
+                # Change-Feed und Slide-Listen (GUI) dürfen keine Slides nachladen
+                revision, changes = manager.get_changes_since(0)
+                list_titles = manager.get_slide_titles()
+                synced = manager.slides.get_stats()
+                if (len(changes) != 100 or synced['materialized'] != 1
+                        or list_titles[42] != "Container 42" or manager.get_slide_title(77) != "Container 77"):
+                    self.log_result("Lazy-Slide-Store", "FAIL", f"Change-Feed/Titel laden Slides: {synced}")
+                    return False
+                
+                # Durchblättern: LRU gibt unveränderte Slides wieder frei
+                titles = [manager.get_slide(slide_id).title for slide_id in range(1, 101)]
+                browsed = manager.slides.get_stats()
+                if titles[49] != "Container 50" or browsed['loaded'] > 4:
+                    self.log_result("Lazy-Slide-Store", "FAIL", f"Blättern: {browsed}")
+                    return False
+                
+                # Änderungen bleiben erhalten und landen als Abweichung im Journal
+                manager.update_slide_content(7, "Geändert", "Neu")
+                for slide_id in range(20, 30):
+                    manager.get_slide(slide_id)
+                manager.delete_slide(8)
+                manager.close_journal()
+                
+                reopened = EnhancedContentManager()
+                reopened.enable_journal(os.path.join(directory, "journal"))
+                if (reopened.get_slide(7).title != "Geändert" or reopened.get_slide(8) is not None
+                        or reopened.get_slide_count() != 99 or reopened.get_slide(99).title != "Container 99"):
+                    self.log_result("Lazy-Slide-Store", "FAIL", "Wiederherstellung über Container falsch")
+                    return False
+                reopened.close_journal()
+            finally:
+                config.content.clear()
+                config.content.update(saved)
+                shutil.rmtree(directory, ignore_errors=True)
+            
+            self.log_result("Lazy-Slide-Store", "PASS",
+                          f"Öffnen materialisiert 1/100 Slides, max. {browsed['loaded']} im Speicher, Journal-Basis ok")
+            return True
+            
+        except Exception as e:
+            self.log_result("Lazy-Slide-Store", "FAIL", f"Lazy-Slide-Store Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_slide_records(self):
+        """Test 22: __slots__-Records für Slides und Canvas-Elemente (Legacy-Dicts kompatibel)"""
+        print("🔍 Test 22: Teste Slide-Records...")
+        
+        try:
+            from models.content import SlideData
+            from models.records import ImageElement, GenericElement, element_from_dict
+            
+            legacy = {
+                'slide_id': 3, 'title': 'Records', 'content': 'Text', 'layout': 'mixed',
+                'canvas_elements': [
+                    {'type': 'text', 'content': 'Titel', 'x': 10, 'y': 20, 'font': 'Arial 24', 'is_title': True},
+                    {'type': 'window', 'widget_type': 'Text', 'text': 'A', 'coords': [1, 2], 'bg': 'white'},
+                    {'type': 'window', 'widget_type': 'Label', 'text': 'B', 'anchor': 'nw'},
+                    {'type': 'image', 'x': 5, 'y': 6, 'image_data': 'QUJD', 'custom': 1},
+                    {'type': 'rectangle', 'coords': [0, 0, 9, 9], 'fill': '#fff'},
+                    {'type': 'shape', 'data': {'r': 3}},
+                    {'type': 'window', 'text': 'ohne widget_type'}
+                ],
+                'assets': [], 'config_data': {'slide_width': 1920}, 'extra_data': {},
+                'created_at': '2025-01-02T03:04:05', 'modified_at': '2025-01-02T03:04:06'
+            }
+            
+            slide = SlideData.from_dict(legacy)
+            image = slide.canvas_elements[3]
+            checks = [
+                slide.to_dict() == legacy,
+                not hasattr(slide, '__dict__'),
+                isinstance(image, ImageElement) and image.get('image_data') == 'QUJD' and image['custom'] == 1,
+                'file_path' not in image and image.get('width', 200) == 200,
+                isinstance(slide.canvas_elements[5], GenericElement),
+                slide.canvas_elements[6].get('widget_type', 'Text') == 'Text',
+                slide.created_at.year == 2025,
+                element_from_dict(image) is image
+            ]
+            
+            if all(checks):
+                self.log_result("Slide-Records", "PASS", "7 Element-Arten, Legacy-Roundtrip verlustfrei, kein __dict__")
+                return True
+            
+            self.log_result("Slide-Records", "FAIL", f"Prüfungen: {checks}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Slide-Records", "FAIL", f"Records Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_blob_store(self):
+        """Test 23: Inhaltsadressierter Blob-Store statt Base64 im Slide-JSON"""
+        print("🔍 Test 23: Teste Blob-Store...")
+        
+        try:
+            import base64
+            import tempfile
+            import shutil
+            from io import BytesIO
+            from PIL import Image
+            from models.blob_store import blob_store, migrate_presentation_file
+            from models.content import EnhancedContentManager
+            from ui.components.image_cache import ImageCache
+            
+            buffer = BytesIO()
+            Image.frombytes('L', (64, 32), os.urandom(64 * 32)).save(buffer, format='PNG')
+            logo_base64 = base64.b64encode(buffer.getvalue()).decode('ascii')
+            
+            directory = tempfile.mkdtemp(prefix="blob_test_")
+            saved_root, saved_stats = blob_store.root, dict(blob_store.stats)
+            blob_store.root = os.path.join(directory, "blobs")
+            try:
+                # Gleiches Logo auf 20 Slides -> ein Blob
+                path = os.path.join(directory, "deck.json")
+                slides = {str(i): {'slide_id': i, 'title': f"Slide {i}", 'canvas_elements': [
+                    {'type': 'image', 'x': 0, 'y': 0, 'width': 64, 'height': 32, 'image_data': logo_base64}
+                ]} for i in range(1, 21)}
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump({'slides': slides}, f)
+                before = os.path.getsize(path)
+                
+                migrated = migrate_presentation_file(path)
+                after = os.path.getsize(path)
+                blob_files = sum(len(files) for _, _, files in os.walk(blob_store.root))
+                
+                manager = EnhancedContentManager()
+                manager.load_from_file(path)
+                element = manager.get_slide(7).canvas_elements[0]
+                cache = ImageCache(max_bytes=16 * 1024 * 1024)
+                key, image = cache.get_source(element)
+                
+                ok = (migrated == 20 and blob_files == 1 and after < before
+                      and 'image_data' not in element and key == ('blob', element['image_hash'])
+                      and image.size == (64, 32))
+            finally:
+                blob_store.root = saved_root
+                blob_store.stats = saved_stats
+                shutil.rmtree(directory, ignore_errors=True)
+            
+            if ok:
+                self.log_result("Blob-Store", "PASS",
+                              f"20 Bilder -> 1 Blob, JSON {before} -> {after} Bytes, Rendern aus dem Store")
+                return True
+            
+            self.log_result("Blob-Store", "FAIL", f"Migriert {migrated}, Blobs {blob_files}, Key {key}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Blob-Store", "FAIL", f"Blob-Store Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_asset_index(self):
+        """Test 24: Inkrementeller Asset-Index (inotify bzw. mtime-Abgleich)"""
+        print("🔍 Test 24: Teste Asset-Index...")
+        
+        try:
+            import tempfile
+            import shutil
+            from models.asset_index import AssetIndex
+            
+            directory = tempfile.mkdtemp(prefix="asset_index_test_")
+            try:
+                assets_dir = os.path.join(directory, "assets")
+                content_dir = os.path.join(directory, "content")
+                for folder in (os.path.join(assets_dir, "ui"), os.path.join(content_dir, "blobs", "ab")):
+                    os.makedirs(folder)
+                for path in (os.path.join(assets_dir, "ui", "button.png"), os.path.join(assets_dir, "logo.svg"),
+                             os.path.join(content_dir, "foto.jpg"), os.path.join(content_dir, "blobs", "ab", "cdef.png"),
+                             os.path.join(content_dir, "notiz.xyz")):
+                    with open(path, 'wb') as f:
+                        f.write(b"x" * 10)
+                
+                roots = {assets_dir: 'corporate', content_dir: 'content'}
+                formats = {'images': ['.png', '.jpg', '.svg']}
+                index_path = os.path.join(directory, "asset_index.json")
+                
+                # Ohne Watcher: Änderungen über den mtime-Abgleich
+                index = AssetIndex(roots, formats, index_path=index_path, rescan_interval=0, watch=False)
+                first = index.categorized()
+                new_path = os.path.join(content_dir, "neu.png")
+                with open(new_path, 'wb') as f:
+                    f.write(b"y" * 20)
+                png_paths = [asset['path'] for asset in index.query(extension='.png')]
+                index.close()
+                
+                # Während die App aus ist: Datei in-place überschrieben (Verzeichnis-mtime unverändert)
+                logo_path = os.path.join(assets_dir, "logo.svg")
+                dir_stat = os.stat(assets_dir)
+                with open(logo_path, 'wb') as f:
+                    f.write(b"z" * 30)
+                os.utime(assets_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+                
+                # Neuer Start: gespeicherter Index, unveränderte Verzeichnisse werden nicht gelistet,
+                # die Dateien danach im Hintergrund geprüft
+                reopened = AssetIndex(roots, formats, index_path=index_path, rescan_interval=0, watch=False)
+                reopened.open()
+                listed = reopened.stats['listed_dirs']
+                verified = reopened.wait_verified(timeout=5)
+                logo_size = reopened.get_asset(logo_path)['size']
+                reopened.close()
+                
+                ok = (len(first['ui_elements']) == 1 and len(first['corporate_assets']) == 1
+                      and len(first['content_images']) == 1
+                      and png_paths == [os.path.join(assets_dir, "ui", "button.png"), new_path]
+                      and reopened.count() == 4 and listed == 0 and verified
+                      and reopened.stats['verified'] == 1 and logo_size == 30)
+                
+                # Mit inotify (falls verfügbar): Löschung ohne Abgleich sichtbar
+                watched = AssetIndex(roots, formats, index_path=None, watch=True)
+                watched.open()
+                mode = "mtime-Abgleich"
+                if watched.get_stats()['watching']:
+                    mode = "inotify"
+                    rescans = watched.stats['rescans']
+                    os.unlink(new_path)
+                    deadline = time.time() + 2
+                    while watched.count() != 3 and time.time() < deadline:
+                        time.sleep(0.02)
+                    ok = ok and watched.count() == 3 and watched.stats['rescans'] == rescans
+                watched.close()
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+            
+            if ok:
+                self.log_result("Asset-Index", "PASS",
+                              f"Kategorien/Endungen korrekt, Neustart ohne Listing, "
+                              f"in-place Änderung im Hintergrund erkannt, Watcher: {mode}")
+                return True
+            
+            self.log_result("Asset-Index", "FAIL",
+                          f"Kategorien {first}, PNG {png_paths}, gelistet {listed}, Logo {logo_size} Bytes")
+            return False
+            
+        except Exception as e:
+            self.log_result("Asset-Index", "FAIL", f"Asset-Index Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_thumbnail_cache(self):
+        """Test 25: Persistenter Thumbnail-Cache mit Hintergrund-Erzeugung"""
+        print("🔍 Test 25: Teste Thumbnail-Cache...")
+        
+        try:
+            import tempfile
+            import shutil
+            from PIL import Image
+            from ui.components.thumbnail_cache import ThumbnailCache
+            
+            class Timer:
+                """Ersatz für das Tk-Widget: sammelt after()-Aufrufe"""
+                def __init__(self):
+                    self.calls = []
+                def after(self, delay_ms, func, *args):
+                    self.calls.append((func, args))
+            
+            directory = tempfile.mkdtemp(prefix="thumbnail_test_")
+            try:
+                path = os.path.join(directory, "foto.jpg")
+                Image.new('RGB', (800, 400), (200, 50, 50)).save(path)
+                cache_dir = os.path.join(directory, "thumbnails")
+                
+                cache = ThumbnailCache(directory=cache_dir, workers=2)
+                timer, delivered = Timer(), []
+                immediate = cache.request(timer, path, (64, 64), delivered.append, square=True)
+                deadline = time.time() + 5
+                while cache.pending() and time.time() < deadline:
+                    time.sleep(0.01)
+                cache.deliver()
+                cache.shutdown()
+                
+                # Neuer Prozess-Start: Treffer von Disk, ohne Worker
+                reopened = ThumbnailCache(directory=cache_dir)
+                from_disk = reopened.request(timer, path, (64, 64), delivered.append, square=True)
+                
+                # Geänderte Datei (mtime/Größe) -> neuer Schlüssel, kein veraltetes Thumbnail
+                Image.new('RGB', (300, 600), (0, 0, 200)).save(path)
+                os.utime(path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+                stale = reopened.get(path, (64, 64), square=True)
+                fresh = reopened.get_or_create(path, (300, 200))
+                reopened.shutdown()
+                
+                # Dauerbetrieb: Budget wird nicht nur beim Start, sondern alle prune_every Thumbnails durchgesetzt
+                budget = ThumbnailCache(directory=os.path.join(directory, "budget"), max_bytes=400, workers=1)
+                budget.prune_every = 4
+                for width in range(40, 52):
+                    budget.request(Timer(), path, (width, width), lambda image: None)
+                deadline = time.time() + 10
+                while (budget.pending() or budget._pruning) and time.time() < deadline:
+                    time.sleep(0.01)
+                budget.shutdown()
+                budget_stats = budget.get_stats()
+                
+                # Sonstige Datei-Zugriffe (Bildgröße) im Pool, gleiche Keys nur einmal, Zustellung per after()
+                jobs, job_timer, results = ThumbnailCache(directory=cache_dir, workers=1), Timer(), []
+                release = threading.Event()
+                for _ in range(2):
+                    jobs.run(job_timer, 'size', lambda: release.wait(5) and Image.open(path).size, results.append)
+                coalesced = jobs.pending()
+                release.set()
+                deadline = time.time() + 5
+                while jobs.pending() and time.time() < deadline:
+                    time.sleep(0.01)
+                jobs.deliver()
+                jobs.shutdown()
+                
+                ok = (immediate is None and len(delivered) == 1 and delivered[0].size == (64, 64)
+                      and len(timer.calls) == 1 and from_disk is not None
+                      and reopened.stats['disk_hits'] == 1 and stale is None
+                      and fresh is not None and fresh.size == (100, 200)
+                      and budget_stats['generated'] == 12 and budget_stats['pruned'] > 0
+                      and coalesced == 1 and results == [(300, 600)] * 2 and len(job_timer.calls) == 1)
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+            
+            if ok:
+                self.log_result("Thumbnail-Cache", "PASS",
+                              "Erzeugung im Worker, Zustellung per after(), Disk-Treffer nach Neustart, "
+                              "mtime-Invalidierung, periodisches Prune, Hintergrund-Jobs")
+                return True
+            
+            self.log_result("Thumbnail-Cache", "FAIL", f"Zugestellt {len(delivered)}, Stats {reopened.get_stats()}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Thumbnail-Cache", "FAIL", f"Thumbnail-Cache Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_virtual_asset_list(self):
+        """Test 26: Virtualisierte Asset-Liste - konstante Zeilenanzahl bei beliebig vielen Assets"""
+        print("🔍 Test 26: Teste virtualisierte Asset-Liste...")
+        
+        try:
+            from ui.components.asset_browser import visible_rows, ROW_HEIGHT
+            
+            viewport = 300
+            sizes = set()
+            for total in (3, 50, 10000):
+                for top in range(0, total * ROW_HEIGHT, ROW_HEIGHT // 4):
+                    first, last = visible_rows(top, viewport, total)
+                    sizes.add(last - first)
+            pool_size = max(sizes)
+            
+            # Zeilen-Pool wie im Widget (Index -> Zeile per Modulo): 200 Zeilen Scrollweg
+            bound, rebinds = {}, 0
+            for top in range(0, 200 * ROW_HEIGHT, ROW_HEIGHT // 4):
+                first, last = visible_rows(top, viewport, 10000)
+                for index in range(first, last):
+                    if bound.get(index % pool_size) != index:
+                        bound[index % pool_size] = index
+                        rebinds += 1
+            
+            ok = (pool_size <= viewport // ROW_HEIGHT + 2 + 2 * 2 and visible_rows(0, viewport, 0) == (0, 0)
+                  and visible_rows(0, viewport, 3) == (0, 3) and rebinds <= 200 + pool_size)
+            
+            if ok:
+                self.log_result("Virtuelle Asset-Liste", "PASS",
+                              f"Max. {pool_size} Zeilen-Widgets bei 10000 Assets, {rebinds} Neubindungen für 200 Zeilen Scrollweg")
+                return True
+            
+            self.log_result("Virtuelle Asset-Liste", "FAIL", f"Zeilen {sorted(sizes)}, Neubindungen {rebinds}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Virtuelle Asset-Liste", "FAIL", f"Virtuelle Asset-Liste Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_asset_search(self):
+        """Test 27: Such-Index für Assets (Teilstring, Präfix, Endung, inkrementell)"""
+        print("🔍 Test 27: Teste Asset-Suche...")
+        
+        try:
+            import tempfile
+            import shutil
+            from PIL import Image
+            from models.asset_index import AssetIndex
+            from models.asset_search import AssetSearchIndex
+            
+            directory = tempfile.mkdtemp(prefix="asset_search_test_")
+            try:
+                assets_dir = os.path.join(directory, "assets")
+                content_dir = os.path.join(directory, "content")
+                os.makedirs(assets_dir)
+                os.makedirs(os.path.join(content_dir, "user_uploads"))
+                for name, size in (("Firmenlogo_blau.png", (400, 100)), ("logo_rot.jpg", (50, 50)),
+                                   ("messestand_2024.jpg", (1920, 1080)), ("prospekt.pdf", None)):
+                    path = os.path.join(assets_dir, name)
+                    if size:
+                        Image.new('RGB', size).save(path)
+                    else:
+                        with open(path, 'wb') as f:
+                            f.write(b"%PDF-1.4")
+                
+                index = AssetIndex({assets_dir: 'corporate', content_dir: 'content'},
+                                   {'images': ['.png', '.jpg'], 'documents': ['.pdf']},
+                                   index_path=None, watch=False, rescan_interval=3600)
+                search = AssetSearchIndex(index)
+                names = lambda assets: [asset['filename'] for asset in assets]
+                
+                substring = names(search.search("logo"))
+                prefix = names(search.search("logo*"))
+                combined = names(search.search("logo .jpg"))
+                # Pixel-Sortierung liest keine Dateien - unbekannte Größen zuerst ans Ende
+                cold = names(search.search(".jpg .png", sort='pixels', descending=True))
+                cold_reads = search.stats['measured']
+                search.measure(search.search(".jpg .png"))
+                by_pixels = names(search.search(".jpg .png", sort='pixels', descending=True))
+                
+                # Upload: sofort auffindbar, ohne Abgleich/Watcher
+                upload = os.path.join(content_dir, "user_uploads", "Logo_Neu.png")
+                Image.new('RGB', (10, 10)).save(upload)
+                index.notify_path(upload)
+                uploaded = search.search("logo", category='user_uploads')
+                index.close()
+                
+                ok = (substring == ["Firmenlogo_blau.png", "logo_rot.jpg"] and prefix == ["logo_rot.jpg"]
+                      and combined == ["logo_rot.jpg"]
+                      and cold == ["Firmenlogo_blau.png", "logo_rot.jpg", "messestand_2024.jpg"] and cold_reads == 0
+                      and by_pixels == ["messestand_2024.jpg", "Firmenlogo_blau.png", "logo_rot.jpg"]
+                      and names(uploaded) == ["Logo_Neu.png"] and search.stats['updates'] == 1
+                      and search.cached_dimensions(uploaded[0], default=False) is False
+                      and search.dimensions(uploaded[0]) == (10, 10))
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+            
+            if ok:
+                self.log_result("Asset-Suche", "PASS",
+                              "Teilstring/Präfix/Endung/Pixel-Sortierung korrekt, Upload sofort auffindbar")
+                return True
+            
+            self.log_result("Asset-Suche", "FAIL",
+                          f"Teilstring {substring}, Präfix {prefix}, Kombiniert {combined}, "
+                          f"Pixel {cold} -> {by_pixels}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Asset-Suche", "FAIL", f"Asset-Suche Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_write_behind_storage(self):
+        """Test 28: StorageManager mit Write-behind, Zusammenfassung pro Pfad und atomaren Writes"""
+        print("🔍 Test 28: Teste Write-behind StorageManager...")
+        
+        try:
+            import tempfile
+            import shutil
+            from core.storage import StorageManager
+            
+            directory = tempfile.mkdtemp(prefix="storage_test_")
+            try:
+                storage = StorageManager(write_behind=True, fsync=False)
+                storage.data_dir = directory
+                
+                for i in range(200):
+                    storage.save_json({'counter': i}, "state.json")
+                storage.save_yaml({'name': 'Messe'}, "config.yaml", subdirectory="sub")
+                read_back = storage.load_json("state.json")  # Vor dem Flush aus der Warteschlange
+                drained = storage.flush(timeout=10)
+                stats = storage.get_stats()
+                
+                with open(os.path.join(directory, "state.json"), 'r', encoding='utf-8') as f:
+                    on_disk = json.load(f)
+                leftovers = [name for _, _, files in os.walk(directory) for name in files if name.startswith('.tmp_')]
+                
+                # Rechte: neue Dateien nach umask (nicht 0600 von mkstemp), bestehende behalten ihre Rechte
+                state_path = os.path.join(directory, "state.json")
+                modes_ok = True
+                if os.name == 'posix':
+                    umask = os.umask(0)
+                    os.umask(umask)
+                    new_mode = os.stat(state_path).st_mode & 0o777
+                    os.chmod(state_path, 0o640)
+                    storage.save_json({'counter': 199}, "state.json")
+                    storage.flush(timeout=10)
+                    modes_ok = new_mode == 0o666 & ~umask and os.stat(state_path).st_mode & 0o777 == 0o640
+                
+                # Nicht serialisierbare Daten dürfen die bestehende Datei nicht abschneiden
+                failed = storage.save_json({'broken': object()}, "state.json")
+                storage.flush(timeout=10)
+                intact = storage.load_json("state.json")
+                
+                ok = (read_back == {'counter': 199} and drained and on_disk == {'counter': 199}
+                      and stats['written'] < 200 and stats['coalesced'] > 0 and stats['pending'] == 0
+                      and storage.load_yaml("config.yaml", subdirectory="sub") == {'name': 'Messe'}
+                      and not leftovers and modes_ok and failed is None and intact == {'counter': 199}
+                      and storage.delete_file("state.json") and not storage.file_exists("state.json"))
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+            
+            if ok:
+                self.log_result("Write-behind Storage", "PASS",
+                              f"201 Saves -> {stats['written']} atomare Writes (pro Pfad zusammengefasst), Flush-Barriere")
+                return True
+            
+            self.log_result("Write-behind Storage", "FAIL",
+                          f"Gelesen {read_back}, Disk {on_disk}, Rechte ok: {modes_ok}, Stats {stats}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Write-behind Storage", "FAIL", f"Write-behind Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_incremental_backups(self):
+        """Test 29: Inkrementelle Hard-Link-Snapshots mit Aufbewahrung und Wiederherstellung"""
+        print("🔍 Test 29: Teste inkrementelle Backups...")
+        
+        try:
+            import tempfile
+            import shutil
+            from core.storage import StorageManager
+            
+            directory = tempfile.mkdtemp(prefix="backup_test_")
+            try:
+                storage = StorageManager(write_behind=False, fsync=False)
+                storage.data_dir = os.path.join(directory, "data")
+                storage.exports_dir = os.path.join(directory, "exports")
+                storage.ensure_directories()
+                for i in range(10):
+                    storage.save_json({'slide': i, 'text': "x" * 1000}, f"slide_{i}.json", subdirectory="slides")
+                
+                first = storage.backup_data()
+                first_stats = storage.last_backup_stats
+                time.sleep(0.01)
+                storage.save_json({'slide': 3, 'text': "geändert"}, "slide_3.json", subdirectory="slides")
+                second = storage.backup_data()
+                second_stats = storage.last_backup_stats
+                
+                shared = (os.stat(os.path.join(first, "data", "slides", "slide_0.json")).st_ino ==
+                          os.stat(os.path.join(second, "data", "slides", "slide_0.json")).st_ino)
+                
+                # Aufbewahrung: nur die 2 neuesten Snapshots bleiben
+                storage.save_json({'extra': True}, "extra.json")
+                third = storage.backup_data()
+                pruned = storage.prune_backups(keep=2)
+                backups = storage.list_backups()
+                
+                # Wiederherstellung des zweiten Snapshots (extra.json verschwindet, slide_3 geändert)
+                restored = storage.restore_backup(os.path.basename(second))
+                slide_3 = storage.load_json("slide_3.json", subdirectory="slides")
+                extra_gone = not storage.file_exists("extra.json")
+                
+                ok = (first_stats == {'linked': 0, 'copied': 10}
+                      and second_stats == {'linked': 9, 'copied': 1} and shared
+                      and pruned == 1 and backups == [os.path.basename(second), os.path.basename(third)]
+                      and restored and slide_3 == {'slide': 3, 'text': "geändert"} and extra_gone
+                      and len(storage.list_backups()) == 3)  # + Sicherungs-Snapshot vor dem Restore
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+            
+            if ok:
+                self.log_result("Inkrementelle Backups", "PASS",
+                              "2. Snapshot: 9 Hard-Links + 1 Kopie, Aufbewahrung und Restore korrekt")
+                return True
+            
+            self.log_result("Inkrementelle Backups", "FAIL",
+                          f"Stats {first_stats}/{second_stats}, geteilt {shared}, Snapshots {backups}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Inkrementelle Backups", "FAIL", f"Backup Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_compressed_storage(self):
+        """Test 30: Komprimierte JSON/YAML-Dateien - Kodek nach Endung, Erkennung am Dateikopf"""
+        print("🔍 Test 30: Teste komprimierte Speicherformate...")
+        
+        try:
+            import tempfile
+            import shutil
+            from core import compression
+            from core.storage import StorageManager
+            
+            directory = tempfile.mkdtemp(prefix="compression_test_")
+            try:
+                storage = StorageManager(write_behind=True, fsync=False)
+                storage.data_dir = directory
+                data = {'slides': {str(i): {'title': f"Folie {i} – Übersicht", 'content': "Text " * 100}
+                                   for i in range(20)}}
+                
+                codecs = compression.available_codecs()
+                for codec in codecs:
+                    extension = compression.extension_for(codec)
+                    storage.save_json(data, f"deck.json{extension}")
+                    storage.save_yaml(data, f"deck.yaml{extension}")
+                pending_ok = all(storage.load_json(f"deck.json{compression.extension_for(codec)}") == data
+                                 for codec in codecs)
+                storage.save_json(data, "deck.json")
+                storage.flush(timeout=10)
+                
+                plain_size = os.path.getsize(os.path.join(directory, "deck.json"))
+                sizes = {}
+                loaded_ok = pending_ok
+                for codec in codecs:
+                    name = f"deck.json{compression.extension_for(codec)}"
+                    with open(os.path.join(directory, name), 'rb') as f:
+                        detected = compression.detect(f.read(compression.MAGIC_LENGTH))
+                    sizes[codec] = os.path.getsize(os.path.join(directory, name))
+                    loaded_ok = (loaded_ok and detected == codec
+                                 and storage.load_json(name) == data
+                                 and storage.load_yaml(f"deck.yaml{compression.extension_for(codec)}") == data)
+                
+                # Erkennung unabhängig vom Dateinamen: gzip-Inhalt unter .json
+                shutil.copy(os.path.join(directory, "deck.json.gz"), os.path.join(directory, "renamed.json"))
+                renamed_ok = storage.load_json("renamed.json") == data
+                
+                with compression.open_text(os.path.join(directory, "stream.yml.xz"), 'w') as f:
+                    f.write("titel: Messe\n")
+                with compression.open_text(os.path.join(directory, "stream.yml.xz")) as f:
+                    streamed = f.read()
+                
+                ok = (loaded_ok and renamed_ok and streamed == "titel: Messe\n"
+                      and all(size < plain_size / 5 for size in sizes.values())
+                      and compression.base_extension("deck.yaml.xz") == '.yaml'
+                      and compression.split_extension("deck.json") == ("deck.json", None))
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+            
+            if ok:
+                summary = ", ".join(f"{codec} {size} B" for codec, size in sizes.items())
+                self.log_result("Komprimierte Speicherformate", "PASS",
+                              f"JSON {plain_size} B -> {summary}; Erkennung per Magic-Bytes")
+                return True
+            
+            self.log_result("Komprimierte Speicherformate", "FAIL",
+                          f"Geladen {loaded_ok}, umbenannt {renamed_ok}, Größen {sizes} / {plain_size}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Komprimierte Speicherformate", "FAIL", f"Kompressions-Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_yaml_io(self):
+        """Test 31: YAML-Schicht mit libyaml (CSafeLoader/CSafeDumper) und Python-Fallback"""
+        print("🔍 Test 31: Teste YAML-Schicht...")
+        
+        try:
+            import yaml
+            from core import yaml_io
+            
+            sample_path = os.path.join(self.base_dir, 'presentations', 'beispiel_presentation.yaml')
+            with open(sample_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            data = yaml_io.load(text)
+            
+            # Gleiches Ergebnis wie der bisherige Pfad, in beide Richtungen
+            same_load = data == yaml.safe_load(text)
+            dumped = yaml_io.dump(data)
+            round_trip = yaml.safe_load(dumped) == data and 'Präsentation' in dumped
+            same_dump = dumped == yaml.dump(data, default_flow_style=False, allow_unicode=True, indent=2)
+            
+            # Nur sichere Typen: Tupel als Liste, keine python/*-Tags
+            tuples_safe = yaml_io.load(yaml_io.dump({'pos': (1, 2)})) == {'pos': [1, 2]}
+            try:
+                yaml_io.dump({'obj': object()})
+                rejects_objects = False
+            except yaml.YAMLError:
+                rejects_objects = True
+            
+            ok = same_load and round_trip and same_dump and tuples_safe and rejects_objects
+            
+            if ok:
+                self.log_result("YAML-Schicht", "PASS",
+                              f"Backend {yaml_io.BACKEND}, Ergebnis identisch zu safe_load/dump, nur sichere Typen")
+                return True
+            
+            self.log_result("YAML-Schicht", "FAIL",
+                          f"Laden {same_load}, Round-Trip {round_trip}, Dump {same_dump}, "
+                          f"Tupel {tuples_safe}, Objekte abgelehnt {rejects_objects}")
+            return False
+            
+        except Exception as e:
+            self.log_result("YAML-Schicht", "FAIL", f"YAML Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_queue_logging(self):
+        """Test 32: Logging über QueueHandler/QueueListener mit begrenzter Queue und Drop-Policy"""
+        print("🔍 Test 32: Teste Queue-Logging...")
+        
+        try:
+            import queue
+            import logging
+            import tempfile
+            import shutil
+            import threading
+            from core.logger import BertrandtLogger, BoundedQueueHandler
+            
+            # Drop-Policy: volle Queue verwirft INFO, meldet die Anzahl sobald wieder Platz ist
+            log_queue = queue.Queue(maxsize=5)
+            handler = BoundedQueueHandler(log_queue, overflow='drop')
+            for i in range(10):
+                handler.handle(logging.LogRecord("test", logging.INFO, __file__, 0, f"Eintrag {i}", None, None))
+            dropped = handler.dropped
+            while not log_queue.empty():
+                log_queue.get_nowait()
+            handler.handle(logging.LogRecord("test", logging.INFO, __file__, 0, "Danach", None, None))
+            notice = log_queue.get_nowait()
+            after = log_queue.get_nowait()
+            drop_ok = (dropped == 5 and notice.levelno == logging.WARNING and "5 records dropped" in notice.getMessage()
+                       and after.getMessage() == "Danach")
+            
+            # Volle Queue ohne Leser: WARNING wartet höchstens put_timeout statt ewig
+            stuck = BoundedQueueHandler(queue.Queue(maxsize=1), overflow='drop', put_timeout=0.05)
+            started = time.time()
+            for i in range(3):
+                stuck.handle(logging.LogRecord("test", logging.WARNING, __file__, 0, f"Warnung {i}", None, None))
+            drop_ok = drop_ok and stuck.dropped == 2 and time.time() - started < 2
+            
+            directory = tempfile.mkdtemp(prefix="logger_test_")
+            test_logger = BertrandtLogger(name="QueueLoggerTest", use_queue=True, log_dir=directory)
+            try:
+                test_logger.handlers[0].setStream(open(os.devnull, 'w'))
+                
+                def worker(n):
+                    for i in range(250):
+                        test_logger.info(f"Thread {n} Eintrag {i}")
+                
+                threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                flushed = test_logger.flush(timeout=10)
+                stats = test_logger.get_stats()
+                queue_handler = test_logger.queue_handler
+                test_logger.shutdown()
+                test_logger.warning("Nach dem Shutdown")  # Synchron über die direkten Handler
+                # Thread, der noch den alten QueueHandler hält: direkt geschrieben, kein Hängen
+                queue_handler.handle(logging.LogRecord(test_logger.logger.name, logging.WARNING, __file__, 0,
+                                                       "Alter Handler", None, None))
+                late_flushed = test_logger.flush(timeout=1)
+                
+                log_file = os.path.join(directory, os.listdir(directory)[0])
+                with open(log_file, 'r', encoding='utf-8') as f:
+                    lines = f.read().splitlines()
+            finally:
+                for h in test_logger.handlers:
+                    h.close()
+                test_logger.logger.handlers.clear()
+                shutil.rmtree(directory, ignore_errors=True)
+            
+            ok = (drop_ok and flushed and stats['mode'] == 'queue' and stats['dropped'] == 0
+                  and len(lines) == 1002 and lines[-2].endswith("Nach dem Shutdown")
+                  and lines[-1].endswith("Alter Handler") and late_flushed
+                  and not test_logger.get_stats()['running'])
+            
+            if ok:
+                self.log_result("Queue-Logging", "PASS",
+                              "1000 Einträge aus 4 Threads vollständig, Drop-Policy meldet 5 verworfene, "
+                              "begrenzte Wartezeit, Shutdown drainiert")
+                return True
+            
+            self.log_result("Queue-Logging", "FAIL",
+                          f"Drop {drop_ok}, Flush {flushed}, Stats {stats}, Zeilen {len(lines)}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Queue-Logging", "FAIL", f"Logging Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_slide_raster_cache(self):
+        """Test 33: Raster-Cache - Prefetch der Nachbar-Slides, Invalidierung bei Edit, Load und Resize"""
+        print("🔍 Test 33: Teste Slide-Raster-Cache...")
+        
+        try:
+            from models.content import content_manager
+            from ui.components.slide_rasterizer import SlideRasterCache, SlideRasterizer
+            
+            def wait_idle(cache):
+                deadline = time.time() + 10
+                while cache.pending() and time.time() < deadline:
+                    time.sleep(0.01)
+            
+            cache = SlideRasterCache(max_slides=8)
+            size = (320, 180)
+            slide = content_manager.get_slide(3)
+            original = (slide.title, slide.content)
+            try:
+                # Aktuelle Slide 2 synchron, 1 und 3 im Hintergrund
+                current = cache.render_now(2, size)
+                cache.prefetch([3, 1], size)
+                wait_idle(cache)
+                prefetched = all(cache.get(slide_id, size) is not None for slide_id in (1, 2, 3))
+                
+                # Snapshot ist vom lebenden Objekt entkoppelt
+                snapshot = SlideRasterizer.snapshot(slide, 3)
+                snapshot['canvas_elements'].append({'type': 'text'})
+                isolated = len(snapshot['canvas_elements']) == len(slide.canvas_elements) + 1
+                
+                # Edit: nur Slide 3 wird verworfen, Nachbarn bleiben
+                content_manager.update_slide_content(3, original[0] + " (geändert)", original[1])
+                edit_ok = cache.get(3, size) is None and cache.get(1, size) is not None
+                cache.prefetch([3], size)
+                wait_idle(cache)
+                refetched = cache.get(3, size) is not None
+                
+                # Load: ganzer Cache verworfen
+                cache.on_content_changed(1, None, 'load')
+                load_ok = all(cache.get(slide_id, size) is None for slide_id in (1, 2, 3))
+                
+                # Resize: Bitmaps der alten Größe sind ungültig
+                cache.prefetch([1, 2], size)
+                wait_idle(cache)
+                resized = cache.get(1, (640, 360)) is None and cache.get(1, size) is None
+            finally:
+                content_manager.update_slide_content(3, original[0], original[1])
+                content_manager.content_observers.remove(cache.on_content_changed)
+            
+            ok = current is not None and prefetched and isolated and edit_ok and refetched and load_ok and resized
+            if ok:
+                self.log_result("Slide-Raster-Cache", "PASS",
+                              "Nachbarn vorgerendert, Edit verwirft nur eine Slide, Load/Resize alles")
+                return True
+            
+            self.log_result("Slide-Raster-Cache", "FAIL",
+                          f"Prefetch {prefetched}, Snapshot {isolated}, Edit {edit_ok}/{refetched}, "
+                          f"Load {load_ok}, Resize {resized}")
+            return False
+            
+        except Exception as e:
+            self.log_result("Slide-Raster-Cache", "FAIL", f"Raster-Cache Test fehlgeschlagen: {e}")
+            return False
+    
+    def test_serial_reader(self):
+        """Test 34: Serial-Reader - Zeilen über Read-Grenzen, mehrere Zeilen je Chunk, cancel_read beim Trennen"""
+        print("🔍 Test 34: Teste Serial-Reader...")
+        
+        try:
+            from models.hardware import (FrameDecoder, HardwareConnection, encode_signal_frame, encode_frame,
+                                         FRAME_PAGE, FRAME_UDP_PAGE)
+            
+            # Zeile auf zwei Reads verteilt
+            decoder = FrameDecoder()
+            split = [decoder.decode_lines(b"SIGNAL:pa"), decoder.decode_lines(b"ge_1:1\nACK"),
+                     decoder.decode_lines(b":OK\n")]
+            split_ok = split == [[], ["SIGNAL:page_1:1"], ["ACK:OK"]]
+            
+            # Mehrere Zeilen (und ein Binär-Frame) in einem Chunk
+            frame = encode_signal_frame("page_2", 1)
+            multi = FrameDecoder().decode_lines(b"A\nB\n" + frame + b"C\n")
+            multi_ok = multi == ["A", "B", "SIGNAL:page_2:1", "C"]
+            
+            # Binär-Frame auf zwei Reads verteilt
+            decoder = FrameDecoder()
+            frame_split = decoder.decode_lines(frame[:3]) + decoder.decode_lines(frame[3:])
+            frame_ok = frame_split == ["SIGNAL:page_2:1"]
+            
+            # Gültige CRC, aber zu kurze Payload: verwerfen statt struct.error, Puffer blockiert nicht
+            decoder = FrameDecoder()
+            short = decoder.decode_lines(encode_frame(FRAME_PAGE, b'\x01'))
+            short += decoder.decode_lines(encode_frame(FRAME_UDP_PAGE, b'\x7f\x00\x00\x01\x02') + b"D\n")
+            short_ok = short == ["D"] and decoder.short_frames == 2 and not decoder.buffer
+            
+            # Wirft der Handler, ist die Nachricht trotzdem verbraucht
+            decoder = FrameDecoder()
+            def failing(frame_type, payload):
+                raise RuntimeError("Handler-Fehler")
+            try:
+                decoder.feed(b"X\n", failing)
+            except RuntimeError:
+                pass
+            short_ok = short_ok and decoder.decode_lines(b"Y\n") == ["Y"]
+            
+            # Blockierendes read() ohne Timeout: disconnect() muss den Reader per cancel_read wecken
+            cancel_ok, cancel_ms = None, None
+            try:
+                import pty
+                import tty
+            except ImportError:
+                pty = None
+            if pty is not None:
+                master, slave = pty.openpty()
+                tty.setraw(slave)
+                connection = HardwareConnection(os.ttyname(slave), "PTY-Cancel")
+                connection.reader_mode = 'blocking'
+                try:
+                    if connection.connect():
+                        connection.connection.timeout = None  # read() blockiert unbegrenzt
+                        connection.start_reading()
+                        os.write(master, b"HELLO\n")
+                        time.sleep(0.2)
+                        received = [entry['data'] for entry in connection.telemetry.read_new()]
+                        start = time.perf_counter()
+                        connection.disconnect()
+                        cancel_ms = (time.perf_counter() - start) * 1000
+                        cancel_ok = (received == ["HELLO"] and not connection.thread.is_alive()
+                                     and cancel_ms < 1000)
+                finally:
+                    if connection.connection and connection.connection.is_open:
+                        connection.connection.close()
+                    os.close(master)
+                    os.close(slave)
+            
+            ok = split_ok and multi_ok and frame_ok and short_ok and cancel_ok is not False
+            if ok:
+                detail = f"disconnect() nach {cancel_ms:.0f} ms" if cancel_ms is not None else "cancel_read ohne PTY übersprungen"
+                self.log_result("Serial-Reader", "PASS",
+                              f"Zeilen/Frames über Read-Grenzen, mehrere je Chunk, kurze Frames verworfen, {detail}")
+                return True
+            
+            self.log_result("Serial-Reader", "FAIL",
+                          f"Split {split}, Multi {multi}, Frame {frame_split}, Kurz {short}, "
+                          f"cancel_read {cancel_ok} ({cancel_ms} ms)")
+            return False
+            
+        except Exception as e:
+            self.log_result("Serial-Reader", "FAIL", f"Serial-Reader Test fehlgeschlagen: {e}")
+            return False
+    
+    def create_test_assets(self):
+        """Test-Assets erstellen falls keine vorhanden"""
+        print("🔧 Erstelle Test-Assets...")
+        
+        try:
+            from PIL import Image
+            
+            # Test-Verzeichnisse erstellen
+            test_dirs = [
+                os.path.join(self.base_dir, 'assets', 'test'),
+                os.path.join(self.base_dir, 'content', 'test_images')
+            ]
+            
+            for test_dir in test_dirs:
+                os.makedirs(test_dir, exist_ok=True)
+            
+            # Einfache Test-Bilder erstellen
+            for i, test_dir in enumerate(test_dirs):
+                for j in range(3):
+                    # Farbiges Test-Bild erstellen
+                    img = Image.new('RGB', (200, 150), color=(100 + i*50, 150 + j*30, 200))
+                    img_path = os.path.join(test_dir, f'test_image_{i}_{j}.png')
+                    img.save(img_path)
+            
+            self.log_result("Test Assets", "PASS", "Test-Assets erfolgreich erstellt")
+            return True
+            
+        except Exception as e:
+            self.log_result("Test Assets", "FAIL", f"Test-Assets Erstellung fehlgeschlagen: {e}")
+            return False
+    
+    def run_quick_tests(self):
+        """Führt schnelle Tests aus"""
+        print("🚀 Starte SCHNELLE Tests...\n")
+        
+        tests = [
+            self.test_file_structure,
+            self.test_imports,
+            self.test_content_manager,
+            self.test_assets_availability
+        ]
+        
+        passed = 0
+        for test in tests:
+            if test():
+                passed += 1
+            print()
+        
+        return passed, len(tests)
+    
+    def run_all_tests(self):
+        """Führt alle Tests aus"""
+        print("🚀 Starte VOLLSTÄNDIGE Tests...\n")
+        
+        tests = [
+            self.test_file_structure,
+            self.test_imports, 
+            self.test_content_manager,
+            self.test_creator_tab_functions,
+            self.test_demo_tab_sync,
+            self.test_slide_renderer,
+            self.test_assets_availability,
+            self.test_integration_flow,
+            self.test_performance,
+            self.test_image_cache,
+            self.test_retained_rendering,
+            self.test_async_hardware_loop,
+            self.test_hardware_reconnect,
+            self.test_signal_dispatcher,
+            self.test_hardware_simulator,
+            self.test_telemetry_ring,
+            self.test_binary_protocol,
+            self.test_change_feed,
+            self.test_observer_bus,
+            self.test_content_journal,
+            self.test_lazy_slide_store,
+            self.test_slide_records,
+            self.test_blob_store,
+            self.test_asset_index,
+            self.test_thumbnail_cache,
+            self.test_virtual_asset_list,
+            self.test_asset_search,
+            self.test_write_behind_storage,
+            self.test_incremental_backups,
+            self.test_compressed_storage,
+            self.test_yaml_io,
+            self.test_queue_logging,
+            self.test_slide_raster_cache,
+            self.test_serial_reader
+        ]
+        
+        passed = 0
+        for test in tests:
+            if test():
+                passed += 1
+            print()
+        
+        return passed, len(tests)
+    
+    # ==========================================
+    # BENCHMARKS
+    # ==========================================
+    
+    def bench_serial_reader(self):
+        """Benchmark: Serial-Reader (Polling vs. ereignisgesteuert) gegen ein PTY-Gerät"""
+        print("⏱️ Benchmark: Serial-Reader gegen PTY-Gerät...")
+        
+        try:
+            import pty
+            import tty
+            from models.hardware import HardwareConnection
+        except ImportError as e:
+            self.log_result("Bench Serial-Reader", "WARN", f"Nicht verfügbar: {e}")
+            return False
+        
+        message_count = 200
+        
+        for mode in ['poll', 'blocking']:
+            master, slave = pty.openpty()
+            tty.setraw(slave)
+            connection = HardwareConnection(os.ttyname(slave), f"PTY-{mode}")
+            connection.reader_mode = mode
+            
+            try:
+                if not connection.connect() or not connection.start_reading():
+                    self.log_result(f"Bench Serial-Reader ({mode})", "WARN", "PTY konnte nicht geöffnet werden")
+                    continue
+                
+                # CPU im Leerlauf (keine Daten)
+                cpu_start = time.process_time()
+                time.sleep(1.0)
+                idle_cpu = (time.process_time() - cpu_start) * 100
+                
+                # Latenz: Sendezeit steht in der Nachricht
+                for i in range(message_count):
+                    os.write(master, f"BENCH:{i}:{time.time():.6f}\n".encode('utf-8'))
+                    time.sleep(0.002)
+                time.sleep(0.2)
+                
+                latencies = []
+                for entry in connection.telemetry.read_new():
+                    sent = float(entry['data'].split(':')[2])
+                    latencies.append((entry['timestamp'] - sent) * 1000)
+                
+                latencies.sort()
+                if latencies:
+                    p50 = latencies[len(latencies) // 2]
+                    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+                    self.log_result(
+                        f"Bench Serial-Reader ({mode})", "PASS",
+                        f"{len(latencies)}/{message_count} Zeilen, Latenz p50 {p50:.2f} ms / p99 {p99:.2f} ms, "
+                        f"CPU idle {idle_cpu:.1f}%"
+                    )
+                else:
+                    self.log_result(f"Bench Serial-Reader ({mode})", "WARN", "Keine Zeilen empfangen")
+            finally:
+                connection.disconnect()
+                os.close(master)
+                os.close(slave)
+        
+        return True
+    
+    def bench_async_hardware_loop(self):
+        """Benchmark: asyncio-Backend mit vielen PTY-Controllern"""
+        print("⏱️ Benchmark: asyncio-Backend mit 24 PTY-Controllern...")
+        
+        try:
+            import pty
+            import tty
+            from models.hardware import HardwareManager
+        except ImportError as e:
+            self.log_result("Bench Async-Loop", "WARN", f"Nicht verfügbar: {e}")
+            return False
+        
+        device_count = 24
+        message_count = 50
+        
+        for backend in ['threads', 'asyncio']:
+            manager = HardwareManager()
+            manager.backend = backend
+            ptys = []
+            # Pool-Threads für den Verbindungsaufbau nicht mitzählen
+            count_threads = lambda: len([
+                t for t in threading.enumerate() if not t.name.startswith('HardwareConnect')
+            ])
+            threads_before = count_threads()
+            
+            try:
+                for i in range(device_count):
+                    master, slave = pty.openpty()
+                    tty.setraw(slave)
+                    ptys.append((master, slave))
+                    manager.add_esp32(os.ttyname(slave), i + 1)
+                manager.connect_all()
+                threads_used = count_threads() - threads_before
+                
+                for n in range(message_count):
+                    for master, _ in ptys:
+                        os.write(master, f"BENCH:{n}:{time.time():.6f}\n".encode('utf-8'))
+                    time.sleep(0.002)
+                time.sleep(0.3)
+                
+                latencies = sorted(
+                    (entry['timestamp'] - float(entry['data'].split(':')[2])) * 1000
+                    for entry in manager.get_all_data()
+                )
+                if latencies:
+                    p50 = latencies[len(latencies) // 2]
+                    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+                    self.log_result(
+                        f"Bench Async-Loop ({backend})", "PASS",
+                        f"{len(latencies)}/{device_count * message_count} Zeilen, {threads_used} Threads, "
+                        f"Latenz p50 {p50:.2f} ms / p99 {p99:.2f} ms"
+                    )
+                else:
+                    self.log_result(f"Bench Async-Loop ({backend})", "WARN", "Keine Zeilen empfangen")
+            finally:
+                manager.disconnect_all()
+                for master, slave in ptys:
+                    os.close(master)
+                    os.close(slave)
+        
+        return True
+    
+    def bench_hardware_throughput(self):
+        """Benchmark: Durchsatz, Latenz und CPU pro Backend gegen den Simulator-Prozess"""
+        print("⏱️ Benchmark: Hardware-Durchsatz gegen simulierte Boards...")
+        
+        import subprocess
+        from core.config import config
+        from models.hardware import HardwareManager
+        
+        esp32_count, rate, duration = 4, 500, 2.0
+        
+        # Der Simulator-Prozess hat eine eigene Config - Log-Verzeichnis vor dem Import setzen
+        bootstrap = (f"from core.config import config; config.logging['log_dir'] = {config.logging['log_dir']!r}; "
+                     "import runpy; runpy.run_module('models.hardware_sim', run_name='__main__')")
+        
+        def percentile(values, p):
+            return values[min(len(values) - 1, int(len(values) * p))] if values else 0.0
+        
+        for backend in ['threads', 'asyncio']:
+            # Simulator in eigenem Prozess, damit nur die Empfangsseite CPU verbraucht
+            simulator = subprocess.Popen(
+                [sys.executable, '-c', bootstrap, '--esp32', str(esp32_count), '--giga',
+                 '--rate', str(rate), '--jitter', '0.2', '--duration', str(duration + 3)],
+                cwd=self.base_dir, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            )
+            manager = HardwareManager()
+            manager.backend = backend
+            
+            try:
+                ports = json.loads(simulator.stdout.readline())
+                for i in range(1, esp32_count + 1):
+                    manager.add_esp32(ports[f'esp32_{i}_port'], i)
+                manager.add_giga(ports['giga_port'])
+                manager.connect_all()
+                
+                time.sleep(0.2)
+                manager.get_all_data()  # Aufwärmphase verwerfen
+                
+                latencies, round_trips, received = [], [], 0
+                cpu_start, wall_start = time.process_time(), time.perf_counter()
+                
+                while time.perf_counter() - wall_start < duration:
+                    # Befehl mit Zeitstempel -> ACK misst die Round-Trip-Zeit
+                    manager.get_connection('esp32_1').send_signal('bench', f"{time.time():.6f}")
+                    time.sleep(0.05)
+                    for entry in manager.get_all_data():
+                        parts = entry['data'].split(':')
+                        received += 1
+                        if parts[0] in ('SENSOR', 'UDP_RX'):
+                            latencies.append((entry['timestamp'] - float(parts[2])) * 1000)
+                        elif parts[0] == 'ACK':
+                            round_trips.append((entry['timestamp'] - float(parts[3])) * 1000)
+                
+                wall = time.perf_counter() - wall_start
+                cpu = (time.process_time() - cpu_start) / wall * 100
+                latencies.sort()
+                round_trips.sort()
+                
+                self.log_result(
+                    f"Bench Durchsatz ({backend})", "PASS",
+                    f"{received / wall:.0f} Nachr./s, Latenz p50 {percentile(latencies, 0.5):.2f} / "
+                    f"p95 {percentile(latencies, 0.95):.2f} / p99 {percentile(latencies, 0.99):.2f} ms, "
+                    f"RTT p50 {percentile(round_trips, 0.5):.2f} ms, CPU {cpu:.1f}%"
+                )
+            except Exception as e:
+                self.log_result(f"Bench Durchsatz ({backend})", "WARN", f"Simulator nicht verfügbar: {e}")
+            finally:
+                manager.disconnect_all()
+                simulator.terminate()
+                simulator.wait()
+        
+        return True
+    
+    def bench_wire_protocol(self):
+        """Benchmark: Wire-Bytes und Parse-Kosten Text- vs. Binärprotokoll"""
+        print("⏱️ Benchmark: Text- vs. Binärprotokoll...")
+        
+        from models.hardware import FrameDecoder, encode_signal_frame, parse_frame
+        
+        commands = []
+        for i in range(10000):
+            if i % 3 == 0:
+                commands.append(('SIGNAL', None, f"page_{i % 40}", 1))
+            elif i % 3 == 1:
+                commands.append(('UDP_SEND', '192.168.1.100', f"page_{i % 40}", 1))
+            else:
+                commands.append(('SIGNAL', None, 'led_strip', i % 255))
+        
+        text_stream = b''.join(
+            (f"SIGNAL:{sid}:{value}\n" if ip is None else f"UDP_SEND:{ip}:{sid}:{value}\n").encode('utf-8')
+            for _, ip, sid, value in commands
+        )
+        binary_stream = b''.join(encode_signal_frame(sid, value, ip) for _, ip, sid, value in commands)
+        
+        # Text: bisheriges readline().decode('utf-8').strip() + split(':')
+        start = time.perf_counter()
+        parsed_text = [line.decode('utf-8').strip().split(':') for line in text_stream.splitlines()]
+        text_us = (time.perf_counter() - start) / len(commands) * 1e6
+        
+        # Binär: Frames aus 512-Byte-Häppchen, Felder per struct.unpack_from aus der memoryview
+        parsed_binary = []
+        decoder = FrameDecoder()
+        start = time.perf_counter()
+        for i in range(0, len(binary_stream), 512):
+            decoder.feed(binary_stream[i:i + 512],
+                         lambda frame_type, payload: parsed_binary.append(parse_frame(frame_type, payload)))
+        binary_us = (time.perf_counter() - start) / len(commands) * 1e6
+        
+        ok = len(parsed_text) == len(parsed_binary) == len(commands) and decoder.crc_errors == 0
+        self.log_result(
+            "Bench Wire-Protokoll", "PASS" if ok else "FAIL",
+            f"Text {len(text_stream) / len(commands):.1f} B/Befehl, {text_us:.2f} µs | "
+            f"Binär {len(binary_stream) / len(commands):.1f} B/Befehl, {binary_us:.2f} µs (inkl. CRC) | "
+            f"{len(binary_stream) / len(text_stream) * 100:.0f}% der Bytes"
+        )
+        return ok
+    
+    def bench_content_journal(self):
+        """Benchmark: Speicherkosten einer Slide-Änderung - Journal vs. save_to_file"""
+        print("⏱️ Benchmark: Content-Journal vs. Komplett-Speicherung...")
+        
+        import tempfile
+        import shutil
+        from models.content import EnhancedContentManager, SlideData
+        
+        results = {}
+        directory = tempfile.mkdtemp(prefix="journal_bench_")
+        try:
+            for slide_count in (10, 1000):
+                manager = EnhancedContentManager()
+                for slide_id in range(6, slide_count + 1):
+                    manager.slides[slide_id] = SlideData(slide_id, f"Slide {slide_id}", "Inhalt " * 50)
+                manager.enable_journal(os.path.join(directory, str(slide_count)))
+                manager.journal.compact_entries = 10 ** 9  # Nur das Anhängen messen
+                
+                edits = 200
+                start = time.perf_counter()
+                for i in range(edits):
+                    manager.update_slide_content(1, f"Titel {i}", "Text")
+                journal_ms = (time.perf_counter() - start) / edits * 1000
+                
+                start = time.perf_counter()
+                for i in range(5):
+                    manager.save_to_file(os.path.join(directory, f"full_{slide_count}_{i}.json"))
+                full_ms = (time.perf_counter() - start) / 5 * 1000
+                manager.close_journal()
+                results[slide_count] = (journal_ms, full_ms)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        
+        small, large = results[10], results[1000]
+        # Journal-Kosten dürfen kaum mit der Slide-Anzahl wachsen
+        ok = large[0] < small[0] * 3 + 0.5
+        self.log_result(
+            "Bench Content-Journal", "PASS" if ok else "FAIL",
+            f"10 Slides: Journal {small[0]:.3f} ms / Komplett {small[1]:.2f} ms | "
+            f"1000 Slides: Journal {large[0]:.3f} ms / Komplett {large[1]:.2f} ms (inkl. fsync)"
+        )
+        return ok
+    
+    def bench_lazy_loading(self):
+        """Benchmark: Öffnen einer großen Präsentation - JSON komplett vs. Container lazy"""
+        print("⏱️ Benchmark: Präsentation öffnen (JSON vs. Container)...")
+        
+        import tempfile
+        import shutil
+        import tracemalloc
+        from core.config import config
+        from models.content import EnhancedContentManager, SlideData
+        
+        directory = tempfile.mkdtemp(prefix="lazy_bench_")
+        try:
+            source = EnhancedContentManager()
+            for slide_id in range(1, 501):
+                slide = SlideData(slide_id, f"Slide {slide_id}", "Inhalt " * 20)
+                slide.canvas_elements = [{'type': 'image', 'image_data': 'QUJD' * 16000}]  # ~64 KB Base64
+                source.slides[slide_id] = slide
+            json_path = source.save_to_file(os.path.join(directory, "deck.json"))
+            container_path = source.save_to_file(os.path.join(directory, "deck.dmsp"))
+            del source
+            
+            # Nur das Parsen messen, nicht die Blob-Migration
+            saved_migrate = config.content.get('migrate_inline_images')
+            config.content['migrate_inline_images'] = False
+            
+            results = {}
+            for label, path in (("JSON", json_path), ("Container", container_path)):
+                manager = EnhancedContentManager()
+                tracemalloc.start()
+                start = time.perf_counter()
+                manager.load_from_file(path)
+                manager.get_slide(1)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                retained_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+                tracemalloc.stop()
+                results[label] = (elapsed_ms, retained_mb)
+                del manager
+        finally:
+            config.content['migrate_inline_images'] = saved_migrate
+            shutil.rmtree(directory, ignore_errors=True)
+        
+        ok = results["Container"][0] < results["JSON"][0]
+        self.log_result(
+            "Bench Lazy-Laden", "PASS" if ok else "FAIL",
+            f"500 Slides à 64 KB: JSON {results['JSON'][0]:.1f} ms / {results['JSON'][1]:.1f} MB | "
+            f"Container {results['Container'][0]:.1f} ms / {results['Container'][1]:.2f} MB"
+        )
+        return ok
+    
+    def bench_slide_memory(self):
+        """Benchmark: Speicherbedarf eines 500-Slide-Decks - dict-basiert vs. __slots__-Records"""
+        print("⏱️ Benchmark: Slide-Speicher (dict vs. __slots__)...")
+        
+        import tracemalloc
+        from datetime import datetime
+        from models.content import SlideData
+        
+        class DictSlide:
+            """Bisherige Darstellung als Referenz: __dict__, Element-Dicts, zwei datetime-Objekte"""
+            def __init__(self, data):
+                self.slide_id = data['slide_id']
+                self.title = data['title']
+                self.content = data['content']
+                self.layout = data['layout']
+                self.canvas_elements = [dict(element) for element in data['canvas_elements']]
+                self.assets = list(data['assets'])
+                self.config_data = dict(data['config_data'])
+                self.extra_data = dict(data['extra_data'])
+                self.created_at = datetime.fromisoformat(data['created_at'])
+                self.modified_at = datetime.fromisoformat(data['modified_at'])
+                self.revision = 0
+        
+        now = datetime.now().isoformat()
+        deck = [{
+            'slide_id': i, 'title': f"Slide {i}", 'content': "Inhalt", 'layout': 'mixed',
+            'canvas_elements': [
+                {'type': 'text', 'content': f"Titel {i}", 'x': 100, 'y': 80, 'font': 'Arial 32', 'is_title': True},
+                {'type': 'text', 'content': f"Text {i}", 'x': 100, 'y': 200, 'font': 'Arial 16', 'is_title': False},
+                {'type': 'window', 'widget_type': 'Text', 'text': 'A', 'coords': [10, 10], 'width': 60, 'height': 8},
+                {'type': 'window', 'widget_type': 'Label', 'text': 'B', 'coords': [50, 50], 'anchor': 'nw'},
+                {'type': 'image', 'x': 300, 'y': 300, 'width': 400, 'height': 300, 'file_path': f"assets/{i}.png"},
+                {'type': 'rectangle', 'coords': [0, 0, 100, 100], 'fill': '#FFFFFF', 'outline': '#000000'}
+            ],
+            'assets': [], 'config_data': {}, 'extra_data': {}, 'created_at': now, 'modified_at': now
+        } for i in range(1, 501)]
+        
+        results = {}
+        for label, factory in (("dict", DictSlide), ("slots", SlideData.from_dict)):
+            tracemalloc.start()
+            start = time.perf_counter()
+            slides = [factory(data) for data in deck]
+            load_ms = (time.perf_counter() - start) * 1000
+            memory_kb = tracemalloc.get_traced_memory()[0] / 1024
+            tracemalloc.stop()
+            results[label] = (memory_kb, load_ms)
+            del slides
+        
+        slides = [SlideData.from_dict(data) for data in deck]
+        start = time.perf_counter()
+        roundtrip = [slide.to_dict() for slide in slides]
+        save_ms = (time.perf_counter() - start) * 1000
+        
+        ok = results["slots"][0] < results["dict"][0] and roundtrip == deck
+        self.log_result(
+            "Bench Slide-Speicher", "PASS" if ok else "FAIL",
+            f"500 Slides: dict {results['dict'][0]:.0f} KB ({results['dict'][1]:.1f} ms) | "
+            f"slots {results['slots'][0]:.0f} KB ({results['slots'][1]:.1f} ms), "
+            f"-{(1 - results['slots'][0] / results['dict'][0]) * 100:.0f}% | to_dict {save_ms:.1f} ms"
+        )
+        return ok
+    
+    def bench_asset_index(self):
+        """Benchmark: scan_assets - voller os.walk vs. Asset-Index"""
+        print("⏱️ Benchmark: Asset-Scan vs. Asset-Index...")
+        
+        import tempfile
+        import shutil
+        from models.asset_index import AssetIndex
+        
+        directory = tempfile.mkdtemp(prefix="asset_index_bench_")
+        try:
+            roots = {os.path.join(directory, "assets"): 'corporate', os.path.join(directory, "content"): 'content'}
+            for root in roots:
+                for folder in range(40):
+                    path = os.path.join(root, f"ordner_{folder}")
+                    os.makedirs(path)
+                    for i in range(50):
+                        open(os.path.join(path, f"bild_{i}.png"), 'wb').close()
+            formats = {'images': ['.png', '.jpg']}
+            
+            def full_walk():
+                # Bisheriges scan_assets(): os.walk + stat + Asset-Info pro Datei
+                found = []
+                for root, source in roots.items():
+                    for current, _, files in os.walk(root):
+                        for name in files:
+                            if os.path.splitext(name)[1].lower() in ('.png', '.jpg'):
+                                path = os.path.join(current, name)
+                                stat = os.stat(path)
+                                found.append({'path': path, 'filename': name, 'source': source,
+                                              'size': stat.st_size,
+                                              'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                                              'extension': os.path.splitext(path)[1].lower()})
+                return found
+            
+            runs = 5
+            start = time.perf_counter()
+            for _ in range(runs):
+                walked = full_walk()
+            walk_ms = (time.perf_counter() - start) / runs * 1000
+            
+            index_path = os.path.join(directory, "asset_index.json")
+            index = AssetIndex(roots, formats, index_path=index_path, watch=False, rescan_interval=3600)
+            start = time.perf_counter()
+            index.open()
+            build_ms = (time.perf_counter() - start) * 1000
+            index.close()
+            
+            start = time.perf_counter()
+            reopened = AssetIndex(roots, formats, index_path=index_path, watch=False, rescan_interval=3600)
+            reopened.open()
+            reopen_ms = (time.perf_counter() - start) * 1000
+            
+            start = time.perf_counter()
+            for _ in range(runs):
+                categorized = reopened.categorized()
+                pngs = reopened.query(category='content_images', extension='.png')
+            query_ms = (time.perf_counter() - start) / runs * 1000
+            reopened.close()
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        
+        total = sum(len(assets) for assets in categorized.values())
+        ok = total == len(walked) == 4000 and len(pngs) == 2000 and query_ms < walk_ms and reopen_ms < walk_ms
+        self.log_result(
+            "Bench Asset-Index", "PASS" if ok else "FAIL",
+            f"4000 Dateien: os.walk {walk_ms:.1f} ms | Index aufbauen {build_ms:.1f} ms, "
+            f"Neustart mit Abgleich {reopen_ms:.1f} ms (Datei-Prüfung danach im Hintergrund), Abfrage {query_ms:.2f} ms"
+        )
+        return ok
+    
+    def bench_thumbnail_cache(self):
+        """Benchmark: Asset-Vorschauen - synchron im Tk-Thread vs. Thumbnail-Cache"""
+        print("⏱️ Benchmark: Thumbnail-Cache...")
+        
+        import tempfile
+        import shutil
+        from PIL import Image
+        from ui.components.thumbnail_cache import ThumbnailCache
+        
+        directory = tempfile.mkdtemp(prefix="thumbnail_bench_")
+        try:
+            paths = []
+            for i in range(24):
+                path = os.path.join(directory, f"foto_{i}.jpg")
+                Image.new('RGB', (2400, 1600), (i * 10, 100, 150)).save(path, quality=85)
+                paths.append(path)
+            
+            # Bisher: Dekodieren + LANCZOS pro Asset im Tk-Thread, bei jedem Start
+            start = time.perf_counter()
+            for path in paths:
+                image = Image.open(path)
+                image.thumbnail((64, 64), Image.Resampling.LANCZOS)
+            sync_ms = (time.perf_counter() - start) * 1000
+            
+            cache_dir = os.path.join(directory, "thumbnails")
+            cache = ThumbnailCache(directory=cache_dir, workers=4)
+            
+            class Timer:
+                def after(self, delay_ms, func, *args):
+                    pass
+            
+            start = time.perf_counter()
+            for path in paths:
+                cache.request(Timer(), path, (64, 64), lambda image: None, square=True)
+            request_ms = (time.perf_counter() - start) * 1000  # Blockierzeit im Tk-Thread
+            while cache.pending():
+                time.sleep(0.002)
+            cold_ms = (time.perf_counter() - start) * 1000
+            cache.shutdown()
+            
+            warm = ThumbnailCache(directory=cache_dir)
+            start = time.perf_counter()
+            hits = sum(1 for path in paths if warm.get(path, (64, 64), square=True) is not None)
+            warm_ms = (time.perf_counter() - start) * 1000
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        
+        ok = hits == len(paths) and warm_ms < sync_ms and request_ms < sync_ms
+        self.log_result(
+            "Bench Thumbnail-Cache", "PASS" if ok else "FAIL",
+            f"24 JPEGs 2400x1600: synchron {sync_ms:.0f} ms im Tk-Thread | Cache kalt: "
+            f"{request_ms:.1f} ms Tk-Thread, fertig nach {cold_ms:.0f} ms | nach Neustart {warm_ms:.1f} ms"
+        )
+        return ok
+    
+    def bench_asset_search(self):
+        """Benchmark: Asset-Suche über 10000 Dateinamen - Index vs. linearer Durchlauf"""
+        print("⏱️ Benchmark: Asset-Suche...")
+        
+        import random
+        from models.asset_search import AssetSearchIndex
+        
+        class StaticIndex:
+            """Feste Asset-Liste anstelle des Dateisystems"""
+            def __init__(self, assets):
+                self.assets = assets
+            def refresh(self):
+                pass
+            def query(self):
+                return self.assets
+            def add_listener(self, callback):
+                pass
+        
+        rng = random.Random(42)
+        words = ["logo", "messe", "stand", "produkt", "team", "banner", "icon", "foto", "hintergrund", "kunde"]
+        assets = []
+        for i in range(10000):
+            name = f"{rng.choice(words)}_{rng.choice(words)}_{i:05d}{rng.choice(['.png', '.jpg', '.svg'])}"
+            assets.append({'path': f"assets/{name}", 'filename': name, 'size': rng.randint(1, 10 ** 6),
+                           'mtime_ns': rng.randint(0, 10 ** 18), 'extension': name[-4:],
+                           'category': 'corporate_assets', 'source': 'corporate'})
+        
+        search = AssetSearchIndex(StaticIndex(assets))
+        start = time.perf_counter()
+        search.search("")
+        build_ms = (time.perf_counter() - start) * 1000
+        
+        queries = ["00042", "banner_kunde", "hintergrund .svg", "logo*", "team_foto_09", "xyz"]
+        runs = 20
+        start = time.perf_counter()
+        for _ in range(runs):
+            for query in queries:
+                search.search(query)
+        indexed_ms = (time.perf_counter() - start) / (runs * len(queries)) * 1000
+        
+        start = time.perf_counter()
+        for _ in range(runs):
+            for query in queries:
+                terms = query.lower().split()
+                sorted((asset for asset in assets if all(term.rstrip('*') in asset['filename'].lower()
+                                                         for term in terms)),
+                       key=lambda asset: asset['filename'].lower())
+        linear_ms = (time.perf_counter() - start) / (runs * len(queries)) * 1000
+        
+        ok = indexed_ms < 16 and indexed_ms < linear_ms
+        self.log_result(
+            "Bench Asset-Suche", "PASS" if ok else "FAIL",
+            f"10000 Assets: Index-Aufbau {build_ms:.1f} ms | Abfrage {indexed_ms:.2f} ms (Index) "
+            f"vs. {linear_ms:.2f} ms (linear)"
+        )
+        return ok
+    
+    def bench_write_behind_storage(self):
+        """Benchmark: Blockierzeit von save_json im Aufrufer-Thread - synchron vs. Write-behind"""
+        print("⏱️ Benchmark: Write-behind StorageManager...")
+        
+        import tempfile
+        import shutil
+        from core.storage import StorageManager
+        
+        data = {'slides': {str(i): {'title': f"Slide {i}", 'content': "Text " * 200} for i in range(50)}}
+        saves = 100
+        results = {}
+        directory = tempfile.mkdtemp(prefix="storage_bench_")
+        try:
+            for mode, write_behind in (('sync', False), ('write_behind', True)):
+                storage = StorageManager(write_behind=write_behind, fsync=True)
+                storage.data_dir = os.path.join(directory, mode)
+                start = time.perf_counter()
+                for i in range(saves):
+                    storage.save_json(data, f"auto_save_{i % 5}.json")
+                caller_ms = (time.perf_counter() - start) / saves * 1000
+                storage.flush()
+                total_ms = (time.perf_counter() - start) * 1000
+                results[mode] = (caller_ms, total_ms, storage.get_stats()['written'] or saves)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        
+        sync, behind = results['sync'], results['write_behind']
+        ok = behind[0] < sync[0]
+        self.log_result(
+            "Bench Write-behind Storage", "PASS" if ok else "FAIL",
+            f"{saves} Saves (5 Dateien, fsync): synchron {sync[0]:.2f} ms/Save im Aufrufer | "
+            f"Write-behind {behind[0]:.2f} ms/Save, {behind[2]} Writes, gesamt bis flush() {behind[1]:.0f} ms"
+        )
+        return ok
+    
+    def bench_incremental_backups(self):
+        """Benchmark: backup_data - vollständiges copytree vs. inkrementeller Hard-Link-Snapshot"""
+        print("⏱️ Benchmark: Inkrementelle Backups...")
+        
+        import tempfile
+        import shutil
+        from core.storage import StorageManager
+        
+        directory = tempfile.mkdtemp(prefix="backup_bench_")
+        try:
+            storage = StorageManager(write_behind=False, fsync=False)
+            storage.data_dir = os.path.join(directory, "data")
+            storage.exports_dir = os.path.join(directory, "exports")
+            storage.ensure_directories()
+            payload = os.urandom(256 * 1024)
+            for i in range(200):
+                with open(os.path.join(storage.data_dir, f"datei_{i}.bin"), 'wb') as f:
+                    f.write(payload)
+            
+            start = time.perf_counter()
+            shutil.copytree(storage.data_dir, os.path.join(directory, "full_copy"))
+            full_ms = (time.perf_counter() - start) * 1000
+            
+            storage.backup_data()
+            with open(os.path.join(storage.data_dir, "datei_0.bin"), 'wb') as f:
+                f.write(payload[::-1])
+            start = time.perf_counter()
+            storage.backup_data()
+            incremental_ms = (time.perf_counter() - start) * 1000
+            copied = storage.last_backup_stats['copied']
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        
+        ok = copied == 1 and incremental_ms < full_ms
+        self.log_result(
+            "Bench Inkrementelle Backups", "PASS" if ok else "FAIL",
+            f"200 Dateien / 50 MB, 1 geändert: copytree {full_ms:.0f} ms | Snapshot {incremental_ms:.0f} ms, "
+            f"{copied} Datei kopiert (256 KB statt 50 MB neu belegt)"
+        )
+        return ok
+    
+    def bench_compressed_storage(self):
+        """Benchmark: Präsentation mit eingebetteten Bildern - Größe, Speicher- und Ladezeit je Kodek"""
+        print("⏱️ Benchmark: Komprimierte Speicherformate...")
+        
+        import io
+        import base64
+        import tempfile
+        import shutil
+        from PIL import Image
+        from core import compression
+        from core.storage import StorageManager
+        
+        # Deck wie nach einem Import alter Präsentationen: Base64-PNGs in canvas_elements
+        slides = {}
+        for i in range(20):
+            image = Image.radial_gradient('L').resize((320, 240)).convert('RGB')
+            image.paste(Image.effect_noise((160, 120), 40 + i).convert('RGB'), (80, 60))
+            buffer = io.BytesIO()
+            image.save(buffer, format='PNG')
+            slides[str(i)] = {
+                'title': f"Folie {i}", 'content': "BumbleB Shuttle " * 50,
+                'canvas_elements': [{'type': 'image', 'x': 10, 'y': 20,
+                                     'image_data': base64.b64encode(buffer.getvalue()).decode('ascii')}]
+            }
+        data = {'presentation': {'title': 'Bench'}, 'slides': slides}
+        
+        directory = tempfile.mkdtemp(prefix="compression_bench_")
+        results = {}
+        try:
+            storage = StorageManager(write_behind=False, fsync=True)
+            storage.data_dir = directory
+            for codec in [None] + compression.available_codecs():
+                name = f"deck.json{compression.extension_for(codec)}"
+                start = time.perf_counter()
+                for _ in range(3):
+                    storage.save_json(data, name)
+                save_ms = (time.perf_counter() - start) / 3 * 1000
+                start = time.perf_counter()
+                for _ in range(3):
+                    loaded = storage.load_json(name)
+                load_ms = (time.perf_counter() - start) / 3 * 1000
+                size = os.path.getsize(os.path.join(directory, name))
+                results[codec or 'json'] = (size, save_ms, load_ms, loaded == data)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        
+        plain = results['json'][0]
+        ok = all(valid for _, _, _, valid in results.values()) and results['gzip'][0] < plain
+        self.log_result(
+            "Bench Komprimierte Speicherformate", "PASS" if ok else "FAIL",
+            " | ".join(f"{codec}: {size / 1024:.0f} KB ({size / plain:.0%}), Speichern {save:.0f} ms, "
+                       f"Laden {load:.0f} ms" for codec, (size, save, load, _) in results.items())
+        )
+        return ok
+    
+    def bench_yaml_io(self):
+        """Benchmark: Beispiel-YAML auf 300 Folien skaliert - Python-safe_load/dump vs. libyaml"""
+        print("⏱️ Benchmark: YAML-Schicht...")
+        
+        import copy
+        import yaml
+        from core import yaml_io
+        
+        sample_path = os.path.join(self.base_dir, 'presentations', 'beispiel_presentation.yaml')
+        with open(sample_path, 'r', encoding='utf-8') as f:
+            sample = yaml.safe_load(f)
+        
+        templates = list(sample['slides'].values())
+        slides = {}
+        for i in range(300):
+            slide = copy.deepcopy(templates[i % len(templates)])
+            slide['id'] = i + 1
+            slides[f"slide_{i + 1}"] = slide
+        data = {'presentation': sample['presentation'], 'slides': slides}
+        
+        def measure(load, dump):
+            start = time.perf_counter()
+            text = dump(data)
+            dump_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            loaded = load(text)
+            load_ms = (time.perf_counter() - start) * 1000
+            return dump_ms, load_ms, loaded == data, len(text)
+        
+        python_path = measure(
+            yaml.safe_load, lambda d: yaml.dump(d, default_flow_style=False, allow_unicode=True, indent=2)
+        )
+        fast_path = measure(yaml_io.load, yaml_io.dump)
+        
+        ok = python_path[2] and fast_path[2] and (yaml_io.BACKEND == 'python' or fast_path[1] < python_path[1])
+        self.log_result(
+            "Bench YAML-Schicht", "PASS" if ok else "FAIL",
+            f"300 Folien ({fast_path[3] // 1024} KB): Python Speichern {python_path[0]:.0f} ms / Laden {python_path[1]:.0f} ms | "
+            f"{yaml_io.BACKEND} Speichern {fast_path[0]:.0f} ms / Laden {fast_path[1]:.0f} ms "
+            f"(x{python_path[1] / max(fast_path[1], 0.001):.1f} Laden)"
+        )
+        return ok
+    
+    def bench_queue_logging(self):
+        """Benchmark: Latenz je logger.info()-Aufruf im Aufrufer-Thread - direkte Handler vs. Queue"""
+        print("⏱️ Benchmark: Queue-Logging...")
+        
+        import tempfile
+        import shutil
+        import threading
+        from core.logger import BertrandtLogger
+        
+        calls = 5000
+        results = {}
+        directory = tempfile.mkdtemp(prefix="logger_bench_")
+        try:
+            for mode, use_queue in (('sync', False), ('queue', True)):
+                bench_logger = BertrandtLogger(name=f"LoggerBench_{mode}", use_queue=use_queue,
+                                               log_dir=os.path.join(directory, mode))
+                bench_logger.handlers[0].setStream(open(os.devnull, 'w'))
+                latencies = []
+                
+                # Wie im Betrieb: Tk-Thread, Serial-Reader und Demo-Thread loggen gleichzeitig
+                def worker():
+                    local = []
+                    for i in range(calls // 4):
+                        start = time.perf_counter()
+                        bench_logger.info(f"Slide {i} gerendert, Sync an ESP32 gesendet")
+                        local.append(time.perf_counter() - start)
+                    latencies.extend(local)
+                
+                threads = [threading.Thread(target=worker) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                bench_logger.flush(timeout=30)
+                bench_logger.shutdown()
+                for handler in bench_logger.handlers:
+                    handler.close()
+                bench_logger.logger.handlers.clear()
+                
+                latencies.sort()
+                results[mode] = (sum(latencies) / len(latencies) * 1e6,
+                                 latencies[len(latencies) // 2] * 1e6,
+                                 latencies[int(len(latencies) * 0.99)] * 1e6,
+                                 bench_logger.get_stats().get('dropped', 0))
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        
+        sync, queued = results['sync'], results['queue']
+        ok = queued[1] < sync[1]
+        self.log_result(
+            "Bench Queue-Logging", "PASS" if ok else "FAIL",
+            f"{calls} info()-Aufrufe aus 4 Threads: direkt Ø {sync[0]:.1f} µs / p50 {sync[1]:.1f} / p99 {sync[2]:.1f} µs | "
+            f"Queue Ø {queued[0]:.1f} µs / p50 {queued[1]:.1f} / p99 {queued[2]:.1f} µs, {queued[3]} verworfen"
+        )
+        return ok
+    
+    def run_benchmarks(self):
+        """Führt alle Benchmarks aus"""
+        print("🚀 Starte BENCHMARKS...\n")
+        
+        benchmarks = [
+            self.bench_serial_reader,
+            self.bench_async_hardware_loop,
+            self.bench_hardware_throughput,
+            self.bench_wire_protocol,
+            self.bench_content_journal,
+            self.bench_lazy_loading,
+            self.bench_slide_memory,
+            self.bench_asset_index,
+            self.bench_thumbnail_cache,
+            self.bench_asset_search,
+            self.bench_write_behind_storage,
+            self.bench_incremental_backups,
+            self.bench_compressed_storage,
+            self.bench_yaml_io,
+            self.bench_queue_logging
+        ]
+        
+        passed = 0
+        for bench in benchmarks:
+            if bench():
+                passed += 1
+            print()
+        
+        return passed, len(benchmarks)
     
     def auto_fix_issues(self):
         """Versucht automatische Reparaturen"""
@@ -616,9 +3169,11 @@ def main():
     parser.add_argument('--all', action='store_true', help='Alle Tests ausführen')
     parser.add_argument('--quick', action='store_true', help='Schnelle Tests ausführen') 
     parser.add_argument('--fix', action='store_true', help='Tests + automatische Reparaturen')
+    parser.add_argument('--bench', action='store_true', help='Performance-Benchmarks ausführen')
     
     args = parser.parse_args()
     
+    isolate_runtime_dirs()
     suite = TestSuite()
     
     print("🧪 DYNAMIC MESSE STAND V4 - TEST SUITE")
@@ -633,6 +3188,9 @@ def main():
         elif args.all:
             # Alle Tests
             passed, total = suite.run_all_tests()
+        elif args.bench:
+            # Benchmarks
+            passed, total = suite.run_benchmarks()
         else:
             # Standard: Schnelle Tests
             passed, total = suite.run_quick_tests()
@@ -7,10 +7,38 @@ Vollständiger Asset-Browser für alle Ordner mit Vorschau
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
-from PIL import Image, ImageTk
+from PIL import ImageTk
 from core.theme import theme_manager
 from core.logger import logger
 from models.content import content_manager
+from ui.components.thumbnail_cache import thumbnail_cache
+
+PREVIEW_SIZE = (64, 64)
+ROW_HEIGHT = 80     # Feste Zeilenhöhe der Asset-Liste (Vorschau 64 px + Rand)
+ROW_OVERSCAN = 2    # Zusätzlich gebundene Zeilen ober-/unterhalb des sichtbaren Bereichs
+SEARCH_DEBOUNCE_MS = 150  # Suche erst nach einer Tipp-Pause ausführen
+SORT_OPTIONS = [("Name", 'name'), ("Größe", 'size'), ("Datum", 'modified'), ("Typ", 'type'), ("Pixel", 'pixels')]
+
+def visible_rows(top, height, total, row_height=ROW_HEIGHT, overscan=ROW_OVERSCAN):
+    """Indexbereich [first, last) der Zeilen, die bei Scrollposition top sichtbar sind"""
+    first = max(0, int(top // row_height) - overscan)
+    last = min(total, int((top + height) // row_height) + 1 + overscan)
+    return first, max(first, last)
+
+class AssetRow:
+    """Wiederverwendbare Zeile der virtualisierten Asset-Liste"""
+    
+    __slots__ = ('frame', 'item', 'preview', 'name', 'details', 'button', 'asset', 'index')
+    
+    def __init__(self, frame, item, preview, name, details, button):
+        self.frame = frame
+        self.item = item  # Canvas-Window-Item
+        self.preview = preview
+        self.name = name
+        self.details = details
+        self.button = button
+        self.asset = None
+        self.index = None
 
 class AssetBrowserWidget:
     """Widget für Asset-Browsing mit Vorschau und Integration"""
@@ -20,7 +48,11 @@ class AssetBrowserWidget:
         self.on_asset_selected = on_asset_selected_callback
         self.current_category = "corporate_assets"
         self.assets_cache = {}
-        self.preview_cache = {}
+        self.visible_assets = []
+        self.sort_key = 'name'
+        self.sort_descending = False
+        self.rows = []  # Pool recycelter Zeilen (nur so viele wie sichtbar)
+        self.search_after_id = None
         
         self.setup_ui()
         self.load_assets()
@@ -52,6 +84,9 @@ class AssetBrowserWidget:
         # Kategorie-Tabs
         self.create_category_tabs()
         
+        # Suche und Sortierung
+        self.create_search_bar()
+        
         # Asset-Liste mit Vorschau
         self.create_asset_list()
         
@@ -72,7 +107,8 @@ class AssetBrowserWidget:
             ("Corporate", "corporate_assets", "🏢"),
             ("UI/Icons", "ui_elements", "🎨"),
             ("Content", "content_images", "📷"),
-            ("Uploads", "user_uploads", "📤")
+            ("Uploads", "user_uploads", "📤"),
+            ("Alle", "all", "🔎")
         ]
         
         for i, (label, category, icon) in enumerate(categories):
@@ -90,8 +126,64 @@ class AssetBrowserWidget:
             btn.pack(side='left', padx=2)
             self.tab_buttons[category] = btn
     
+    def create_search_bar(self):
+        """Erstellt Suchfeld (Teilstring, präfix*, .endung) und Sortierung"""
+        colors = theme_manager.get_colors()
+        fonts = theme_manager.get_fonts(1920, 1080)
+        
+        search_frame = tk.Frame(self.container, bg=colors['background_secondary'])
+        search_frame.pack(fill='x', padx=10, pady=5)
+        
+        tk.Label(
+            search_frame, text="🔍", font=fonts['body'],
+            bg=colors['background_secondary'], fg=colors['text_secondary']
+        ).pack(side='left')
+        
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(
+            search_frame, textvariable=self.search_var, font=fonts['body'],
+            bg=colors['background_tertiary'], fg=colors['text_primary'],
+            relief='flat', insertbackground=colors['text_primary']
+        )
+        search_entry.pack(side='left', fill='x', expand=True, padx=(5, 10), ipady=4)
+        search_entry.bind('<Escape>', lambda e: self.search_var.set(''))
+        self.search_var.trace_add('write', lambda *args: self.schedule_search())
+        
+        self.sort_box = ttk.Combobox(
+            search_frame, values=[label for label, _ in SORT_OPTIONS],
+            state='readonly', width=8, font=fonts['caption']
+        )
+        self.sort_box.current(0)
+        self.sort_box.bind('<<ComboboxSelected>>', self.on_sort_changed)
+        self.sort_box.pack(side='left')
+        
+        self.sort_direction_btn = tk.Button(
+            search_frame, text="▲", font=fonts['caption'],
+            bg=colors['background_tertiary'], fg=colors['text_primary'],
+            relief='flat', bd=0, padx=8, cursor='hand2',
+            command=self.toggle_sort_direction
+        )
+        self.sort_direction_btn.pack(side='left', padx=(5, 0))
+    
+    def schedule_search(self):
+        """Entprellt das Suchfeld - nicht bei jedem Tastendruck neu abfragen"""
+        if self.search_after_id is not None:
+            self.list_canvas.after_cancel(self.search_after_id)
+        self.search_after_id = self.list_canvas.after(SEARCH_DEBOUNCE_MS, self.populate_current_category)
+    
+    def on_sort_changed(self, event=None):
+        """Sortierkriterium gewechselt"""
+        self.sort_key = SORT_OPTIONS[self.sort_box.current()][1]
+        self.populate_current_category()
+    
+    def toggle_sort_direction(self):
+        """Auf-/absteigend umschalten"""
+        self.sort_descending = not self.sort_descending
+        self.sort_direction_btn.configure(text="▼" if self.sort_descending else "▲")
+        self.populate_current_category()
+    
     def create_asset_list(self):
-        """Erstellt scrollbare Asset-Liste mit Vorschau"""
+        """Erstellt die virtualisierte Asset-Liste (Widgets nur für sichtbare Zeilen)"""
         colors = theme_manager.get_colors()
         
         # List-Container
@@ -101,34 +193,24 @@ class AssetBrowserWidget:
         # Canvas für Scrolling
         self.list_canvas = tk.Canvas(
             list_container, bg=colors['background_tertiary'], 
-            highlightthickness=0, height=300
+            highlightthickness=0, height=300, yscrollincrement=ROW_HEIGHT // 4
         )
         
-        scrollbar = tk.Scrollbar(
+        self.scrollbar = tk.Scrollbar(
             list_container, orient="vertical", 
             command=self.list_canvas.yview
         )
         
-        self.asset_frame = tk.Frame(
-            self.list_canvas, bg=colors['background_tertiary']
-        )
-        
-        # Scrolling konfigurieren
-        self.asset_frame.bind(
-            "<Configure>", 
-            lambda e: self.list_canvas.configure(scrollregion=self.list_canvas.bbox("all"))
-        )
-        
-        self.list_canvas.create_window((0, 0), window=self.asset_frame, anchor="nw")
-        self.list_canvas.configure(yscrollcommand=scrollbar.set)
+        # Jede Änderung der Ansicht (Scrollbar, Mausrad, Größe) bindet die Zeilen neu
+        self.list_canvas.configure(yscrollcommand=self.on_list_view_changed)
+        self.list_canvas.bind("<Configure>", self.on_list_resize)
         
         # Layout
         self.list_canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.scrollbar.pack(side="right", fill="y")
         
         # Mouse wheel binding
         self.list_canvas.bind("<MouseWheel>", self.on_mouse_wheel)
-        self.asset_frame.bind("<MouseWheel>", self.on_mouse_wheel)
     
     def create_action_buttons(self):
         """Erstellt Aktions-Buttons"""
@@ -168,48 +250,96 @@ class AssetBrowserWidget:
             self.show_error_message("Fehler beim Laden der Assets")
     
     def populate_current_category(self):
-        """Füllt aktuelle Kategorie mit Assets"""
-        # Alte Widgets entfernen
-        for widget in self.asset_frame.winfo_children():
-            widget.destroy()
-        
+        """Füllt aktuelle Kategorie mit Assets (beliebig viele, konstante Widget-Anzahl)"""
         colors = theme_manager.get_colors()
-        fonts = theme_manager.get_fonts(1920, 1080)
-        
-        assets = self.assets_cache.get(self.current_category, [])
-        
-        if not assets:
-            tk.Label(
-                self.asset_frame, text="Keine Assets in dieser Kategorie",
-                font=fonts['body'], bg=colors['background_tertiary'],
-                fg=colors['text_secondary']
-            ).pack(pady=20)
-            return
+        if self.search_after_id is not None:
+            # Aktueller Suchbegriff wird jetzt ohnehin übernommen
+            self.list_canvas.after_cancel(self.search_after_id)
+            self.search_after_id = None
+        
+        # Kategorie, Suchbegriff und Sortierung über den Such-Index
+        query = self.search_var.get().strip()
+        category = None if self.current_category == 'all' else self.current_category
+        self.visible_assets = content_manager.search_assets(
+            query, category=category, sort=self.sort_key, descending=self.sort_descending
+        )
+        self.list_canvas.delete('message')
+        for row in self.rows:
+            row.index = None
+            row.asset = None
+            self.list_canvas.itemconfigure(row.item, state='hidden')
+        
+        width = self.list_canvas.winfo_width()
+        self.list_canvas.configure(scrollregion=(0, 0, width, len(self.visible_assets) * ROW_HEIGHT))
+        self.list_canvas.yview_moveto(0)
+        
+        if not self.visible_assets:
+            message = f"Keine Treffer für „{query}“" if query else "Keine Assets in dieser Kategorie"
+            self.show_list_message(message, colors['text_secondary'])
+        
+        self.update_visible_rows()
+        
+        if self.sort_key == 'pixels':
+            # Sortiert wird nur nach bekannten Größen - fehlende im Hintergrund lesen, dann neu sortieren
+            search_index = content_manager.asset_manager.search_index
+            unmeasured = search_index.unmeasured(self.visible_assets)
+            if unmeasured:
+                thumbnail_cache.run(
+                    self.list_canvas, 'pixel_sort', lambda: search_index.measure(unmeasured),
+                    lambda _: self.sort_key == 'pixels' and self.populate_current_category()
+                )
+    
+    def update_visible_rows(self):
+        """Bindet die Zeilen-Widgets an die aktuell sichtbaren Assets"""
+        assets = self.visible_assets
+        first, last = visible_rows(
+            self.list_canvas.canvasy(0), self.list_canvas.winfo_height(), len(assets)
+        )
         
-        # Assets anzeigen (max. 50 für Performance)
-        for i, asset in enumerate(assets[:50]):
-            self.create_asset_item(asset, i)
+        while len(self.rows) < last - first:
+            self.rows.append(self.create_asset_row())
+        
+        # Index -> Zeile per Modulo: beim Scrollen um eine Zeile wird nur eine neu gebunden
+        used = set()
+        for index in range(first, last):
+            row = self.rows[index % len(self.rows)]
+            used.add(id(row))
+            if row.index != index or row.asset is not assets[index]:
+                self.bind_asset_row(row, assets[index], index)
+                self.list_canvas.coords(row.item, 0, index * ROW_HEIGHT)
+                self.list_canvas.itemconfigure(row.item, state='normal')
+        
+        for row in self.rows:
+            if id(row) not in used and row.asset is not None:
+                row.index = None
+                row.asset = None
+                self.list_canvas.itemconfigure(row.item, state='hidden')
     
-    def create_asset_item(self, asset, index):
-        """Erstellt einzelnes Asset-Item mit Vorschau"""
+    def create_asset_row(self):
+        """Erstellt eine (wiederverwendbare) Asset-Zeile mit Vorschau"""
         colors = theme_manager.get_colors()
         fonts = theme_manager.get_fonts(1920, 1080)
         
         # Container für Asset
         item_frame = tk.Frame(
-            self.asset_frame, bg=colors['background_secondary'],
+            self.list_canvas, bg=colors['background_secondary'],
             relief='solid', bd=1
         )
-        item_frame.pack(fill='x', padx=5, pady=2)
+        item = self.list_canvas.create_window(
+            0, 0, window=item_frame, anchor='nw', state='hidden',
+            width=max(1, self.list_canvas.winfo_width()), height=ROW_HEIGHT - 4
+        )
         
         # Grid Layout: Vorschau | Info | Aktionen
         item_frame.grid_columnconfigure(1, weight=1)
         
         # Vorschau (links)
-        preview_frame = tk.Frame(item_frame, bg=colors['background_secondary'])
-        preview_frame.grid(row=0, column=0, padx=10, pady=5, sticky='w')
-        
-        self.create_asset_preview(preview_frame, asset)
+        item_frame.grid_columnconfigure(0, minsize=PREVIEW_SIZE[0] + 20)
+        preview = tk.Label(
+            item_frame, font=('Arial', 24),
+            bg=colors['background_secondary'], fg=colors['accent_primary']
+        )
+        preview.grid(row=0, column=0, padx=10, pady=5)
         
         # Asset-Info (mitte)
         info_frame = tk.Frame(item_frame, bg=colors['background_secondary'])
@@ -217,88 +347,110 @@ class AssetBrowserWidget:
         
         # Dateiname
         name_label = tk.Label(
-            info_frame, text=asset['filename'],
-            font=fonts['body'], fg=colors['text_primary'],
+            info_frame, font=fonts['body'], fg=colors['text_primary'],
             bg=colors['background_secondary'], anchor='w'
         )
         name_label.pack(fill='x')
         
         # Details
-        size_text = f"{asset['size']} Bytes" if asset['size'] < 1024 else f"{asset['size']//1024} KB"
-        details = f"{asset['extension'].upper()} • {size_text} • {asset['source']}"
-        
         details_label = tk.Label(
-            info_frame, text=details,
-            font=fonts['caption'], fg=colors['text_secondary'],
+            info_frame, font=fonts['caption'], fg=colors['text_secondary'],
             bg=colors['background_secondary'], anchor='w'
         )
         details_label.pack(fill='x')
         
-        # Aktionen (rechts)
-        actions_frame = tk.Frame(item_frame, bg=colors['background_secondary'])
-        actions_frame.grid(row=0, column=2, padx=10, pady=5, sticky='e')
-        
-        # Hinzufügen-Button
+        # Aktionen (rechts) - Hinzufügen-Button
         add_btn = tk.Button(
-            actions_frame, text="➕ Hinzufügen",
+            item_frame, text="➕ Hinzufügen",
             font=fonts['caption'], bg=colors['accent_primary'], fg='white',
-            relief='flat', bd=0, padx=10, pady=5, cursor='hand2',
-            command=lambda a=asset: self.select_asset(a)
+            relief='flat', bd=0, padx=10, pady=5, cursor='hand2'
         )
-        add_btn.pack()
+        add_btn.grid(row=0, column=2, padx=10, pady=5, sticky='e')
         
-        # Hover-Effekte
+        row = AssetRow(item_frame, item, preview, name_label, details_label, add_btn)
+        add_btn.configure(command=lambda r=row: r.asset and self.select_asset(r.asset))
+        
+        # Hover-Effekte und Mausrad auch über den Zeilen-Widgets
         self.add_hover_effects(item_frame, colors)
+        for widget in (item_frame, preview, info_frame, name_label, details_label, add_btn):
+            widget.bind("<MouseWheel>", self.on_mouse_wheel)
+        
+        return row
+    
+    def bind_asset_row(self, row, asset, index):
+        """Zeigt ein Asset in einer recycelten Zeile an"""
+        row.asset = asset
+        row.index = index
+        
+        row.name.configure(text=asset['filename'])
+        
+        # Bildgröße nie im Tk-Thread lesen: bekannte sofort, sonst aus dem Worker-Pool nachtragen
+        search_index = content_manager.asset_manager.search_index
+        dimensions = search_index.cached_dimensions(asset, default=False)
+        if dimensions is False:
+            dimensions = None
+            thumbnail_cache.run(
+                self.list_canvas, ('dimensions', asset['path'], asset.get('mtime_ns')),
+                lambda: search_index.dimensions(asset),
+                lambda size, r=row, a=asset: r.asset is a and self.show_asset_details(r, a, size)
+            )
+        self.show_asset_details(row, asset, dimensions)
+        
+        self.create_asset_preview(row, asset)
+    
+    def show_asset_details(self, row, asset, dimensions):
+        """Detailzeile: Typ • Größe • Abmessungen (falls bekannt) • Quelle"""
+        size_text = f"{asset['size']} Bytes" if asset['size'] < 1024 else f"{asset['size']//1024} KB"
+        details = [asset['extension'].upper(), size_text, asset['source']]
+        if dimensions:
+            details.insert(2, f"{dimensions[0]}×{dimensions[1]}")
+        row.details.configure(text=" • ".join(details))
     
-    def create_asset_preview(self, parent, asset):
-        """Erstellt Asset-Vorschau"""
+    def create_asset_preview(self, row, asset):
+        """Setzt die Asset-Vorschau (Platzhalter, bis das Thumbnail im Hintergrund fertig ist)"""
         colors = theme_manager.get_colors()
+        row.preview.image = None
         
         try:
             if asset['extension'].lower() in ['.png', '.jpg', '.jpeg', '.gif', '.bmp']:
-                # Bild-Vorschau
-                preview = self.get_image_preview(asset['path'])
-                if preview:
-                    preview_label = tk.Label(parent, image=preview, bg=colors['background_secondary'])
-                    preview_label.image = preview  # Referenz behalten
-                    preview_label.pack()
-                    return
+                # Bild-Vorschau aus dem Thumbnail-Cache
+                row.preview.configure(image='', text="⏳", fg=colors['text_secondary'])
+                thumbnail = thumbnail_cache.request(
+                    self.list_canvas, asset['path'], PREVIEW_SIZE,
+                    lambda image, r=row, a=asset: r.asset is a and self.show_preview(r.preview, a, image),
+                    square=True
+                )
+                if thumbnail is not None:
+                    self.show_preview(row.preview, asset, thumbnail)
+                return
             
             # Fallback: Icon basierend auf Dateityp
-            icon_text = self.get_file_icon(asset['extension'])
-            tk.Label(
-                parent, text=icon_text, font=('Arial', 24),
-                bg=colors['background_secondary'], fg=colors['accent_primary']
-            ).pack()
+            row.preview.configure(image='', text=self.get_file_icon(asset['extension']),
+                                  fg=colors['accent_primary'])
             
         except Exception as e:
             logger.debug(f"Fehler bei Vorschau für {asset['filename']}: {e}")
-            tk.Label(
-                parent, text="📄", font=('Arial', 24),
-                bg=colors['background_secondary'], fg=colors['text_secondary']
-            ).pack()
+            row.preview.configure(image='', text="📄", fg=colors['text_secondary'])
+    
+    def show_preview(self, label, asset, thumbnail):
+        """Ersetzt den Platzhalter durch das Thumbnail (bzw. das Datei-Icon)"""
+        if thumbnail is None:
+            label.configure(text=self.get_file_icon(asset['extension']),
+                            fg=theme_manager.get_colors()['accent_primary'])
+            return
+        
+        photo = ImageTk.PhotoImage(thumbnail)
+        label.configure(image=photo, text='')
+        label.image = photo  # Referenz behalten
     
     def get_image_preview(self, image_path):
-        """Erstellt Bild-Vorschau"""
+        """Gibt eine bereits vorhandene Bild-Vorschau zurück (None, solange sie noch erzeugt wird)"""
         try:
-            if image_path in self.preview_cache:
-                return self.preview_cache[image_path]
-            
-            if os.path.exists(image_path):
-                image = Image.open(image_path)
-                image.thumbnail((64, 64), Image.Resampling.LANCZOS)
-                
-                # Quadratisches Thumbnail erstellen
-                thumb = Image.new('RGBA', (64, 64), (255, 255, 255, 0))
-                offset = ((64 - image.size[0]) // 2, (64 - image.size[1]) // 2)
-                thumb.paste(image, offset)
-                
-                photo = ImageTk.PhotoImage(thumb)
-                self.preview_cache[image_path] = photo
-                return photo
-            
+            thumbnail = thumbnail_cache.get(image_path, PREVIEW_SIZE, square=True)
+            if thumbnail is not None:
+                return ImageTk.PhotoImage(thumbnail)
         except Exception as e:
-            logger.debug(f"Fehler beim Erstellen der Vorschau für {image_path}: {e}")
+            logger.debug(f"Fehler beim Laden der Vorschau für {image_path}: {e}")
         
         return None
     
@@ -353,7 +505,6 @@ class AssetBrowserWidget:
     def refresh_assets(self):
         """Aktualisiert Asset-Liste"""
         try:
-            self.preview_cache.clear()  # Cache leeren
             self.load_assets()
             logger.info("Assets aktualisiert")
         except Exception as e:
@@ -382,6 +533,7 @@ class AssetBrowserWidget:
                 dest_path = os.path.join(uploads_dir, filename)
                 
                 shutil.copy2(file_path, dest_path)
+                content_manager.register_asset(dest_path)  # Index und Suche sofort aktualisieren
                 
                 # Asset-Liste aktualisieren
                 self.refresh_assets()
@@ -400,19 +552,35 @@ class AssetBrowserWidget:
         """Mouse-Wheel Scrolling"""
         self.list_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
     
+    def on_list_view_changed(self, first, last):
+        """yscrollcommand: Scrollbar nachführen und sichtbare Zeilen neu binden"""
+        self.scrollbar.set(first, last)
+        self.update_visible_rows()
+    
+    def on_list_resize(self, event):
+        """Zeilenbreite an den Canvas anpassen; bei mehr Höhe werden Zeilen nachgelegt"""
+        for row in self.rows:
+            self.list_canvas.itemconfigure(row.item, width=event.width)
+        self.list_canvas.configure(scrollregion=(0, 0, event.width, len(self.visible_assets) * ROW_HEIGHT))
+        self.list_canvas.coords('message', event.width // 2, 30)
+        self.update_visible_rows()
+    
+    def show_list_message(self, message, color):
+        """Zeigt einen Hinweis in der (leeren) Liste"""
+        fonts = theme_manager.get_fonts(1920, 1080)
+        self.list_canvas.delete('message')
+        self.list_canvas.create_text(
+            max(1, self.list_canvas.winfo_width()) // 2, 30, text=message,
+            font=fonts['body'], fill=color, tags='message'
+        )
+    
     def show_error_message(self, message):
         """Zeigt Fehlermeldung in der Liste"""
         colors = theme_manager.get_colors()
-        fonts = theme_manager.get_fonts(1920, 1080)
-        
-        for widget in self.asset_frame.winfo_children():
-            widget.destroy()
         
-        tk.Label(
-            self.asset_frame, text=f"❌ {message}",
-            font=fonts['body'], bg=colors['background_tertiary'],
-            fg=colors['accent_warning']
-        ).pack(pady=20)
+        self.visible_assets = []
+        self.update_visible_rows()
+        self.show_list_message(f"❌ {message}", colors['accent_warning'])
     
     def pack(self, **kwargs):
         """Pack-Methode für Integration"""
@@ -475,21 +643,34 @@ class AssetPreviewDialog:
             preview_frame = tk.Frame(self.dialog, bg=colors['background_primary'])
             preview_frame.pack(fill='both', expand=True, padx=20, pady=20)
             
-            image = Image.open(self.asset['path'])
-            image.thumbnail((500, 400), Image.Resampling.LANCZOS)
-            
-            photo = ImageTk.PhotoImage(image)
-            
             preview_label = tk.Label(
-                preview_frame, image=photo, bg=colors['background_primary']
+                preview_frame, text="⏳", font=('Arial', 48),
+                bg=colors['background_primary'], fg=colors['text_secondary']
             )
-            preview_label.image = photo
             preview_label.pack(expand=True)
             
+            thumbnail = thumbnail_cache.request(
+                self.dialog, self.asset['path'], (500, 400),
+                lambda image: self.show_image(preview_frame, preview_label, image)
+            )
+            if thumbnail is not None:
+                self.show_image(preview_frame, preview_label, thumbnail)
+            
         except Exception as e:
             self.create_file_info()
             logger.error(f"Fehler bei Bild-Vorschau: {e}")
     
+    def show_image(self, preview_frame, preview_label, thumbnail):
+        """Setzt die fertige Vorschau ein (Datei-Info, falls das Bild nicht lesbar ist)"""
+        if thumbnail is None:
+            preview_frame.destroy()
+            self.create_file_info()
+            return
+        
+        photo = ImageTk.PhotoImage(thumbnail)
+        preview_label.configure(image=photo, text='')
+        preview_label.image = photo
+    
     def create_file_info(self):
         """Erstellt Datei-Info"""
         colors = theme_manager.get_colors()
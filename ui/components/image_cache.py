@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Image Cache für Dynamic Messe Stand V4
+Prozessweiter LRU-Cache für dekodierte Quellbilder und skalierte PhotoImages
+"""
+
+import os
+import base64
+import hashlib
+import threading
+from io import BytesIO
+from collections import OrderedDict
+from PIL import Image, ImageTk
+from core.config import config
+from core.logger import logger
+from models.blob_store import blob_store
+
+class ImageCache:
+    """Größenbegrenzter LRU-Cache mit Byte-Budget und Hit/Miss-Zählern"""
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes or config.cache['image_cache_mb'] * 1024 * 1024
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._current_bytes = 0
+        self._lock = threading.RLock()
+        self._b64_keys = OrderedDict()  # id(image_data) -> (image_data, key)
+        self._fallback_keys = OrderedDict()  # Key einer defekten Datei -> Base64-Key
+        self.stats = {
+            'source_hits': 0,
+            'source_misses': 0,
+            'photo_hits': 0,
+            'photo_misses': 0,
+            'scaled_hits': 0,
+            'scaled_misses': 0,
+            'decodes': 0,
+            'evictions': 0
+        }
+
+    def source_key(self, element):
+        """Bestimmt den Cache-Key eines Bild-Elements (Blob-Hash, Pfad+mtime oder Base64-Hash)"""
+        image_hash = element.get('image_hash')
+        if image_hash and blob_store.exists(image_hash):
+            return ('blob', image_hash)
+
+        file_path = element.get('file_path')
+        if file_path:
+            try:
+                stat = os.stat(file_path)
+                return ('file', file_path, stat.st_mtime_ns)
+            except OSError:
+                pass
+
+        image_data = element.get('image_data')
+        if image_data:
+            return self._base64_key(image_data)
+
+        return None
+
+    def resolved_key(self, element):
+        """Key, unter dem das Quellbild tatsächlich gecacht wird (defekte Datei -> Base64-Fallback)"""
+        key = self.source_key(element)
+        with self._lock:
+            return self._fallback_keys.get(key, key)
+
+    def _base64_key(self, image_data):
+        """Content-Hash für Base64-Daten (pro String-Objekt nur einmal berechnet)"""
+        with self._lock:
+            memo = self._b64_keys.get(id(image_data))
+            if memo and memo[0] is image_data:
+                return memo[1]
+
+        raw = image_data.encode('ascii') if isinstance(image_data, str) else image_data
+        key = ('b64', hashlib.sha1(raw).hexdigest())
+
+        with self._lock:
+            self._b64_keys[id(image_data)] = (image_data, key)
+            while len(self._b64_keys) > 256:
+                self._b64_keys.popitem(last=False)
+        return key
+
+    def get_source(self, element):
+        """Gibt (key, PIL-Image) des Quellbildes zurück - dekodiert nur bei Cache-Miss"""
+        key = self.resolved_key(element)
+        if key is None:
+            return None, None
+
+        cache_key = ('source', key)
+        image = self._get(cache_key)
+        if image is not None:
+            self._count('source_hits')
+            return key, image
+
+        self._count('source_misses')
+        image = self._decode(key, element)
+        if image is None and key[0] == 'file' and element.get('image_data'):
+            # Datei defekt - Fallback auf eingebettete Base64-Daten (Key merken, bis sich mtime ändert)
+            file_key, key = key, self._base64_key(element['image_data'])
+            with self._lock:
+                self._fallback_keys[file_key] = key
+                while len(self._fallback_keys) > 256:
+                    self._fallback_keys.popitem(last=False)
+            cache_key = ('source', key)
+            image = self._get(cache_key) or self._decode(key, element)
+        if image is None:
+            return None, None
+
+        self._put(cache_key, image, self._image_bytes(image))
+        return key, image
+
+    def get_photo(self, element, size):
+        """Gibt ein auf size skaliertes PhotoImage zurück (Tk-Thread)"""
+        return self._get_resized(
+            'photo', element, size,
+            lambda image: ImageTk.PhotoImage(image),
+            lambda size: size[0] * size[1] * 4
+        )
+
+    def get_scaled(self, element, size):
+        """Gibt ein auf size skaliertes PIL-Image zurück (threadsicher, für Offscreen-Rendering)"""
+        return self._get_resized(
+            'scaled', element, size,
+            lambda image: image,
+            lambda size: None
+        )
+
+    def _get_resized(self, kind, element, size, factory, nbytes_for):
+        """Gemeinsamer Lookup für skalierte Varianten eines Quellbildes"""
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        key = self.resolved_key(element)
+        if key is None:
+            return None
+
+        value = self._get((kind, key, size))
+        if value is not None:
+            self._count(f'{kind}_hits')
+            return value
+
+        self._count(f'{kind}_misses')
+        key, source = self.get_source(element)
+        if source is None:
+            return None
+
+        resized = source.resize(size, Image.Resampling.LANCZOS)
+        value = factory(resized)
+        self._put((kind, key, size), value, nbytes_for(size) or self._image_bytes(resized))
+        return value
+
+    def _decode(self, key, element):
+        """Lädt das Quellbild von Disk bzw. aus Base64"""
+        try:
+            if key[0] == 'blob':
+                # Direkt aus der Blob-Datei streamen (inhaltsadressiert, unveränderlich)
+                image = Image.open(blob_store.path(key[1]))
+            elif key[0] == 'file':
+                image = Image.open(key[1])
+            else:
+                image = Image.open(BytesIO(base64.b64decode(element['image_data'])))
+            image.load()
+            self._count('decodes')
+            return image
+        except Exception as e:
+            logger.debug(f"Bild konnte nicht dekodiert werden ({key[0]}): {e}")
+            return None
+
+    def _count(self, name):
+        """Zähler erhöhen - Tk-Thread und Raster-Worker nutzen den Cache gleichzeitig"""
+        with self._lock:
+            self.stats[name] += 1
+
+    def _image_bytes(self, image):
+        """Speicherbedarf eines dekodierten PIL-Images"""
+        return image.width * image.height * max(1, len(image.getbands()))
+
+    def _get(self, cache_key):
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(cache_key)
+            return entry[0]
+
+    def _put(self, cache_key, value, nbytes):
+        with self._lock:
+            if nbytes > self.max_bytes:
+                return  # Größer als das gesamte Budget - nicht cachen
+
+            old = self._entries.pop(cache_key, None)
+            if old:
+                self._current_bytes -= old[1]
+
+            self._entries[cache_key] = (value, nbytes)
+            self._current_bytes += nbytes
+
+            while self._current_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_bytes
+                self.stats['evictions'] += 1
+
+    def clear(self):
+        """Leert den Cache (Zähler bleiben erhalten)"""
+        with self._lock:
+            self._entries.clear()
+            self._b64_keys.clear()
+            self._fallback_keys.clear()
+            self._current_bytes = 0
+
+    def get_stats(self):
+        """Gibt Hit/Miss-Zähler und Speicherbelegung zurück"""
+        with self._lock:
+            return dict(
+                self.stats,
+                entries=len(self._entries),
+                bytes=self._current_bytes,
+                max_bytes=self.max_bytes
+            )
+
+# Globale Image-Cache Instanz
+image_cache = ImageCache()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Slide Rasterizer für Dynamic Messe Stand V4
+Offscreen-Rendering von Slides in PIL-Bitmaps plus Raster-Cache mit Prefetch
+"""
+
+import copy
+import threading
+import queue
+from functools import lru_cache
+from collections import OrderedDict
+from PIL import Image, ImageDraw, ImageFont
+from core.logger import logger
+from models.content import content_manager
+from ui.components.slide_renderer import EnhancedSlideRenderer
+
+@lru_cache(maxsize=64)
+def _load_font(family, size, weight):
+    """Lädt eine TrueType-Schrift mit Fallbacks (gecacht pro Familie/Größe/Gewicht)"""
+    bold = 'bold' in str(weight)
+    candidates = [
+        f"{family}{' Bold' if bold else ''}.ttf",
+        f"{family.replace(' ', '')}{'-Bold' if bold else ''}.ttf",
+        'segoeuib.ttf' if bold else 'segoeui.ttf',
+        'DejaVuSans-Bold.ttf' if bold else 'DejaVuSans.ttf'
+    ]
+    for candidate in candidates:
+        try:
+            return ImageFont.truetype(candidate, size)
+        except (OSError, ValueError):
+            continue
+    return ImageFont.load_default(size)
+
+
+class RasterCanvas:
+    """Canvas-kompatible Zeichenfläche, die direkt in ein PIL-Image rendert"""
+
+    offscreen = True
+
+    def __init__(self, width, height, background='#FFFFFF'):
+        self.width = int(width)
+        self.height = int(height)
+        self.image = Image.new('RGB', (self.width, self.height), background)
+        self.draw = ImageDraw.Draw(self.image)
+
+    def delete(self, *tags):
+        """Offscreen gibt es keine Items zum Löschen"""
+        pass
+
+    def create_rectangle(self, x1, y1, x2, y2, fill='', outline='', width=1, **kwargs):
+        self.draw.rectangle(
+            [min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)],
+            fill=fill or None, outline=outline or None, width=int(width)
+        )
+
+    def create_line(self, x1, y1, x2, y2, fill='#000000', width=1, **kwargs):
+        self.draw.line([x1, y1, x2, y2], fill=fill, width=int(width))
+
+    def create_image(self, x, y, image=None, anchor='nw', **kwargs):
+        if image is None:
+            return
+        x, y = self._anchor_origin(x, y, image.width, image.height, anchor)
+        if image.mode == 'RGB':
+            self.image.paste(image, (int(x), int(y)))
+        else:
+            # Transparenz (RGBA/LA/Palette) als Maske übernehmen
+            image = image.convert('RGBA')
+            self.image.paste(image, (int(x), int(y)), image)
+
+    def create_text(self, x, y, text='', font=('Segoe UI', 12), fill='#000000',
+                    anchor='center', width=None, **kwargs):
+        family, size, weight = (tuple(font) + (12, 'normal'))[:3]
+        pil_font = _load_font(family, int(size), weight)
+
+        lines = self._wrap(text, pil_font, width)
+        line_height = int(size * 1.3)
+        block_width = max((pil_font.getlength(line) for line in lines), default=0)
+        block_height = line_height * len(lines)
+
+        left, top = self._anchor_origin(x, y, block_width, block_height, anchor)
+        for i, line in enumerate(lines):
+            self.draw.text((left, top + i * line_height), line, font=pil_font, fill=fill)
+
+    def _wrap(self, text, font, width):
+        """Wortweiser Umbruch analog zu Tk's width-Option"""
+        lines = []
+        for paragraph in str(text).split('\n'):
+            if not width or font.getlength(paragraph) <= width:
+                lines.append(paragraph)
+                continue
+
+            current = ''
+            for word in paragraph.split(' '):
+                candidate = f"{current} {word}" if current else word
+                if current and font.getlength(candidate) > width:
+                    lines.append(current)
+                    current = word
+                else:
+                    current = candidate
+            lines.append(current)
+        return lines
+
+    @staticmethod
+    def _anchor_origin(x, y, width, height, anchor):
+        """Rechnet Tk-Anchor in die linke obere Ecke um"""
+        anchor = anchor or 'center'
+        if 'w' in anchor:
+            left = x
+        elif 'e' in anchor:
+            left = x - width
+        else:
+            left = x - width / 2
+
+        if anchor.startswith('n'):
+            top = y
+        elif anchor.startswith('s'):
+            top = y - height
+        else:
+            top = y - height / 2
+        return left, top
+
+
+class SlideRasterizer:
+    """Rendert Slides mit dem EnhancedSlideRenderer in PIL-Bitmaps"""
+
+    @staticmethod
+    def build_slide_data(slide, slide_number=None):
+        """Slide-Daten für Demo-Darstellung aufbereiten"""
+        return {
+            'title': slide.title,
+            'content': slide.content,
+            'slide_number': slide_number or slide.slide_id,
+            'background_color': '#FFFFFF',
+            'text_color': '#1F1F1F',
+            'canvas_elements': slide.canvas_elements,
+            'assets': slide.assets
+        }
+
+    @staticmethod
+    def snapshot(slide, slide_number=None):
+        """Entkoppelte Kopie der Slide-Daten für den Worker (im Thread des Aufrufers erstellen)"""
+        data = slide.to_dict()
+        slide_data = SlideRasterizer.build_slide_data(slide, slide_number)
+        slide_data['canvas_elements'] = copy.deepcopy(data['canvas_elements'])
+        slide_data['assets'] = copy.deepcopy(data['assets'])
+        return slide_data
+
+    @staticmethod
+    def rasterize(slide_data, width, height, background='#FFFFFF'):
+        """Rendert Slide-Daten offscreen in ein PIL-Image"""
+        raster = RasterCanvas(width, height, background)
+        EnhancedSlideRenderer.render_slide_to_canvas(raster, slide_data, width, height)
+        return raster.image
+
+
+class SlideRasterCache:
+    """Cache fertiger Slide-Bitmaps mit Hintergrund-Prefetch der Nachbar-Slides.
+
+    Der Worker sieht nie die lebenden SlideData: der Aufrufer (Tk-Thread) legt beim
+    Einplanen einen Snapshot an. Jeder Job trägt (Generation, Slide-Version) - Loads und
+    Resizes erhöhen die Generation, Edits nur die Version der betroffenen Slide.
+    """
+
+    def __init__(self, max_slides=8):
+        self.max_slides = max_slides
+        self._bitmaps = OrderedDict()  # (slide_id, width, height) -> PIL-Image
+        self._size = None
+        self._generation = 0
+        self._versions = {}   # slide_id -> Version (nur durch Edits erhöht)
+        self._pending = {}    # (slide_id, width, height) -> Token des eingeplanten Jobs
+        self._lock = threading.Lock()
+        self._jobs = queue.Queue()
+        self._worker = None
+
+        # Edits aus dem Content-Manager invalidieren betroffene Bitmaps
+        content_manager.add_observer(self.on_content_changed)
+
+    def get(self, slide_id, size):
+        """Gibt eine fertige Bitmap zurück (oder None)"""
+        with self._lock:
+            self._set_size(size)
+            bitmap = self._bitmaps.get((slide_id,) + size)
+            if bitmap is not None:
+                self._bitmaps.move_to_end((slide_id,) + size)
+            return bitmap
+
+    def render_now(self, slide_id, size):
+        """Rendert synchron (Cache-Miss im Vordergrund)"""
+        slide = content_manager.get_slide(slide_id)
+        if slide is None:
+            return None
+        with self._lock:
+            self._set_size(size)
+            token = self._token(slide_id)
+        return self._render(slide_id, size, SlideRasterizer.snapshot(slide, slide_id), token)
+
+    def prefetch(self, slide_ids, size):
+        """Plant Hintergrund-Rendering für die angegebenen Slides (im Tk-Thread aufrufen)"""
+        with self._lock:
+            self._set_size(size)
+            for slide_id in slide_ids:
+                key = (slide_id,) + size
+                if key in self._bitmaps or key in self._pending:
+                    continue
+                slide = content_manager.get_slide(slide_id)
+                if slide is None:
+                    continue
+                token = self._token(slide_id)
+                self._pending[key] = token
+                self._jobs.put((slide_id, size, SlideRasterizer.snapshot(slide, slide_id), token))
+        self._ensure_worker()
+
+    def invalidate(self, slide_id=None):
+        """Verwirft Bitmaps einer Slide (oder alle)"""
+        with self._lock:
+            if slide_id is None:
+                self._generation += 1
+                self._bitmaps.clear()
+                self._pending.clear()
+                return
+            # Nur diese Slide: Prefetches der übrigen Slides bleiben gültig
+            self._versions[slide_id] = self._versions.get(slide_id, 0) + 1
+            for key in [k for k in self._bitmaps if k[0] == slide_id]:
+                del self._bitmaps[key]
+            for key in [k for k in self._pending if k[0] == slide_id]:
+                del self._pending[key]
+
+    def on_content_changed(self, slide_id, slide_data, action='update'):
+        """Observer: Edits invalidieren die Bitmap der Slide, Loads den ganzen Cache"""
+        self.invalidate(None if action == 'load' else slide_id)
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def _token(self, slide_id):
+        return (self._generation, self._versions.get(slide_id, 0))
+
+    def _set_size(self, size):
+        """Größenwechsel (Resize) verwirft alle Bitmaps anderer Größe"""
+        if size != self._size:
+            self._size = size
+            self._generation += 1
+            self._bitmaps.clear()
+            self._pending.clear()
+
+    def _render(self, slide_id, size, slide_data, token):
+        bitmap = SlideRasterizer.rasterize(slide_data, size[0], size[1])
+
+        with self._lock:
+            # Zwischenzeitliche Edits/Loads/Resizes machen das Ergebnis ungültig
+            if token == self._token(slide_id) and size == self._size:
+                self._bitmaps[(slide_id,) + size] = bitmap
+                while len(self._bitmaps) > self.max_slides:
+                    self._bitmaps.popitem(last=False)
+        return bitmap
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+            self._worker.start()
+
+    def _worker_loop(self):
+        """Hintergrund-Worker für Prefetch-Jobs"""
+        while True:
+            slide_id, size, slide_data, token = self._jobs.get()
+            key = (slide_id,) + size
+            try:
+                with self._lock:
+                    current = self._pending.get(key) == token
+                if current:
+                    self._render(slide_id, size, slide_data, token)
+                    logger.debug(f"Slide {slide_id} vorgerendert ({size[0]}x{size[1]})")
+            except Exception as e:
+                logger.error(f"Fehler beim Vorrendern von Slide {slide_id}: {e}")
+            finally:
+                with self._lock:
+                    if self._pending.get(key) == token:
+                        del self._pending[key]
+
+# Globale Raster-Cache Instanz
+slide_raster_cache = SlideRasterCache()
@@ -12,6 +12,115 @@ from PIL import Image, ImageTk
 import os
 from core.theme import theme_manager
 from core.logger import logger
+from ui.components.image_cache import image_cache
+
+class SceneRecorder:
+    """Canvas-прокси, который записывает create_*-вызовы как граф сцены"""
+    
+    def __init__(self):
+        self.items = []      # (key, kind, coords, options) в порядке отрисовки
+        self._counts = {}    # tag -> количество элементов
+        self._image_refs = []
+        self._asset_refs = []
+    
+    def delete(self, *tags):
+        """Сцена строится заново - удалять нечего"""
+        pass
+    
+    def _record(self, kind, coords, options):
+        # Идентичность элемента: tag + порядковый номер внутри tag
+        tag = options.get('tags', kind)
+        index = self._counts.get(tag, 0)
+        self._counts[tag] = index + 1
+        self.items.append(((tag, index), kind, tuple(coords), options))
+    
+    def create_rectangle(self, *coords, **options):
+        self._record('rectangle', coords, options)
+    
+    def create_line(self, *coords, **options):
+        self._record('line', coords, options)
+    
+    def create_text(self, *coords, **options):
+        self._record('text', coords, options)
+    
+    def create_image(self, *coords, **options):
+        self._record('image', coords, options)
+
+
+class RetainedScene:
+    """Применяет записанную сцену к Tk-Canvas: только coords/itemconfigure для изменений"""
+    
+    @staticmethod
+    def apply(canvas, recorder):
+        scene = getattr(canvas, '_retained_scene', None)
+        if not RetainedScene.is_valid(canvas, scene):
+            # Первый рендер или Canvas очищен извне - полная перестройка
+            canvas.delete("all")
+            scene = {}
+        
+        new_scene = {}
+        order = []
+        created = False
+        stats = {'created': 0, 'moved': 0, 'configured': 0, 'deleted': 0}
+        
+        for key, kind, coords, options in recorder.items:
+            old = scene.pop(key, None)
+            
+            # Набор опций изменился (например outline/dash/image убраны) - itemconfigure
+            # не сбрасывает удалённые опции, поэтому элемент пересоздаётся
+            if old and old[1] == kind and old[3].keys() == options.keys():
+                item_id, _, old_coords, old_options = old
+                if coords != old_coords:
+                    canvas.coords(item_id, *coords)
+                    stats['moved'] += 1
+                changed = {k: v for k, v in options.items() if old_options.get(k) != v}
+                if changed:
+                    canvas.itemconfigure(item_id, **changed)
+                    stats['configured'] += 1
+            else:
+                if old:
+                    canvas.delete(old[0])
+                    stats['deleted'] += 1
+                item_id = getattr(canvas, f'create_{kind}')(*coords, **options)
+                created = True
+                stats['created'] += 1
+            
+            new_scene[key] = (item_id, kind, coords, options)
+            order.append(item_id)
+        
+        # Элементы, которых больше нет в сцене
+        for item_id, _, _, _ in scene.values():
+            canvas.delete(item_id)
+            stats['deleted'] += 1
+        
+        # Новые элементы в правильный порядок наложения
+        if created and len(order) > 1:
+            for item_id in order:
+                canvas.tag_raise(item_id)
+        
+        canvas._retained_scene = new_scene
+        canvas._retained_order = order
+        canvas._image_refs = recorder._image_refs
+        canvas._asset_refs = recorder._asset_refs
+        canvas._retained_stats = stats
+        return stats
+    
+    @staticmethod
+    def is_valid(canvas, scene):
+        """Проверяет, что все элементы сцены ещё существуют на Canvas (один вызов find_all)"""
+        if not scene:
+            return False
+        order = getattr(canvas, '_retained_order', [])
+        if not order:
+            return False
+        return set(order) <= set(canvas.find_all())
+    
+    @staticmethod
+    def reset(canvas):
+        """Забывает сцену (например после canvas.delete("all"))"""
+        canvas._retained_scene = None
+        canvas._retained_order = []
+
 
 class EnhancedSlideRenderer:
     """Объединенная Enhanced Slide-Renderer-класса с улучшенным дизайном"""
@@ -21,10 +130,21 @@ class EnhancedSlideRenderer:
         """
         ГЛАВНАЯ функция рендеринга с объединенной функциональностью
         Поддерживает Canvas-элементы, изображения, Assets и улучшенный дизайн
+        Retained-mode: сцена записывается и применяется к Canvas как дифф
         """
-        # Canvas очистить
-        canvas.delete("all")
+        # Offscreen-растеризация рисует напрямую
+        if getattr(canvas, 'offscreen', False):
+            EnhancedSlideRenderer.render_slide_scene(canvas, slide_data, canvas_width, canvas_height)
+            return
         
+        # Сцену записать и только изменения применить к Canvas
+        recorder = SceneRecorder()
+        EnhancedSlideRenderer.render_slide_scene(recorder, slide_data, canvas_width, canvas_height)
+        RetainedScene.apply(canvas, recorder)
+    
+    @staticmethod
+    def render_slide_scene(canvas, slide_data, canvas_width, canvas_height):
+        """Рендерит все части слайда на canvas (Tk, SceneRecorder или RasterCanvas)"""
         # Улучшенное базовое рендеринг (PowerPoint-style + расширения)
         layout_info = EnhancedSlideRenderer.render_enhanced_base_slide(
             canvas, slide_data, canvas_width, canvas_height
@@ -401,36 +521,14 @@ class EnhancedSlideRenderer:
             scaled_width = width * layout_info['scale_factor']
             scaled_height = height * layout_info['scale_factor']
             
-            # Изображение загрузить
-            image = None
-            
-            # Попытка файл-path
-            if 'file_path' in element and os.path.exists(element['file_path']):
-                try:
-                    image = Image.open(element['file_path'])
-                    logger.debug(f"Изображение из файла загружено: {element['file_path']}")
-                except Exception as e:
-                    logger.debug(f"Ошибка при загрузке файла: {e}")
-            
-            # Попытка Base64-данные
-            if image is None and 'image_data' in element:
-                try:
-                    image_bytes = base64.b64decode(element['image_data'])
-                    image = Image.open(BytesIO(image_bytes))
-                    logger.debug("Изображение из Base64-данных загружено")
-                except Exception as e:
-                    logger.debug(f"Ошибка при загрузке Base64: {e}")
+            # Изображение из кэша (декодирование и LANCZOS только при промахе)
+            # Offscreen-растеризация работает с PIL-изображениями без Tk
+            if getattr(canvas, 'offscreen', False):
+                photo = image_cache.get_scaled(element, (scaled_width, scaled_height))
+            else:
+                photo = image_cache.get_photo(element, (scaled_width, scaled_height))
             
-            if image:
-                # Изображение масштабировать
-                image = image.resize(
-                    (max(1, int(scaled_width)), max(1, int(scaled_height))), 
-                    Image.Resampling.LANCZOS
-                )
-                
-                # PhotoImage создать
-                photo = ImageTk.PhotoImage(image)
-                
+            if photo:
                 # В Canvas отобразить
                 canvas.create_image(
                     scaled_x, scaled_y,
@@ -498,7 +596,10 @@ class EnhancedSlideRenderer:
                             size = int(50 * layout_info['scale_factor'])
                             preview_image.thumbnail((size, size), Image.Resampling.LANCZOS)
                             
-                            photo = ImageTk.PhotoImage(preview_image)
+                            if getattr(canvas, 'offscreen', False):
+                                photo = preview_image
+                            else:
+                                photo = ImageTk.PhotoImage(preview_image)
                             
                             canvas.create_image(
                                 asset_x, asset_start_y,
@@ -553,6 +654,7 @@ class EnhancedSlideRenderer:
                 canvas._image_refs.clear()
             if hasattr(canvas, '_asset_refs'):
                 canvas._asset_refs.clear()
+            RetainedScene.reset(canvas)
         except:
             pass
 
@@ -565,8 +667,8 @@ class SlideRenderer:
     def render_slide_to_canvas(canvas, slide_data, canvas_width, canvas_height):
         """Legacy-совместимая render методика"""
         # Расширенные данные из slide_data извлечь
-        if hasattr(slide_data, '__dict__'):
-            # SlideData-объект
+        if not isinstance(slide_data, dict):
+            # SlideData-объект (__slots__, без __dict__)
             extended_data = {
                 'title': slide_data.title,
                 'content': slide_data.content,
@@ -601,4 +703,4 @@ class SlideRenderer:
 
 
 # Export расширенных функций
-__all__ = ['SlideRenderer', 'EnhancedSlideRenderer']
+__all__ = ['SlideRenderer', 'EnhancedSlideRenderer', 'SceneRecorder', 'RetainedScene']
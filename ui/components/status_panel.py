@@ -4,6 +4,7 @@ Status Panel Component für Dynamic Messe Stand V4
 Hardware-Status und System-Informationen
 """
 
+import queue
 import tkinter as tk
 from tkinter import ttk
 from core.theme import theme_manager
@@ -14,11 +15,20 @@ from services.demo import demo_service
 class StatusPanelComponent(ttk.Frame):
     """Status-Panel für Hardware und System-Informationen"""
     
+    STATUS_POLL_MS = 100  # Abholintervall für Status-Änderungen aus den Hardware-Threads
+    
     def __init__(self, parent, main_window):
         super().__init__(parent, style='Card.TFrame')
         self.main_window = main_window
         
         self.setup_status_panel()
+        
+        # Hardware-Status wird gepusht statt gepollt - die Listener-Threads reihen nur ein
+        self.hw_status_changes = queue.Queue()
+        self.update_hardware_status()
+        hardware_manager.add_status_listener(self.on_hardware_status_changed)
+        self.status_poll_id = self.after(self.STATUS_POLL_MS, self.poll_hardware_status)
+        
         self.start_status_updates()
     
     def setup_status_panel(self):
@@ -73,6 +83,8 @@ class StatusPanelComponent(ttk.Frame):
         
         # Status-Labels für Hardware-Geräte
         self.hw_status_labels = {}
+        self.hw_status = {}  # device_id -> Verbindungsstatus
+        self.hw_rates = {}   # device_id -> Zeilen/s aus dem Telemetrie-Ringpuffer
         
         hardware_devices = [
             ('esp32_1', 'ESP32-1'),
@@ -216,31 +228,79 @@ class StatusPanelComponent(ttk.Frame):
         self.after(2000, self.start_status_updates)
     
     def update_status(self):
-        """Aktualisiert alle Status-Informationen"""
-        self.update_hardware_status()
+        """Aktualisiert Demo- und System-Informationen (Hardware-Status kommt per Listener)"""
+        self.update_hardware_rates()
         self.update_demo_status()
         self.update_system_info()
     
     def update_hardware_status(self):
-        """Aktualisiert Hardware-Status"""
+        """Aktualisiert den Hardware-Status aller Geräte (Initialzustand)"""
         try:
             status_summary = hardware_manager.get_status_summary()
             
-            for device_id, status_label in self.hw_status_labels.items():
-                status = status_summary.get(device_id, "disconnected")
-                
-                if status == "connected":
-                    status_text = "🟢 Online"
-                elif status == "error":
-                    status_text = "🟡 Fehler"
-                else:
-                    status_text = "🔴 Offline"
-                
-                status_label.configure(text=status_text)
+            for device_id in self.hw_status_labels:
+                self.set_hardware_status(device_id, status_summary.get(device_id, "disconnected"))
                 
         except Exception as e:
             logger.error(f"Fehler beim Hardware-Status Update: {e}")
     
+    def on_hardware_status_changed(self, device_id, status):
+        """Status-Listener (Connect-Pool-, Reader- oder Supervisor-Thread) - nur einreihen, kein Tk-Aufruf"""
+        self.hw_status_changes.put((device_id, status))
+    
+    def poll_hardware_status(self):
+        """Tk-Thread: eingereihte Status-Änderungen übernehmen (pro Gerät zählt der letzte)"""
+        latest = {}
+        try:
+            while True:
+                device_id, status = self.hw_status_changes.get_nowait()
+                latest[device_id] = status
+        except queue.Empty:
+            pass
+        
+        for device_id, status in latest.items():
+            self.set_hardware_status(device_id, status)
+        
+        self.status_poll_id = self.after(self.STATUS_POLL_MS, self.poll_hardware_status)
+    
+    def update_hardware_rates(self):
+        """Liest Nachrichtenraten aus den Telemetrie-Ringpuffern (Bereichsabfrage, kein Draining)"""
+        try:
+            summary = hardware_manager.get_telemetry_summary()
+            for device_id in self.hw_status_labels:
+                rate = summary.get(device_id, {}).get('rate', 0)
+                if rate != self.hw_rates.get(device_id, 0):
+                    self.hw_rates[device_id] = rate
+                    self.set_hardware_status(device_id, self.hw_status.get(device_id, "disconnected"))
+        except Exception as e:
+            logger.error(f"Fehler beim Telemetrie-Update: {e}")
+    
+    def set_hardware_status(self, device_id, status):
+        """Setzt den Status-Indikator eines Geräts"""
+        status_label = self.hw_status_labels.get(device_id)
+        if status_label is None:
+            return
+        
+        self.hw_status[device_id] = status
+        rate = self.hw_rates.get(device_id, 0)
+        
+        if status == "connected" and rate:
+            status_text = f"🟢 Online · {rate:.0f}/s"
+        elif status == "connected":
+            status_text = "🟢 Online"
+        elif status == "error":
+            status_text = "🟡 Fehler"
+        else:
+            status_text = "🔴 Offline"
+        
+        status_label.configure(text=status_text)
+    
+    def destroy(self):
+        """Listener abmelden, bevor das Panel zerstört wird"""
+        hardware_manager.remove_status_listener(self.on_hardware_status_changed)
+        self.after_cancel(self.status_poll_id)
+        super().destroy()
+    
     def update_demo_status(self):
         """Aktualisiert Demo-Status"""
         try:
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Thumbnail Cache für Dynamic Messe Stand V4
+Persistente Vorschaubilder auf Disk (Schlüssel: Pfad+mtime+Größe), erzeugt von einem Worker-Pool
+"""
+
+import os
+import queue
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from core.config import config
+from core.logger import logger
+from core.storage import storage_manager
+
+POLL_MS = 40
+PRUNE_EVERY = 64  # Nach so vielen neuen Thumbnails das Byte-Budget erneut durchsetzen
+
+class ThumbnailCache:
+    """Vorschaubilder für Asset-Browser, Creator-Canvas und Vorschau-Dialog.
+
+    get() liefert nur Vorhandenes (Speicher oder Disk), request() erzeugt fehlende
+    Thumbnails im Hintergrund und ruft den Callback danach im Tk-Thread auf.
+    Es werden PIL-Images geliefert - PhotoImages erzeugt der Aufrufer im Tk-Thread.
+    """
+
+    def __init__(self, directory=None, max_bytes=None, workers=None, memory_entries=256):
+        self.directory = directory or os.path.join(storage_manager.data_dir, "thumbnails")
+        self.max_bytes = max_bytes or config.cache['thumbnail_cache_mb'] * 1024 * 1024
+        self.workers = workers or config.cache['thumbnail_workers']
+        self.memory_entries = memory_entries
+        self.prune_every = PRUNE_EVERY
+        self._memory = OrderedDict()  # Schlüssel -> PIL-Image
+        self._pending = {}  # Schlüssel -> [Callbacks]
+        self._completed = queue.Queue()
+        self._executor = None
+        self._polling = False
+        self._pruning = False
+        self._generated_since_prune = None  # None: Start-Prune steht noch aus
+        self._lock = threading.Lock()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'generated': 0, 'failed': 0, 'pruned': 0}
+
+    def key(self, path, size, square=False):
+        """Cache-Schlüssel aus Pfad, mtime, Dateigröße und Zielgröße (None, falls die Datei fehlt)"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        raw = f"{os.path.abspath(path)}\0{stat.st_mtime_ns}\0{stat.st_size}\0{size[0]}x{size[1]}\0{int(square)}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def get(self, path, size, square=False):
+        """Vorhandenes Thumbnail aus Speicher oder Disk - erzeugt nichts"""
+        key = self.key(path, size, square)
+        return self._lookup(key) if key else None
+
+    def get_or_create(self, path, size, square=False):
+        """Thumbnail synchron (nur wo kein Platzhalter möglich ist)"""
+        key = self.key(path, size, square)
+        if key is None:
+            return None
+        return self._lookup(key) or self._generate(key, path, size, square)
+
+    def request(self, widget, path, size, callback, square=False):
+        """Liefert ein vorhandenes Thumbnail sofort, sonst None und später callback(image).
+
+        widget dient nur als Tk-Zeitgeber: fertige Thumbnails werden per after() im
+        Tk-Thread zugestellt. Fehlt die Datei oder ist sie nicht lesbar, kommt callback(None).
+        """
+        key = self.key(path, size, square)
+        if key is None:
+            callback(None)  # Datei fehlt - Platzhalter sofort ersetzen
+            return None
+
+        image = self._lookup(key)
+        if image is not None:
+            return image
+
+        with self._lock:
+            callbacks = self._pending.get(key)
+            if callbacks is not None:
+                callbacks.append(callback)  # Bereits in Arbeit
+            else:
+                self._pending[key] = [callback]
+                self._submit(key, path, size, square)
+
+        self._ensure_polling(widget)
+        return None
+
+    def run(self, widget, key, job, callback):
+        """Führt job() im Worker-Pool aus und ruft callback(ergebnis) im Tk-Thread auf.
+
+        Für andere Datei-Zugriffe der Vorschau (z.B. Bildgrößen lesen); gleiche keys
+        laufen nur einmal gleichzeitig.
+        """
+        key = ('job', key)
+        with self._lock:
+            callbacks = self._pending.get(key)
+            if callbacks is not None:
+                callbacks.append(callback)
+            else:
+                self._pending[key] = [callback]
+                self._pool().submit(self._run_job, key, job)
+
+        self._ensure_polling(widget)
+
+    def _ensure_polling(self, widget):
+        if not self._polling:
+            self._polling = True
+            widget.after(POLL_MS, self._poll, widget)
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def _pool(self):
+        """Worker-Pool (bei Bedarf erzeugt) - unter self._lock aufrufen"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="Thumbnail")
+        return self._executor
+
+    def _submit(self, key, path, size, square):
+        """Unter self._lock aufrufen"""
+        executor = self._pool()
+        if self._generated_since_prune is None:
+            self._start_prune()  # Einmal beim Start, danach alle prune_every neuen Thumbnails
+        executor.submit(self._work, key, path, size, square)
+
+    def _start_prune(self):
+        """Startet prune() im Worker-Pool, höchstens einer gleichzeitig (unter self._lock aufrufen)"""
+        if self._pruning or self._executor is None:
+            return
+        self._pruning = True
+        self._generated_since_prune = 0
+        try:
+            self._executor.submit(self._prune_job)
+        except RuntimeError:  # Pool bereits heruntergefahren
+            self._pruning = False
+
+    def _prune_job(self):
+        try:
+            self.prune()
+        finally:
+            with self._lock:
+                self._pruning = False
+
+    def _work(self, key, path, size, square):
+        """Worker: Thumbnail erzeugen und das Ergebnis für den Tk-Thread ablegen"""
+        image = self._generate(key, path, size, square)
+        with self._lock:
+            callbacks = self._pending.pop(key, [])
+        self._completed.put((callbacks, image))
+
+    def _run_job(self, key, job):
+        try:
+            result = job()
+        except Exception as e:
+            logger.debug(f"Hintergrund-Job {key[1]} fehlgeschlagen: {e}")
+            result = None
+        with self._lock:
+            callbacks = self._pending.pop(key, [])
+        self._completed.put((callbacks, result))
+
+    def _poll(self, widget):
+        """Tk-Thread: fertige Thumbnails an die Callbacks ausliefern"""
+        self.deliver()
+        try:
+            if self.pending() or not self._completed.empty():
+                widget.after(POLL_MS, self._poll, widget)
+                return
+        except Exception:
+            pass  # Widget zerstört - nächster request() startet neu
+        self._polling = False
+
+    def deliver(self):
+        """Stellt alle fertigen Thumbnails zu (im Tk-Thread aufrufen)"""
+        delivered = 0
+        while True:
+            try:
+                callbacks, image = self._completed.get_nowait()
+            except queue.Empty:
+                return delivered
+            for callback in callbacks:
+                try:
+                    callback(image)
+                except Exception as e:
+                    logger.debug(f"Thumbnail-Callback fehlgeschlagen: {e}")
+            delivered += 1
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".png")
+
+    def _lookup(self, key):
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return image
+
+        try:
+            image = Image.open(self._path(key))
+            image.load()
+        except (OSError, ValueError):
+            return None
+
+        with self._lock:
+            self.stats['disk_hits'] += 1
+        self._remember(key, image)
+        return image
+
+    def _remember(self, key, image):
+        with self._lock:
+            self._memory[key] = image
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _generate(self, key, path, size, square):
+        """Dekodiert das Original, verkleinert es und legt das Thumbnail atomar auf Disk ab"""
+        try:
+            image = Image.open(path)
+            image.draft('RGB', size)  # JPEG: direkt verkleinert dekodieren
+            image.thumbnail(size, Image.Resampling.LANCZOS)
+
+            if square:
+                # Zentriert auf transparentem Quadrat (wie die bisherige 64x64-Vorschau)
+                thumb = Image.new('RGBA', size, (255, 255, 255, 0))
+                thumb.paste(image, ((size[0] - image.size[0]) // 2, (size[1] - image.size[1]) // 2))
+                image = thumb
+            elif image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+                image = image.convert('RGBA')
+
+            target = self._path(key)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix='.tmp_')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    image.save(f, format='PNG')
+                os.replace(temp_path, target)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+        except Exception as e:
+            with self._lock:
+                self.stats['failed'] += 1
+            logger.debug(f"Thumbnail für {path} nicht erzeugt: {e}")
+            return None
+
+        with self._lock:
+            self.stats['generated'] += 1
+            if self._generated_since_prune is not None:
+                self._generated_since_prune += 1
+                if self._generated_since_prune >= self.prune_every:
+                    self._start_prune()  # Dauerbetrieb: Disk-Cache bleibt unter thumbnail_cache_mb
+        self._remember(key, image)
+        return image
+
+    def prune(self):
+        """Löscht die am längsten nicht geschriebenen Thumbnails über dem Byte-Budget"""
+        files = []
+        total = 0
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+                with self._lock:
+                    self.stats['pruned'] += 1
+            except OSError:
+                pass
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats, memory_entries=len(self._memory), pending=len(self._pending))
+
+# Globale Thumbnail-Cache Instanz
+thumbnail_cache = ThumbnailCache()
@@ -49,31 +49,53 @@ class MainWindow:
 
     def _setup_content_observer(self):
         """Розумне налаштування спостерігача контенту"""
+        self._content_revision = 0
         try:
             from models.content import content_manager
-            content_manager.add_observer(self._on_content_changed)
+            self._content_revision = content_manager.revision
+            
+            # Зміни збираються в Observer-Bus і доставляються раз за цикл Tk
+            content_manager.observer_bus.set_scheduler(self._schedule_content_delivery)
+            content_manager.subscribe(self._on_content_changed)
             logger.info("Content Observer успішно зареєстрований")
         except ImportError:
             logger.warning("Content Manager недоступний - синхронізація вимкнена")
         except Exception as e:
             logger.error(f"Помилка реєстрації Content Observer: {e}")
 
-    def _on_content_changed(self, slide_id, slide_data, action='update'):
-        """Оптимізований обробник змін контенту"""
+    def _schedule_content_delivery(self, delay_ms, callback):
+        """Планувальник Observer-Bus: наступний idle-цикл або вікно delay_ms"""
+        if delay_ms:
+            self.root.after(delay_ms, callback)
+        else:
+            self.root.after_idle(callback)
+
+    def _on_content_changed(self, changes):
+        """Отримує об'єднаний набір змін (один виклик на цикл)"""
+        self._sync_content_feed()
+
+    def _sync_content_feed(self):
+        """Застосовує лише зміни з change-feed з моменту останньої ревізії"""
         try:
-            logger.debug(f"Синхронізація змін slide {slide_id} ({action})")
+            from models.content import content_manager
+            revision, changes = content_manager.get_changes_since(self._content_revision)
+            if not changes:
+                return
+            self._content_revision = revision
+            logger.debug(f"Синхронізація {len(changes)} змін до ревізії {revision}")
             
-            # Оновити тільки необхідні таби
+            # Оновити тільки необхідні таби (Demo синхронізується через власний observer)
             for tab_name, tab_instance in self.tabs.items():
-                if tab_name == 'demo' and hasattr(tab_instance, 'sync_slide_change'):
-                    tab_instance.sync_slide_change(slide_id, slide_data)
-                elif tab_name == 'creator' and hasattr(tab_instance, 'refresh_thumbnails'):
-                    tab_instance.refresh_thumbnails()
+                if tab_name == 'creator' and hasattr(tab_instance, 'apply_content_changes'):
+                    tab_instance.apply_content_changes(changes)
                 elif tab_name == 'home' and hasattr(tab_instance, 'update_stats'):
                     tab_instance.update_stats()
             
             # Оновити статус у navbar
-            self._update_status_indicator(f"Slide {slide_id} оновлено")
+            if len(changes) == 1:
+                self._update_status_indicator(f"Slide {changes[0][0]} оновлено")
+            else:
+                self._update_status_indicator(f"{len(changes)} слайдів оновлено")
             
         except Exception as e:
             logger.error(f"Помилка синхронізації контенту: {e}")
@@ -554,6 +576,32 @@ class MainWindow:
         except Exception as e:
             logger.error(f"Помилка фінального збереження: {e}")
         
+        # Журнал контенту стиснути в snapshot і закрити, індекс асетів зберегти, зупинити генерацію мініатюр
+        try:
+            from models.content import content_manager
+            from ui.components.thumbnail_cache import thumbnail_cache
+            content_manager.close_journal()
+            content_manager.asset_manager.index.close()
+            thumbnail_cache.shutdown()
+        except Exception as e:
+            logger.error(f"Помилка закриття журналу контенту: {e}")
+        
+        # Бар'єр write-behind: усі відкладені записи StorageManager мають бути на диску
+        try:
+            from core.storage import storage_manager
+            if not storage_manager.flush(timeout=10):
+                logger.warning("⚠️ Не всі відкладені записи збережено")
+        except Exception as e:
+            logger.error(f"Помилка запису відкладених файлів: {e}")
+        
+        # Надіслати сигнали з черг і зупинити потоки dispatcher'а (до відключення Hardware)
+        try:
+            from services.signal_dispatcher import signal_dispatcher
+            if not signal_dispatcher.shutdown(timeout=2):
+                logger.warning("⚠️ Не всі сигнали надіслано")
+        except Exception as e:
+            logger.error(f"Помилка зупинки signal dispatcher: {e}")
+        
         # Відключення Hardware
         try:
             from models.hardware import hardware_manager
@@ -571,6 +619,7 @@ class MainWindow:
         # Закрити GUI
         self.root.quit()
         logger.info("👋 Dynamic Messe Stand V4 завершено")
+        logger.shutdown()  # Дописати чергу логів до виходу
         sys.exit(0)
     
     def run(self):
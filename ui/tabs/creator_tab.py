@@ -8,9 +8,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
 import json
-import base64
 from io import BytesIO
-from PIL import Image, ImageTk
+from PIL import ImageTk
 from datetime import datetime
 
 # WICHTIGE IMPORTS
@@ -20,6 +19,8 @@ from ui.components.slide_renderer import SlideRenderer
 
 # NEU: Verwende den erweiterten content_manager
 from models.content import content_manager
+from models.blob_store import blob_store
+from ui.components.thumbnail_cache import thumbnail_cache
 
 class CreatorTab:
     """REPARIERTE Creator-Tab mit funktionierender Speicherung"""
@@ -363,36 +364,39 @@ class CreatorTab:
             self.update_status("❌ Speichern fehlgeschlagen")
     
     def save_current_slide_content(self):
-    """VEREINFACHTE Speicherfunktion"""
-    try:
-        # Einfache Text-Extraktion
-        title_text = ""
-        content_text = ""
+        """VEREINFACHTE Speicherfunktion"""
+        try:
+            # Einfache Text-Extraktion
+            title_text = ""
+            content_text = ""
         
-        if self.edit_mode and hasattr(self, 'edit_widgets'):
+            if not (self.edit_mode and self.edit_widgets):
+                # Ohne Edit-Widgets gibt es nichts zu speichern - Slide nicht mit Leertext überschreiben
+                return True
+            
             if 'title' in self.edit_widgets:
                 title_text = self.edit_widgets['title'].get('1.0', 'end-1c')
             if 'content' in self.edit_widgets:  
                 content_text = self.edit_widgets['content'].get('1.0', 'end-1c')
         
-        if not title_text:
-            title_text = f"Folie {self.current_edit_slide}"
+            if not title_text:
+                title_text = f"Folie {self.current_edit_slide}"
             
-        # DIREKT zum content_manager speichern
-        success = content_manager.update_slide_content(
-            self.current_edit_slide, title_text, content_text, {}
-        )
+            # DIREKT zum content_manager speichern
+            success = content_manager.update_slide_content(
+                self.current_edit_slide, title_text, content_text, {}
+            )
         
-        if success:
-            logger.info(f"✅ Slide {self.current_edit_slide} gespeichert")
-            return True
-        else:
-            logger.error(f"❌ Speichern fehlgeschlagen")
-            return False
+            if success:
+                logger.info(f"✅ Slide {self.current_edit_slide} gespeichert")
+                return True
+            else:
+                logger.error(f"❌ Speichern fehlgeschlagen")
+                return False
             
-    except Exception as e:
-        logger.error(f"Speicherfehler: {e}")
-        return False
+        except Exception as e:
+            logger.error(f"Speicherfehler: {e}")
+            return False
     
     def extract_canvas_content(self):
         """REPARIERT: Extrahiert Inhalte aus Canvas-Widgets"""
@@ -461,23 +465,26 @@ class CreatorTab:
                 'height': widget.winfo_height()
             }
             
-            # Original-Pfad falls verfügbar
+            # Original-Pfad falls verfügbar - Datei blockweise in den Blob-Store übernehmen
             if hasattr(widget, 'image_path'):
                 image_data['file_path'] = widget.image_path
                 logger.debug(f"Bild-Pfad gefunden: {widget.image_path}")
+                try:
+                    image_data['image_hash'] = blob_store.put_file(widget.image_path)
+                except OSError as e:
+                    logger.debug(f"Bild-Datei nicht in Blob-Store übernommen: {e}")
             
-            # Bild als Base64 speichern (Fallback)
-            if hasattr(widget, 'image'):
+            # Sonst gerendertes Bild als PNG im Blob-Store ablegen (Fallback)
+            if 'image_hash' not in image_data and hasattr(widget, 'image'):
                 try:
                     # PhotoImage zu PIL Image konvertieren
                     pil_image = ImageTk.getimage(widget.image)
                     buffer = BytesIO()
                     pil_image.save(buffer, format='PNG')
-                    image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-                    image_data['image_data'] = image_base64
-                    logger.debug("Bild als Base64 gespeichert")
+                    image_data['image_hash'] = blob_store.put(buffer.getvalue())
+                    logger.debug("Bild im Blob-Store gespeichert")
                 except Exception as e:
-                    logger.warning(f"Bild-Base64-Konvertierung fehlgeschlagen: {e}")
+                    logger.warning(f"Bild-Speicherung im Blob-Store fehlgeschlagen: {e}")
             
             return image_data
             
@@ -565,19 +572,21 @@ Edit-Modus: {self.edit_mode}
     def display_asset_on_canvas(self, asset_info):
         """Zeigt Asset im Canvas an"""
         try:
-            # Bild laden
+            # Bild aus dem Thumbnail-Cache (bis zur Fertigstellung ein Platzhalter)
             if asset_info['extension'].lower() in ['.png', '.jpg', '.jpeg', '.gif', '.bmp']:
-                image = Image.open(asset_info['path'])
-                image.thumbnail((300, 200), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(image)
-                
-                # Label erstellen
                 label = tk.Label(
-                    self.slide_canvas, image=photo, bg='white', relief='solid', bd=1
+                    self.slide_canvas, text="⏳", font=('Arial', 32),
+                    bg='white', relief='solid', bd=1
                 )
-                label.image = photo
                 label.image_path = asset_info['path']
                 
+                thumbnail = thumbnail_cache.request(
+                    self.slide_canvas, asset_info['path'], (300, 200),
+                    lambda image, target=label: self.show_canvas_image(target, image)
+                )
+                if thumbnail is not None:
+                    self.show_canvas_image(label, thumbnail)
+                
                 # Im Canvas platzieren
                 canvas_item = self.slide_canvas.create_window(
                     150, 200, window=label, anchor='nw'
@@ -594,6 +603,15 @@ Edit-Modus: {self.edit_mode}
         except Exception as e:
             logger.error(f"Fehler beim Anzeigen von Asset: {e}")
     
+    def show_canvas_image(self, label, thumbnail):
+        """Setzt das fertige Thumbnail in das Canvas-Label ein"""
+        if thumbnail is None:
+            label.configure(text="❌")
+            return
+        photo = ImageTk.PhotoImage(thumbnail)
+        label.configure(image=photo, text='')
+        label.image = photo
+    
     def add_local_image(self):
         """Lädt lokales Bild hoch"""
         try:
@@ -671,6 +689,25 @@ Edit-Modus: {self.edit_mode}
         except Exception as e:
             logger.error(f"Fehler beim Rendern der Slide-Vorschau: {e}")
     
+    def apply_content_changes(self, changes):
+        """Übernimmt Änderungen aus dem Change-Feed (aufgerufen vom MainWindow)"""
+        for slide_id, action, slide in changes:
+            if slide_id != self.current_edit_slide:
+                continue
+            
+            if action == 'delete':
+                # Bearbeitete Slide wurde gelöscht - auf eine vorhandene wechseln
+                remaining = sorted(content_manager.get_all_slides())
+                self.current_slide = None
+                if remaining and self.visible:
+                    self.load_slide_to_editor(remaining[0])
+            elif not self.edit_mode and self.visible:
+                # Eigene ungespeicherte Eingaben nicht überschreiben (nur diese eine Slide laden)
+                self.current_slide = slide or content_manager.get_slide(slide_id)
+                self.render_slide_preview()
+        
+        self.update_slide_info()
+    
     def update_slide_info(self):
         """Aktualisiert Slide-Information"""
         if hasattr(self, 'slide_info_label') and self.current_slide:
@@ -6,17 +6,22 @@ Kritische Änderungen für Live-Updates ohne Neustart
 
 import tkinter as tk
 from tkinter import ttk
+import queue
 import threading
 import time
+from PIL import ImageTk
 from core.theme import theme_manager
 from core.logger import logger
 from ui.components.slide_renderer import SlideRenderer
+from ui.components.slide_rasterizer import SlideRasterizer, slide_raster_cache
 from models.content import content_manager
 from services.demo import demo_service
 
 class DemoTab:
     """REPARIERTE Demo-Tab mit SOFORTIGER Synchronisation"""
     
+    DEMO_POLL_MS = 50  # Abholintervall für Slide-Wechsel aus dem Demo-Thread
+    
     def __init__(self, parent, main_window):
         self.parent = parent
         self.main_window = main_window
@@ -28,79 +33,67 @@ class DemoTab:
         self.auto_play_thread = None
         self.slide_buttons = {}
         self.last_update_time = 0
-        self.last_content_hash = {}  # Für Change-Detection
+        self.synced_revision = 0  # Zuletzt übernommene Revision des Change-Feeds
         
         # KRITISCH: Demo-Service Integration
         self.demo_running = False
-        self.sync_timer_id = None
         
         self.create_demo_content()
         
-        # WICHTIG: Content-Observer SOFORT registrieren
-        content_manager.add_observer(self.on_content_changed)
+        # Content-Änderungen kommen zusammengefasst über den Observer-Bus
+        self.unsubscribe_content = content_manager.subscribe(self.on_content_changed)
+        
+        # Slide-Wechsel des Demo-Service (läuft im Demo-Thread) über eine Queue in den Tk-Thread holen
+        self.slide_photo = None
+        self.exact_render_pending = None
+        self.demo_slide_changes = queue.Queue()
+        self.demo_poll_id = None
+        demo_service.add_callback(self.on_demo_slide_changed)
         
-        # KRITISCH: Sync-Timer für Live-Updates starten
-        self.start_sync_timer()
+        # Die Slides-Liste zeigt bereits den aktuellen Stand - ab hier nur noch Änderungen aus dem Feed
+        self.synced_revision = content_manager.revision
         
         logger.info("Demo Tab with IMMEDIATE synchronization initialized")
+    
+    def on_content_changed(self, changes):
+        """Observer-Bus: ein zusammengefasster Änderungssatz pro Tk-Zyklus"""
+        logger.debug(f"🔄 Demo: {len(changes)} Content-Änderungen")
         
-    def start_sync_timer(self):
-        """Startet Timer für kontinuierliche Synchronisation"""
-        self.sync_content()
-        self.sync_timer_id = self.main_window.root.after(2000, self.start_sync_timer)
+        # Versteckt wird nichts getan - show() holt alle Änderungen nach
+        if self.visible:
+            self.sync_content()
     
-    def on_content_changed(self, slide_id, slide_data, action='update'):
-        """REPARIERT: Sofortige Content-Änderungs-Behandlung"""
+    def sync_content(self):
+        """Übernimmt alle Änderungen seit der letzten Revision aus dem Change-Feed"""
         try:
-            logger.info(f"🔄 Demo: Content-Änderung erkannt für Slide {slide_id} (Aktion: {action})")
-            
-            current_time = time.time()
-            if current_time - self.last_update_time < 0.5:  # Throttling reduziert
+            revision, changes = content_manager.get_changes_since(self.synced_revision)
+            if not changes:
                 return
             
-            if action in ['update', 'load', 'asset_added']:
-                # SOFORT: Slides-Liste aktualisieren
-                self.update_slide_button(slide_id, slide_data)
+            self.synced_revision = revision
+            rerender = added = deleted = False
+            
+            for slide_id, action, slide in changes:
+                if action == 'delete':
+                    deleted = True
+                elif slide_id not in self.slide_buttons:
+                    added = True
+                else:
+                    self.update_slide_button(slide_id, slide)
                 
-                # SOFORT: Aktuellen Slide neu rendern falls betroffen
                 if slide_id == self.current_slide:
-                    logger.info(f"🔄 Demo: Rendering aktuellen Slide {slide_id} neu")
-                    self.main_window.root.after(100, self.render_current_slide)
-                
-                self.last_update_time = current_time
-                
-            elif action == 'delete':
-                self.handle_slide_deletion(slide_id)
-                
-            # UI-Status aktualisieren
-            self.update_slide_info()
+                    rerender = True
             
-        except Exception as e:
-            logger.error(f"Fehler bei Content-Änderung in Demo: {e}")
-    
-    def sync_content(self):
-        """Synchronisiert Content ohne Observer (Fallback)"""
-        try:
-            # Alle Slides prüfen auf Änderungen
-            all_slides = content_manager.get_all_slides()
-            
-            for slide_id, slide in all_slides.items():
-                # Hash für Change-Detection
-                content_hash = hash(f"{slide.title}_{slide.content}_{len(slide.canvas_elements)}")
-                
-                if slide_id not in self.last_content_hash or self.last_content_hash[slide_id] != content_hash:
-                    # Slide hat sich geändert
-                    self.last_content_hash[slide_id] = content_hash
-                    
-                    # Button aktualisieren
-                    self.update_slide_button(slide_id, slide)
-                    
-                    # Aktuellen Slide neu rendern falls betroffen
-                    if slide_id == self.current_slide:
-                        self.main_window.root.after(50, self.render_current_slide)
+            if deleted:
+                self.handle_slide_deletion()
+            else:
+                if added:
+                    self.create_slides_list()
+                if rerender:
+                    logger.info(f"🔄 Demo: Rendering aktuellen Slide {self.current_slide} neu")
+                    self.render_current_slide()
             
-            # Slide-Anzahl aktualisieren
-            self.total_slides = len(all_slides)
+            self.total_slides = content_manager.get_slide_count()
             self.update_slide_info()
             
         except Exception as e:
@@ -111,7 +104,11 @@ class DemoTab:
         try:
             if slide_id in self.slide_buttons:
                 button = self.slide_buttons[slide_id]
-                title = slide_data.title if hasattr(slide_data, 'title') else f"Slide {slide_id}"
+                if hasattr(slide_data, 'title'):
+                    title = slide_data.title
+                else:
+                    # Nicht geladene Slide (Container) - Titel aus dem Index
+                    title = content_manager.get_slide_title(slide_id) or f"Slide {slide_id}"
                 display_title = title[:18] + "..." if len(title) > 18 else title
                 
                 # Button-Text aktualisieren
@@ -122,13 +119,16 @@ class DemoTab:
         except Exception as e:
             logger.error(f"Fehler beim Aktualisieren von Slide-Button {slide_id}: {e}")
     
-    def handle_slide_deletion(self, slide_id):
+    def handle_slide_deletion(self):
         """Behandelt Slide-Löschung"""
-        if slide_id == self.current_slide and self.current_slide > 1:
-            self.current_slide -= 1
-            self.load_current_slide()
+        if content_manager.get_slide(self.current_slide) is None:
+            remaining = sorted(content_manager.get_all_slides())
+            earlier = [slide_id for slide_id in remaining if slide_id < self.current_slide]
+            if earlier or remaining:
+                self.current_slide = earlier[-1] if earlier else remaining[0]
         
         self.create_slides_list()  # Vollständige Neuerststellung
+        self.load_current_slide()
     
     def create_demo_content(self):
         """Erstellt Demo-Interface"""
@@ -271,8 +271,8 @@ class DemoTab:
         self.slide_buttons.clear()
         
         try:
-            # DIREKTE Daten von content_manager holen
-            slides = content_manager.get_all_slides()
+            # Nur Titel holen - lazy Slides werden dafür nicht geladen
+            slides = content_manager.get_slide_titles()
             
             if not slides:
                 tk.Label(self.slides_frame, text="Keine Slides gefunden",
@@ -280,7 +280,7 @@ class DemoTab:
                 return
             
             # Neue Buttons erstellen
-            for slide_id, slide in sorted(slides.items()):
+            for slide_id, title in sorted(slides.items()):
                 slide_container = tk.Frame(self.slides_frame, bg=colors['background_secondary'])
                 slide_container.pack(fill='x', pady=2)
                 
@@ -288,7 +288,7 @@ class DemoTab:
                 is_active = slide_id == self.current_slide
                 bg_color = colors['accent_primary'] if is_active else colors['background_tertiary']
                 
-                title = slide.title if hasattr(slide, 'title') else f"Slide {slide_id}"
+                title = title or f"Slide {slide_id}"
                 display_title = title[:18] + "..." if len(title) > 18 else title
                 
                 slide_btn = tk.Button(
@@ -404,18 +404,23 @@ class DemoTab:
             canvas_height = self.slide_canvas.winfo_height()
             
             if canvas_width > 10 and canvas_height > 10:
-                # Slide-Daten vorbereiten
-                slide_data = {
-                    'title': slide.title,
-                    'content': slide.content,
-                    'slide_number': self.current_slide,
-                    'background_color': '#FFFFFF',
-                    'text_color': '#1F1F1F'
-                }
+                size = (canvas_width, canvas_height)
                 
-                # SOFORT rendern
-                SlideRenderer.render_slide_to_canvas(
-                    self.slide_canvas, slide_data, canvas_width, canvas_height
+                # Vorgerenderte Bitmap nur als Übergangsbild - die eigentliche Anzeige
+                # rendert immer SlideRenderer (Theme-Schriften und -Umbruch)
+                bitmap = slide_raster_cache.get(self.current_slide, size)
+                if bitmap is not None:
+                    self.slide_photo = ImageTk.PhotoImage(bitmap)
+                    self.slide_canvas.delete('transition')
+                    self.slide_canvas.create_image(0, 0, image=self.slide_photo, anchor='nw', tags='transition')
+                    if self.exact_render_pending is None:
+                        self.exact_render_pending = self.slide_canvas.after_idle(self.render_exact_slide)
+                else:
+                    self.render_exact_slide()
+                
+                # Nachbar-Slides im Hintergrund vorrendern
+                slide_raster_cache.prefetch(
+                    [self.current_slide + 1, self.current_slide - 1], size
                 )
                 
                 logger.debug(f"✅ Slide {self.current_slide} gerendert")
@@ -429,6 +434,27 @@ class DemoTab:
             if hasattr(self, 'sync_status'):
                 self.sync_status.configure(text="❌ Renderfehler", fg=theme_manager.get_colors()['accent_warning'])
     
+    def render_exact_slide(self):
+        """Rendert den aktuellen Slide mit SlideRenderer und entfernt das Übergangsbild"""
+        self.exact_render_pending = None
+        try:
+            slide = content_manager.get_slide(self.current_slide)
+            
+            # Übergangsbild zuerst entfernen - die Retained-Szene kennt es nicht
+            self.slide_canvas.delete('transition')
+            self.slide_photo = None
+            
+            if not slide:
+                return
+            
+            SlideRenderer.render_slide_to_canvas(
+                self.slide_canvas,
+                SlideRasterizer.build_slide_data(slide, self.current_slide),
+                self.slide_canvas.winfo_width(), self.slide_canvas.winfo_height()
+            )
+        except Exception as e:
+            logger.error(f"Fehler beim Rendern von Slide {self.current_slide}: {e}")
+    
     def force_refresh(self):
         """KRITISCH: Erzwingt komplette Aktualisierung"""
         try:
@@ -522,6 +548,32 @@ class DemoTab:
             self.timer_label.configure(text="Demo bereit - Live-Sync aktiv")
             logger.info("Demo gestoppt")
     
+    def on_demo_slide_changed(self, slide_id):
+        """Callback des Demo-Service (Demo-Thread) - nur einreihen, kein Tk-Aufruf"""
+        self.demo_slide_changes.put(slide_id)
+    
+    def poll_demo_changes(self):
+        """Tk-Thread: eingereihte Slide-Wechsel übernehmen (nur der letzte zählt)"""
+        slide_id = None
+        try:
+            while True:
+                slide_id = self.demo_slide_changes.get_nowait()
+        except queue.Empty:
+            pass
+        
+        if slide_id is not None:
+            self.goto_slide(slide_id)
+        
+        self.demo_poll_id = self.main_window.root.after(self.DEMO_POLL_MS, self.poll_demo_changes)
+    
+    def drain_demo_changes(self):
+        """Verwirft eingereihte Slide-Wechsel (Tab versteckt)"""
+        try:
+            while True:
+                self.demo_slide_changes.get_nowait()
+        except queue.Empty:
+            pass
+    
     def on_canvas_resize(self, event):
         """Canvas Resize Handler"""
         self.main_window.root.after(100, self.render_current_slide)
@@ -531,7 +583,13 @@ class DemoTab:
         if not self.visible:
             self.container.pack(fill='both', expand=True)
             self.visible = True
+            self.sync_content()  # Änderungen aus der versteckten Zeit nachholen
             self.load_current_slide()
+            
+            # Slide-Wechsel des Demo-Service nur abholen, solange der Tab sichtbar ist
+            self.drain_demo_changes()
+            if self.demo_poll_id is None:
+                self.demo_poll_id = self.main_window.root.after(self.DEMO_POLL_MS, self.poll_demo_changes)
             logger.info("Demo Tab angezeigt")
     
     def hide(self):
@@ -540,17 +598,19 @@ class DemoTab:
             if self.demo_running:
                 self.toggle_demo()  # Demo stoppen
             
-            if self.sync_timer_id:
-                self.main_window.root.after_cancel(self.sync_timer_id)
-            
             self.container.pack_forget()
             self.visible = False
+            
+            if self.demo_poll_id is not None:
+                self.main_window.root.after_cancel(self.demo_poll_id)
+                self.demo_poll_id = None
+            self.drain_demo_changes()
             logger.info("Demo Tab versteckt")
     
     def __del__(self):
         """Cleanup bei Zerstörung"""
         try:
-            if hasattr(self, 'sync_timer_id') and self.sync_timer_id:
-                self.main_window.root.after_cancel(self.sync_timer_id)
+            if hasattr(self, 'unsubscribe_content'):
+                self.unsubscribe_content()
         except:
             pass
@@ -9,7 +9,7 @@ from tkinter import ttk
 from core.theme import theme_manager
 from core.logger import logger
 from models.content import content_manager
-from models.hardware import hardware_manager
+from services.signal_dispatcher import signal_dispatcher
 
 class PresentationTab:
     """Presentation-Tab für manuelle Steuerung"""
@@ -114,12 +114,12 @@ class PresentationTab:
         colors = theme_manager.get_colors()
         fonts = self.main_window.fonts
         
-        slides = content_manager.get_all_slides()
+        slides = content_manager.get_slide_titles()
         
         # Grid-Layout: 4 Spalten
         cols = 4
         
-        for i, (slide_id, slide) in enumerate(slides.items()):
+        for i, (slide_id, title) in enumerate(slides.items()):
             row = i // cols
             col = i % cols
             
@@ -130,7 +130,7 @@ class PresentationTab:
             # Slide-Button
             slide_btn = tk.Button(
                 btn_frame,
-                text=f"Slide {slide_id}\n{slide.title[:20]}...",
+                text=f"Slide {slide_id}\n{title[:20]}...",
                 font=fonts['caption'],
                 bg=colors['background_secondary'],
                 fg=colors['text_primary'],
@@ -286,18 +286,8 @@ class PresentationTab:
         try:
             signal_id = f"page_{self.current_slide}"
             
-            # Signal an alle ESP32s senden
-            sent_count = 0
-            for name, connection in hardware_manager.connections.items():
-                if name.startswith('esp32_') and connection.status == "connected":
-                    if connection.send_signal(signal_id):
-                        sent_count += 1
-            
-            # UDP-Signal über GIGA senden
-            giga = hardware_manager.get_connection('giga')
-            if giga and giga.status == "connected":
-                giga.send_udp_signal("192.168.1.100", signal_id, 1)
-                sent_count += 1
+            # An alle verbundenen ESP32s und den GIGA einreihen (blockiert den Tk-Thread nicht)
+            sent_count = signal_dispatcher.send_slide_signal(self.current_slide)
             
             if sent_count > 0:
                 self.hw_status_label.configure(text=f"Signal gesendet: {signal_id}")